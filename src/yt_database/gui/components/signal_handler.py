@@ -73,6 +73,9 @@ class SignalHandler(QObject):
 
         # Database
         self.main_window.database_widget.chapter_generation_requested.connect(self._start_chapter_generation_worker)
+        self.main_window.database_widget.batch_chapter_generation_requested.connect(
+            self._start_batch_chapter_generation_from_database
+        )
         self.main_window.database_widget.file_open_requested.connect(self._on_database_file_open_requested)
         self.main_window.database_widget.text_editor_open_requested.connect(self._show_transcript_in_text_editor)
         self.main_window.database_widget.single_transcription_requested.connect(self._start_single_transcription_worker)
@@ -82,6 +85,10 @@ class SignalHandler(QObject):
 
         # Search
         self.main_window.search_widget.search_requested.connect(self._perform_search)
+        # Zwischengespeicherte Suchergebnisse nach Löschungen und gespeicherten Transkripten verwerfen
+        invalidate_search_cache = self.main_window.search_widget.tree_widget.invalidate_cache
+        self.main_window.database_widget.data_changed.connect(invalidate_search_cache)
+        self.main_window.text_file_editor_widget.fileSaved.connect(invalidate_search_cache)
 
         # Verbinde Suggestion Provider
         self._setup_suggestion_provider()
@@ -111,7 +118,10 @@ class SignalHandler(QObject):
                 provider_func = lambda query: [s.term for s in suggestion_provider.get_suggestions(query, limit=8)]
 
                 # Setze den Provider im TreeWidget
-                self.main_window.search_widget.tree_widget.set_completer_provider(provider_func)
+                tree_widget = self.main_window.search_widget.tree_widget
+                tree_widget.set_completer_provider(provider_func)
+                # Häufige Begriffe einmal in den Präfix-Trie laden; der Provider dient nur noch als Fallback
+                tree_widget.set_completer_corpus([s.term for s in suggestion_provider.get_popular_terms(limit=5000)])
                 logger.info("SearchSuggestionProvider erfolgreich mit SearchWidgetTree verbunden")
             else:
                 logger.warning("SearchSuggestionProvider ist nicht verfügbar")
@@ -369,6 +379,43 @@ class SignalHandler(QObject):
             logger.warning(f"Invalid path/transcript ID: transcript_path={transcript_path}, video_id={video_id}")
             return
 
+        prompt_text, prompt_type_value = self._resolve_chapter_prompt(analysis_prompt_service)
+        self._launch_chapter_generation_worker(
+            video_id, transcript_path, pm_service, file_service, analysis_prompt_service, prompt_text, prompt_type_value
+        )
+
+    def _start_batch_chapter_generation_from_database(self, video_ids: list[str]) -> None:
+        """Startet die Kapitelgenerierung für mehrere Videos aus dem Database Widget.
+
+        Services und Prompt werden einmalig für den ganzen Batch ermittelt statt pro Video.
+        """
+        logger.info(f"Batch-Kapitelgenerierung für {len(video_ids)} Videos aus Database Widget angefordert.")
+        if not video_ids:
+            logger.warning("Keine Video-IDs für Batch-Kapitelgenerierung erhalten.")
+            return
+
+        pm_service = self.service_factory.get_project_manager_service()
+        file_service = self.service_factory.get_file_service()
+        analysis_prompt_service = self.service_factory.get_analysis_prompt_service()
+        prompt_text, prompt_type_value = self._resolve_chapter_prompt(analysis_prompt_service)
+
+        for video_id in video_ids:
+            transcript_path = pm_service.get_transcript_path_for_video_id(video_id)
+            if not transcript_path or not os.path.exists(transcript_path):
+                logger.warning(f"Keine Transkriptdatei für {video_id} gefunden, überspringe Kapitelgenerierung.")
+                continue
+            self._launch_chapter_generation_worker(
+                video_id,
+                transcript_path,
+                pm_service,
+                file_service,
+                analysis_prompt_service,
+                prompt_text,
+                prompt_type_value,
+            )
+
+    def _resolve_chapter_prompt(self, analysis_prompt_service) -> tuple[str, str]:
+        """Ermittelt Prompt-Text und Prompt-Typ aus der VideoSelectionTable, mit Fallback auf den Standard-Prompt."""
         # Dynamische Prompt-Auswahl: Hole aktuellen Prompt-Typ aus VideoSelectionTable
         try:
             current_prompt_type = (
@@ -386,6 +433,19 @@ class SignalHandler(QObject):
             prompt_text = analysis_prompt_service.get_prompt(current_prompt_type)
             prompt_type_value = current_prompt_type.value
 
+        return prompt_text, prompt_type_value
+
+    def _launch_chapter_generation_worker(
+        self,
+        video_id: str,
+        transcript_path: str,
+        pm_service,
+        file_service,
+        analysis_prompt_service,
+        prompt_text: str,
+        prompt_type_value: str,
+    ) -> None:
+        """Startet einen ChapterGenerationWorker und verbindet ihn mit dem Web-Fenster."""
         logger.info(f"Starting chapter generation for transcript: {video_id} with prompt type: {prompt_type_value}")
         self.main_window.dashboard_widget.set_progress("Generating chapters...", -1)
 
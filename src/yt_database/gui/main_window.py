@@ -133,6 +133,8 @@ class MainWindow(QMainWindow):
         logger.info("UI-Update angefordert. Führe notwendige Aktualisierungen durch.")
         self.database_widget.refresh_data()
         self.dashboard_widget._refresh_stats()
+        # Neue oder geänderte Kapitel machen zwischengespeicherte Suchergebnisse ungültig
+        self.search_widget.tree_widget.invalidate_cache()
 
     @Slot()
     def show_notebook_lm_window(self) -> None:
@@ -2,29 +2,166 @@
 # DatabaseOverviewWidget: Übersicht und Filter für Kanäle und Transcripts aus der Datenbank.
 # Zeigt alle Kanäle und Transcripts tabellarisch, unterstützt Filterung und Refresh.
 
-import os
+from dataclasses import dataclass
+from urllib.parse import urlparse
 
 from loguru import logger
-from PySide6.QtCore import QEvent, QSortFilterProxyModel, Qt, QUrl, Signal, Slot
-from PySide6.QtGui import QColor, QDesktopServices, QStandardItem, QStandardItemModel
+from PySide6.QtCore import (
+    QEvent,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    QUrl,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QColor, QDesktopServices, QFont, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
-    QApplication,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QMenu,
     QMessageBox,
     QProgressBar,
     QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from yt_database.database import Transcript
+from yt_database.database import Channel, Transcript, db
 from yt_database.gui.utils.icons import Icons
 from yt_database.gui.widgets.delete_confirmation_dialog import DeleteConfirmationDialog
 
+# Item-Rollen für die an der Video-ID-Spalte abgelegten Kanal-Daten
+CHANNEL_ID_ROLE = Qt.ItemDataRole.UserRole
+CHANNEL_NAME_ROLE = Qt.ItemDataRole.UserRole + 1
+# Vorab kleingeschriebener Suchschlüssel (Titel, Video-ID, Handle, Fehlergrund) an Spalte 0
+SEARCH_KEY_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
+@dataclass(frozen=True, slots=True)
+class SelectionRow:
+    """Für Batch-Aktionen benötigte Daten einer selektierten Tabellenzeile.
+
+    Attributes:
+        video_id (str): Video-ID (Spalte 1).
+        has_transcript (bool): Ob das Video transkribiert ist (Spalte 7).
+        url (str): Video-URL (Spalte 10).
+    """
+
+    video_id: str
+    has_transcript: bool
+    url: str
+
+
+def _select_transcript_rows():
+    """Liefert die Transcript-Abfrage für die Übersicht.
+
+    Es werden nur die in der Tabelle dargestellten Spalten sowie die benötigten Kanal-Spalten
+    projiziert, damit alles in einer SQL-Abfrage geladen wird und keine ungenutzten Felder
+    aus SQLite nach Python übertragen werden.
+    """
+    return (
+        Transcript.select(
+            Transcript.video_id,
+            Transcript.title,
+            Transcript.duration,
+            Transcript.chapter_count,
+            Transcript.detailed_chapter_count,
+            Transcript.transcript_lines,
+            Transcript.is_transcribed,
+            Transcript.has_chapters,
+            Transcript.publish_date,
+            Transcript.video_url,
+            Transcript.error_reason,
+            Channel.channel_id,
+            Channel.name,
+            Channel.handle,
+        )
+        .join(Channel)
+        .dicts()
+    )
+
+
+def _format_duration(seconds: int | None) -> str:
+    """Formatiert eine Dauer in Sekunden als ``HH:MM:SS``."""
+    hours, remainder = divmod(seconds or 0, 3600)
+    minutes, secs = divmod(remainder, 60)
+    return f"{hours:02}:{minutes:02}:{secs:02}"
+
+
+class _TranscriptFetchSignals(QObject):
+    """Signale des Hintergrund-Ladevorgangs (QRunnable ist kein QObject)."""
+
+    finished = Signal(int, list)  # Ladevorgang, Liste von Transcript-Dicts inkl. Kanal-Spalten
+    error = Signal(int, str)  # Ladevorgang, Fehlermeldung
+    progress = Signal(int, int, int)  # Ladevorgang, geladen, gesamt
+
+
+class _TranscriptFetchTask(QRunnable):
+    """Lädt alle Transcripts mitsamt Kanal-Daten als einfache Dicts im Thread-Pool."""
+
+    def __init__(self, generation: int):
+        super().__init__()
+        self.signals = _TranscriptFetchSignals()
+        self._generation = generation
+
+    PROGRESS_BATCH_SIZE = 500
+
+    def run(self):
+        try:
+            with db.connection_context():
+                query = _select_transcript_rows()
+                total = query.count()
+                rows = []
+                for row in query.iterator():
+                    # Reine String-Arbeit schon im Worker-Thread erledigen, nicht im Zeilenaufbau der GUI
+                    row["duration_str"] = _format_duration(row["duration"])
+                    rows.append(row)
+                    if len(rows) % self.PROGRESS_BATCH_SIZE == 0:
+                        self.signals.progress.emit(self._generation, len(rows), total)
+                self.signals.progress.emit(self._generation, len(rows), total)
+        except Exception as e:
+            self.signals.error.emit(self._generation, str(e))
+            return
+        self.signals.finished.emit(self._generation, rows)
+
+
+class _BatchDeleteSignals(QObject):
+    """Signale der Batch-Löschung im Thread-Pool."""
+
+    finished = Signal(dict)  # Ergebnis von ProjectManagerService.delete_videos_safe
+    error = Signal(str)
+    progress = Signal(int, int)  # verarbeitet, gesamt
+
+
+class _BatchDeleteTask(QRunnable):
+    """Löscht mehrere Videos über den ProjectManagerService im Thread-Pool.
+
+    Es werden ausschließlich Service-Aufrufe ausgeführt; die GUI wird nur über die Signale aktualisiert.
+    """
+
+    def __init__(self, pm_service, video_ids: list[str]):
+        super().__init__()
+        self.signals = _BatchDeleteSignals()
+        self._pm_service = pm_service
+        self._video_ids = video_ids
+
+    def run(self):
+        try:
+            with db.connection_context():
+                result = self._pm_service.delete_videos_safe(self._video_ids, self.signals.progress.emit)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
 
 class DatabaseOverviewWidget(QWidget):
     file_open_requested = Signal(str)
@@ -32,12 +169,24 @@ class DatabaseOverviewWidget(QWidget):
     # Signals
     single_transcription_requested = Signal(str, str, bool)  # video_id, channel_handle, force_download
     batch_transcription_requested = Signal(list)  # [video_ids] für Batch-Processing
+    batch_chapter_generation_requested = Signal(list)  # [video_ids] für Batch-Kapitelgenerierung
     text_editor_open_requested = Signal(str)  # video_id für Text-Editor
+    data_changed = Signal()  # Videos/Kanäle gelöscht oder Transkript gespeichert
+
+    # Pro Zeile identische Werte, einmalig aufgelöst statt im Zeilenaufbau
+    _CHECK_ICON = None
+    _ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight
 
     def __init__(self, project_manager_service, parent=None):
         super().__init__(parent)
+        if type(self)._CHECK_ICON is None:
+            type(self)._CHECK_ICON = Icons.get(Icons.CHECK)
         self.pm_service = project_manager_service
         self.parent_window = parent  # Referenz für WorkerManager
+        # Bestätigungsdialog wird beim ersten Löschen erstellt und danach wiederverwendet
+        self._confirm_dialog: DeleteConfirmationDialog | None = None
+        # Zählt die Ladevorgänge von refresh_data; Ergebnisse älterer Vorgänge werden verworfen
+        self._fetch_generation = 0
 
         self._setup_ui()
 
@@ -52,11 +201,9 @@ class DatabaseOverviewWidget(QWidget):
 
     def _setup_widgets(self):
         """Initialisiert alle UI-Komponenten und konfiguriert ihre statischen Eigenschaften."""
-        self.model = QStandardItemModel(self)
-        self.proxy_model = QSortFilterProxyModel(self)
+        self.model = TranscriptTableModel(self)
+        self.proxy_model = SearchableProxy(self)
         self.proxy_model.setSourceModel(self.model)
-        self.proxy_model.setFilterKeyColumn(-1)
-        self.proxy_model.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
 
         self.table_view = QTableView(self)
         self.table_view.setObjectName("database_overview_table_view")
@@ -64,6 +211,12 @@ class DatabaseOverviewWidget(QWidget):
         self.table_view.setSortingEnabled(True)
         self.table_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table_view.setItemDelegateForColumn(10, HyperlinkDelegate(self.table_view))  # Video-URL
+        # Häkchen für "Kapitel" und "Transkribiert" zeichnet ein Delegate aus den Zeilen-Flags des Models
+        check_mark_delegate = CheckMarkDelegate(self._CHECK_ICON, self.table_view)
+        self.table_view.setItemDelegateForColumn(TranscriptTableModel.CHAPTERS_COLUMN, check_mark_delegate)
+        self.table_view.setItemDelegateForColumn(TranscriptTableModel.TRANSCRIBED_COLUMN, check_mark_delegate)
+        # Feste Zeilenhöhe: Qt muss beim Scrollen keine sizeHints pro Zeile berechnen
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
         # Header-Einstellungen
         self.table_view.setColumnWidth(0, 400)  # Setzt die erste Spalte auf 400 Pixel Breite
@@ -73,6 +226,8 @@ class DatabaseOverviewWidget(QWidget):
         self.table_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table_view.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
 
+        self._setup_context_menus()
+
         # Progress Bar für asynchrones Laden
         self.progress_bar = QProgressBar(self)
         self.progress_bar.setObjectName("database_overview_progress_bar")
@@ -85,6 +240,53 @@ class DatabaseOverviewWidget(QWidget):
         self.search_input.setObjectName("database_overview_search_input")
         self.search_input.setPlaceholderText("Transcripts durchsuchen...")
 
+    def _setup_context_menus(self):
+        """Erstellt die Kontextmenüs einmalig; beim Öffnen werden nur Texte und Sichtbarkeit angepasst."""
+        # Zustand der zuletzt geöffneten Kontextmenü-Zeile(n), wird von den Action-Slots gelesen
+        self._ctx_video_id = ""
+        self._ctx_channel_id = ""
+        self._ctx_channel_handle = ""
+        self._ctx_youtube_url = ""
+        self._ctx_selection_rows: list[SelectionRow] = []
+        self._ctx_selected_video_ids: list[str] = []
+
+        # === SINGLE-SELECTION MENÜ ===
+        self._menu_single = QMenu(self)
+        self._action_open_file = self._menu_single.addAction(
+            Icons.get(":/icons/markdown-document-programming.svg"), "Markdown-Datei öffnen"
+        )
+        self._action_open_editor = self._menu_single.addAction(
+            Icons.get(":/icons/ai-edit-spark.svg"), "Im Editor-Fenster öffnen"
+        )
+        self._action_download = self._menu_single.addAction(
+            Icons.get(":/icons/download-file.svg"), "Transkript downloaden"
+        )
+        self._menu_single.addSeparator()
+        # Löschoptionen für einzelnes Video
+        self._action_delete_video = self._menu_single.addAction(Icons.get(":/icons/delete-1.svg"), "Video löschen")
+        self._action_delete_channel = self._menu_single.addAction(Icons.get(":/icons/delete-1.svg"), "Kanal löschen")
+        self._menu_single.addSeparator()
+        self._action_generate_chapters = self._menu_single.addAction(
+            Icons.get(":/icons/send_to_notebooklm.svg"), "Starte Kapitelgenerierung"
+        )
+        self._menu_single.addSeparator()
+        self._action_open_youtube = self._menu_single.addAction(
+            Icons.get(":/icons/webcam-video.svg"), "YouTube-Link öffnen"
+        )
+
+        # === MULTI-SELECTION MENÜ ===
+        self._menu_multi = QMenu(self)
+        self._action_selection_info = self._menu_multi.addAction(Icons.get(Icons.INFO), "Auswahl")
+        self._action_selection_info.setEnabled(False)  # Info-Header
+        self._menu_multi.addSeparator()
+        self._action_batch_download = self._menu_multi.addAction(Icons.get(Icons.DOWNLOAD), "Batch-Download")
+        self._action_batch_chapters = self._menu_multi.addAction(Icons.get(Icons.BOOK_OPEN), "Batch-Kapitelgenerierung")
+        self._menu_multi.addSeparator()
+        self._action_open_all_youtube = self._menu_multi.addAction(Icons.get(Icons.VIDEO), "Alle YouTube-Links öffnen")
+        # Batch-Löschoptionen
+        self._menu_multi.addSeparator()
+        self._action_delete_selected = self._menu_multi.addAction(Icons.get(Icons.X_CIRCLE), "Videos löschen")
+
     def _setup_layouts(self):
         """Ordnet die initialisierten Widgets in Layouts an."""
         search_layout = QHBoxLayout()
@@ -102,6 +304,19 @@ class DatabaseOverviewWidget(QWidget):
         self.table_view.customContextMenuRequested.connect(self.show_context_menu)
         self.search_input.textChanged.connect(self.filter_videos)
 
+        # Kontextmenü-Actions (lesen den beim Öffnen gesetzten _ctx_*-Zustand)
+        self._action_open_file.triggered.connect(self._on_open_file)
+        self._action_open_editor.triggered.connect(self._on_open_in_editor)
+        self._action_download.triggered.connect(self._on_download_transcript)
+        self._action_delete_video.triggered.connect(self._on_delete_video)
+        self._action_delete_channel.triggered.connect(self._on_delete_channel)
+        self._action_generate_chapters.triggered.connect(self._on_generate_chapters)
+        self._action_open_youtube.triggered.connect(self._on_open_youtube_link)
+        self._action_batch_download.triggered.connect(self._on_batch_download)
+        self._action_batch_chapters.triggered.connect(self._on_batch_chapter_generation)
+        self._action_open_all_youtube.triggered.connect(self._on_open_all_youtube_links)
+        self._action_delete_selected.triggered.connect(self._on_delete_selected_videos)
+
     def _setup_columns(self):
         self.model.setHorizontalHeaderLabels(
             [
@@ -124,50 +339,48 @@ class DatabaseOverviewWidget(QWidget):
         )
 
     def _create_row_items_for_enriched_video(self, enriched_video: dict) -> list:
-        """Erstellt Tabellenzeile für ein erweitertes Transcript-Objekt mit der neuen Datenbankarchitektur."""
+        """Erstellt Tabellenzeile für ein erweitertes Transcript-Objekt mit der neuen Datenbankarchitektur.
+
+        Die Häkchen-Spalten 6 und 7 bleiben ``None``; deren Status wird beim Einfügen per
+        ``TranscriptTableModel.append_transcript_row`` übergeben.
+        """
         transcript = enriched_video["transcript"]
-        has_transcript = enriched_video.get("has_transcript", False)
-        has_chapters = enriched_video.get("has_chapters", False)
-
-        # Channel-Daten aus der Relation holen
-        channel = transcript.channel if hasattr(transcript, "channel") else None
-
-        # Verwende Datenbank-Informationen für konsistente Anzeige
-        db_transcribed = getattr(transcript, "is_transcribed", False)
-        db_transcript_lines = getattr(transcript, "transcript_lines", 0)
-
-        # Rechne die Dauer von Sekunden in ein lesbares Format um
-        duration = getattr(transcript, "duration", 0)
-        if isinstance(duration, int):
-            hours, remainder = divmod(duration, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            duration_str = f"{hours:02}:{minutes:02}:{seconds:02}"
-        else:
-            duration_str = "00:00:00"
 
-        title_item = QStandardItem(str(transcript.title))  # 0
-        video_id_item = QStandardItem(str(transcript.video_id))  # 1
+        # Felder einmalig in lokale Variablen binden (Zeilen kommen als Dicts inkl. Kanal-Spalten)
+        title = transcript["title"]
+        video_id = transcript["video_id"]
+        duration_str = transcript["duration_str"]
+        chapter_count = transcript["chapter_count"] or 0
+        detailed_chapter_count = transcript["detailed_chapter_count"] or 0
+        transcript_lines = transcript["transcript_lines"] or 0
+        publish_date = transcript["publish_date"]
+        video_url = transcript["video_url"]
+        error_reason = transcript["error_reason"] or ""
+        handle = transcript.get("handle") or ""
+        channel_id = transcript.get("channel_id") or ""
+        channel_name = transcript.get("name") or ""
+
+        title_item = QStandardItem(str(title))  # 0
+        # Felder per Zeilenumbruch trennen, damit kein Treffer über zwei Felder hinweg reicht
+        title_item.setData("\n".join((str(title), str(video_id), handle, error_reason)).lower(), SEARCH_KEY_ROLE)
+        video_id_item = QStandardItem(str(video_id))  # 1
+        # Kanal-Daten für das Kontextmenü an der Zeile ablegen (erspart die DB-Abfrage beim Rechtsklick)
+        video_id_item.setData(channel_id, CHANNEL_ID_ROLE)
+        video_id_item.setData(channel_name, CHANNEL_NAME_ROLE)
         duration_item = QStandardItem(duration_str)  # 2
-        chapter_count_item = QStandardItem(str(getattr(transcript, "chapter_count", 0)))  # 3
-        detailed_chapter_count_item = QStandardItem(str(getattr(transcript, "detailed_chapter_count", 0)))  # 4
-        transcript_lines_item = QStandardItem(str(db_transcript_lines))  # 5
-        chapter_item = QStandardItem("")  # 6
-        if has_chapters:
-            chapter_item.setIcon(Icons.get(Icons.CHECK))
-        transcribed_item = QStandardItem("")  # 7
-        if has_transcript:
-            transcribed_item.setIcon(Icons.get(Icons.CHECK))
-        publish_date_item = QStandardItem(str(transcript.publish_date))  # 8
-        channel_handle_item = QStandardItem(str(getattr(channel, "handle", "")) if channel else "")  # 9
-        video_url_item = QStandardItem(str(transcript.video_url))  # 10
-        error_reason_item = QStandardItem(str(getattr(transcript, "error_reason", "")))  # 11
-
-        transcribed_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        chapter_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        chapter_count_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-        detailed_chapter_count_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-        transcript_lines_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-        duration_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
+        chapter_count_item = QStandardItem(str(chapter_count))  # 3
+        detailed_chapter_count_item = QStandardItem(str(detailed_chapter_count))  # 4
+        transcript_lines_item = QStandardItem(str(transcript_lines))  # 5
+        publish_date_item = QStandardItem(str(publish_date))  # 8
+        channel_handle_item = QStandardItem(str(handle))  # 9
+        video_url_item = QStandardItem(str(video_url))  # 10
+        error_reason_item = QStandardItem(str(error_reason))  # 11
+
+        align_right = self._ALIGN_RIGHT
+        chapter_count_item.setTextAlignment(align_right)
+        detailed_chapter_count_item.setTextAlignment(align_right)
+        transcript_lines_item.setTextAlignment(align_right)
+        duration_item.setTextAlignment(align_right)
 
         return [
             title_item,  # 0
@@ -176,8 +389,8 @@ class DatabaseOverviewWidget(QWidget):
             chapter_count_item,  # 3
             detailed_chapter_count_item,  # 4
             transcript_lines_item,  # 5
-            chapter_item,  # 6
-            transcribed_item,  # 7
+            None,  # 6 - Kapitel-Häkchen zeichnet der CheckMarkDelegate
+            None,  # 7 - Transkribiert-Häkchen zeichnet der CheckMarkDelegate
             publish_date_item,  # 8
             channel_handle_item,  # 9
             video_url_item,  # 10
@@ -185,69 +398,61 @@ class DatabaseOverviewWidget(QWidget):
         ]
 
     def refresh_data(self):
-        """Lädt Transcripts synchron (ohne Threading um Crashes zu vermeiden)."""
+        """Startet das Laden der Transcripts im Thread-Pool; die Tabelle wird im Slot befüllt."""
+        logger.debug("DatabaseOverviewWidget: Starte Laden der Transcripts im Hintergrund")
+
+        # Zeige Progress Bar
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+
+        # Nur der zuletzt gestartete Ladevorgang darf die Tabelle befüllen und die Progress Bar steuern
+        self._fetch_generation += 1
+        task = _TranscriptFetchTask(self._fetch_generation)
+        task.signals.finished.connect(self._on_transcripts_fetched)
+        task.signals.error.connect(self._on_transcripts_fetch_error)
+        task.signals.progress.connect(self._on_transcripts_fetch_progress)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(int, int, int)
+    def _on_transcripts_fetch_progress(self, generation: int, done: int, total: int) -> None:
+        """Leitet den Fortschritt des aktuellen Ladevorgangs an die Progress Bar weiter."""
+        if generation == self._fetch_generation:
+            self._on_background_progress(done, total)
+
+    @Slot(int, list)
+    def _on_transcripts_fetched(self, generation: int, transcripts: list) -> None:
+        """Verarbeitet die im Hintergrund geladenen Transcript-Zeilen und befüllt die Tabelle."""
+        if generation != self._fetch_generation:
+            logger.debug("DatabaseOverviewWidget: Verwerfe Ergebnis eines veralteten Ladevorgangs")
+            return
         try:
-            logger.debug("DatabaseOverviewWidget: Starte direktes Laden der Transcripts")
-
-            # Zeige Progress Bar
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setRange(0, 0)  # Indeterminate progress
-
-            # Lade Transcripts direkt ohne Threading (um Crashes zu vermeiden)
-            logger.debug("DatabaseOverviewWidget: Lade Transcripts aus Datenbank (ohne Threading)")
-            try:
-                # Lade Transcripts mit Channel-Relationen
-                from yt_database.database import Channel
-
-                transcripts = list(Transcript.select().join(Channel))
-                self._adjust_column_sizes()
-                logger.debug(f"DatabaseOverviewWidget: {len(transcripts)} Transcripts aus DB geladen")
-            except Exception as e:
-                logger.error(f"Datenbankfehler beim Laden der Transcripts: {e}")
-                self.progress_bar.setVisible(False)
-                self._load_videos_sync()
-                return
+            self._adjust_column_sizes()
+            logger.debug(f"DatabaseOverviewWidget: {len(transcripts)} Transcripts aus DB geladen")
 
             if not transcripts:
                 logger.debug("DatabaseOverviewWidget: Keine Transcripts in der Datenbank gefunden")
                 self.progress_bar.setVisible(False)
                 return
 
-            # Erstelle Worker für Transcript-Verarbeitung OHNE Threading
-            logger.debug("DatabaseOverviewWidget: Verarbeite Transcript-Status ohne Threading")
-
-            # Direct processing without worker threads
             enriched_videos = []
-            total_videos = len(transcripts)
 
             # Verarbeite Transcripts direkt mit Datenbank-Werten (kein Dateisystem-Check nötig)
             logger.debug("DatabaseOverviewWidget: Verwende Datenbank-Status für Transcript-Informationen")
 
-            # Progress-Updates
-            batch_size = 100
-            for i, transcript in enumerate(transcripts):
+            for transcript in transcripts:
                 try:
-                    if not hasattr(transcript, "video_id") or not transcript.video_id:
+                    if not transcript.get("video_id"):
                         continue
 
-                    # Direct processing mit Datenbank-Werten
-                    enriched_video = self._create_enriched_video_with_batch_info(transcript, {})
+                    enriched_video = self._create_enriched_video_with_batch_info(transcript)
                     enriched_videos.append(enriched_video)
 
                 except Exception as e:
-                    logger.debug(f"Fehler bei Transcript {getattr(transcript, 'video_id', 'unknown')}: {e}")
+                    logger.debug(f"Fehler bei Transcript {transcript.get('video_id', 'unknown')}: {e}")
                     continue
 
-                # Progress-Update
-                if (i + 1) % batch_size == 0 or (i + 1) == total_videos:
-                    self.progress_bar.setRange(0, total_videos)
-                    self.progress_bar.setValue(i + 1)
-                    # Process events to keep GUI responsive
-                    QApplication.processEvents()
-
             logger.debug(f"DatabaseOverviewWidget: {len(enriched_videos)} Transcripts erfolgreich verarbeitet")
 
-            # Populate table directly
             self._populate_table_with_videos(enriched_videos)
             self.progress_bar.setVisible(False)
 
@@ -256,119 +461,42 @@ class DatabaseOverviewWidget(QWidget):
             self.progress_bar.setVisible(False)
             self._load_videos_sync()
 
-    def _batch_check_transcript_directories(self, channel_ids: set) -> dict:
-        """Überprüft effizient alle Transcript-Verzeichnisse für die gegebenen Channel-IDs."""
-        transcript_info = {}
-
-        try:
-            # Hole Projektverzeichnis aus den Settings
-            if hasattr(self.pm_service, "settings") and hasattr(self.pm_service.settings, "project_path"):
-                projects_dir = self.pm_service.settings.project_path
-            else:
-                projects_dir = "./projects"
-
-            for channel_id in channel_ids:
-                try:
-                    channel_dir = os.path.join(projects_dir, str(channel_id))
-                    video_ids_with_transcripts = set()
-
-                    if os.path.exists(channel_dir) and os.path.isdir(channel_dir):
-                        for video_dir in os.listdir(channel_dir):
-                            video_path = os.path.join(channel_dir, video_dir)
-                            if os.path.isdir(video_path):
-                                transcript_file = os.path.join(video_path, f"{video_dir}_transcript.md")
-                                if os.path.exists(transcript_file):
-                                    video_ids_with_transcripts.add(video_dir)
-
-                    transcript_info[str(channel_id)] = video_ids_with_transcripts
-
-                except Exception as e:
-                    logger.debug(f"Fehler beim Batch-Check für Channel {channel_id}: {e}")
-                    transcript_info[str(channel_id)] = set()
-
-        except Exception as e:
-            logger.warning(f"Fehler beim Batch-Check der Transcript-Verzeichnisse: {e}")
-
-        return transcript_info
-
-    def _create_enriched_video_with_batch_info(self, transcript, transcript_info: dict) -> dict:
-        """
-        Erstellt ein erweitertes Transcript-Objekt mit Batch-Informationen.
-        """
-        try:
-            video_id = str(transcript.video_id)
-            # Hole Channel-ID aus der Relation
-            channel_id = str(transcript.channel.channel_id) if transcript.channel else None
-
-            # Verwende Datenbank-Status für konsistente Anzeige
-            has_transcript = getattr(transcript, "is_transcribed", False)
-            has_chapters = getattr(transcript, "has_chapters", False)
-
-            # Optional: Dateipfad bestimmen falls benötigt
-            transcript_path = None
-            if has_transcript and channel_id:
-                try:
-                    # Hole Projektverzeichnis aus den Settings
-                    if hasattr(self.pm_service, "settings") and hasattr(self.pm_service.settings, "project_path"):
-                        projects_dir = self.pm_service.settings.project_path
-                    else:
-                        projects_dir = "./projects"
-                    transcript_path = os.path.join(projects_dir, channel_id, video_id, f"{video_id}_transcript.md")
-                except Exception:
-                    pass  # Ignore path determination errors
-
-            return {
-                "transcript": transcript,
-                "has_transcript": has_transcript,
-                "has_chapters": has_chapters,
-                "transcript_path": transcript_path,
-            }
-
-        except Exception as e:
-            logger.warning(
-                f"Fehler beim Erstellen der erweiterten Transcript-Info für {getattr(transcript, 'video_id', 'unknown')}: {e}"
-            )
-            # Fallback zu DB-Werten
-            return {
-                "transcript": transcript,
-                "has_transcript": getattr(transcript, "is_transcribed", False),
-                "has_chapters": getattr(transcript, "has_chapters", False),
-                "transcript_path": None,
-            }
-
-    def _check_chapter_status_from_file(self, transcript_path: str) -> bool:
-        """Überprüft, ob in einer Transkript-Datei Kapitel vorhanden sind."""
-        try:
-            if not transcript_path or not os.path.exists(transcript_path):
-                return False
+    @Slot(int, int)
+    def _on_background_progress(self, done: int, total: int) -> None:
+        """Aktualisiert die Progress Bar mit dem Fortschritt einer Hintergrundaufgabe (Laden, Löschen)."""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
 
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                return "## Kapitel" in content or "# Kapitel" in content or "chapters:" in content.lower()
+    @Slot(int, str)
+    def _on_transcripts_fetch_error(self, generation: int, message: str) -> None:
+        """Fällt bei Datenbankfehlern im Hintergrund-Laden auf das synchrone Laden zurück."""
+        if generation != self._fetch_generation:
+            return
+        logger.error(f"Datenbankfehler beim Laden der Transcripts: {message}")
+        self.progress_bar.setVisible(False)
+        self._load_videos_sync()
 
-        except Exception as e:
-            logger.warning(f"Fehler beim Chapter-Check für Datei {transcript_path}: {e}")
-            return False
+    def _create_enriched_video_with_batch_info(self, transcript) -> dict:
+        """Erstellt ein erweitertes Transcript-Objekt aus den Status-Flags der Datenbank."""
+        return {
+            "transcript": transcript,
+            "has_transcript": transcript["is_transcribed"],
+            "has_chapters": transcript["has_chapters"],
+        }
 
     def _load_videos_sync(self):
         """Fallback: Synchrones Laden der Transcripts (alte Implementierung)."""
         logger.debug("DatabaseOverviewWidget: Fallback zu synchronem Transcript-Laden")
         self.model.removeRows(0, self.model.rowCount())
         try:
-            # Lade Transcripts mit Channel-Relationen
-            from yt_database.database import Channel
-
-            transcripts = list(Transcript.select().join(Channel))
+            # Lade Transcripts mit Channel-Daten als einfache Dicts
+            transcripts = list(_select_transcript_rows())
             for transcript in transcripts:
+                transcript["duration_str"] = _format_duration(transcript["duration"])
                 # Erstelle erweiterte Transcript-Info für Kompatibilität
-                enriched_video = {
-                    "transcript": transcript,
-                    "has_transcript": getattr(transcript, "is_transcribed", False),
-                    "has_chapters": getattr(transcript, "has_chapters", False),
-                    "transcript_path": None,
-                }
+                enriched_video = self._create_enriched_video_with_batch_info(transcript)
                 items = self._create_row_items_for_enriched_video(enriched_video)
-                self.model.appendRow(items)
+                self._append_enriched_row(items, enriched_video)
         except Exception as e:
             logger.error(f"Fehler beim synchronen Transcript-Laden: {e}")
 
@@ -379,36 +507,23 @@ class DatabaseOverviewWidget(QWidget):
         try:
             # Blockiere Updates während der Population um Repaint-Probleme zu vermeiden
             self.table_view.setUpdatesEnabled(False)
+            # Sortierung und dynamisches Filtern aus, damit nicht jede eingefügte Zeile neu sortiert/filtert
+            self.table_view.setSortingEnabled(False)
+            self.proxy_model.setDynamicSortFilter(False)
 
-            # Erst alle Zeilen entfernen
-            self.model.removeRows(0, self.model.rowCount())
-
-            # Transcripts in Batches hinzufügen für bessere Performance
-            batch_size = 100  # Größere Batches da einfachere Verarbeitung
-            total_videos = len(enriched_videos)
-
-            for i in range(0, total_videos, batch_size):
-                batch = enriched_videos[i : i + batch_size]
-                batch_items = []
-
-                # Sammle alle Items für diesen Batch
-                for enriched_video in batch:
-                    try:
-                        items = self._create_row_items_for_enriched_video(enriched_video)
-                        batch_items.append(items)
-                    except Exception as e:
-                        logger.warning(f"Fehler beim Erstellen der Tabellenzeile für Transcript: {e}")
-                        continue
-
-                # Füge Batch als Ganzes hinzu (effizienter)
-                for items in batch_items:
-                    self.model.appendRow(items)
-
-                # Log Progress für große Batches
-                if total_videos > 100:
-                    logger.debug(
-                        f"DatabaseOverviewWidget: Batch {i // batch_size + 1}/{(total_videos - 1) // batch_size + 1} verarbeitet"
+            # Alle Zeilen vorab aufbauen, dann das Model in einem Schritt befüllen
+            all_rows = []
+            for enriched_video in enriched_videos:
+                try:
+                    items = self._create_row_items_for_enriched_video(enriched_video)
+                    all_rows.append(
+                        (items, enriched_video.get("has_chapters", False), enriched_video.get("has_transcript", False))
                     )
+                except Exception as e:
+                    logger.warning(f"Fehler beim Erstellen der Tabellenzeile für Transcript: {e}")
+                    continue
+
+            self.model.set_transcript_rows(all_rows)
 
             logger.debug(f"DatabaseOverviewWidget: Tabelle mit {self.model.rowCount()} Transcripts populiert")
 
@@ -417,11 +532,19 @@ class DatabaseOverviewWidget(QWidget):
             # Fallback: Versuche wenigstens einige Transcripts zu laden
             self._populate_table_fallback(enriched_videos[:100])
         finally:
-            # Reaktiviere Updates
+            # Reaktiviere Sortierung, Filter und Updates
+            self.proxy_model.setDynamicSortFilter(True)
+            self.table_view.setSortingEnabled(True)
             self.table_view.setUpdatesEnabled(True)
             # Force einmaliges Update
             self.table_view.repaint()
 
+    def _append_enriched_row(self, items: list, enriched_video: dict) -> None:
+        """Hängt eine Tabellenzeile samt Kapitel-/Transkript-Status an das Model an."""
+        self.model.append_transcript_row(
+            items, enriched_video.get("has_chapters", False), enriched_video.get("has_transcript", False)
+        )
+
     def _populate_table_fallback(self, enriched_videos):
         """Fallback-Methode für das Populieren der Tabelle bei Fehlern."""
         logger.debug("DatabaseOverviewWidget: Verwende Fallback-Methode für Tabellen-Population")
@@ -430,7 +553,7 @@ class DatabaseOverviewWidget(QWidget):
             for enriched_video in enriched_videos:
                 try:
                     items = self._create_row_items_for_enriched_video(enriched_video)
-                    self.model.appendRow(items)
+                    self._append_enriched_row(items, enriched_video)
                 except Exception as e:
                     logger.debug(f"Fallback: Überspringe fehlerhaftes Transcript: {e}")
                     continue
@@ -463,121 +586,117 @@ class DatabaseOverviewWidget(QWidget):
         source_index = self.proxy_model.mapToSource(index)
         row = source_index.row()
 
-        # Daten der geklickten Zeile
+        # Daten der geklickten Zeile direkt über die Model-Indizes lesen (ohne QStandardItem-Wrapper)
+        model = self.model
         # Video-ID ist Spalte 1
-        video_id = self.model.item(row, 1).text()
-        # Transkribiert ist Spalte 7 - prüfen ob Icon gesetzt ist
-        has_transcript = not self.model.item(row, 7).icon().isNull()
-        # Spalte 5
-        transcript_lines = int(self.model.item(row, 5).text()) if self.model.item(row, 5).text().isdigit() else 0
+        video_id_index = model.index(row, 1)
+        video_id = video_id_index.data() or ""
+        # Transkribiert ist Spalte 7
+        has_transcript = model.has_transcript(row)
         # Video-URL ist Spalte 10
-        youtube_url = self.model.item(row, 10).text()
+        youtube_url = model.index(row, 10).data() or ""
         # Kanal-Handle ist Spalte 9
-        channel_handle = self.model.item(row, 9).text() if self.model.item(row, 9) else ""
-        # Für Kanal-Löschung: Versuche Channel-ID aus Transcript zu holen
-        channel_id = ""
-        channel_name = ""
-        try:
-            # Hole das Transcript-Objekt aus der DB für Channel-Info
-            from yt_database.database import Channel
-
-            transcripts = list(Transcript.select().join(Channel).where(Transcript.video_id == video_id))
-            if transcripts:
-                transcript = transcripts[0]
-                if hasattr(transcript, "channel") and transcript.channel:
-                    channel_id = str(transcript.channel.channel_id)
-                    channel_name = str(transcript.channel.name)
-        except Exception as e:
-            logger.debug(f"Fehler beim Holen der Channel-Daten für Video {video_id}: {e}")
-
-        menu = QMenu(self)
+        channel_handle = model.index(row, 9).data() or ""
+        # Für Kanal-Löschung: Channel-ID und -Name wurden beim Aufbau der Zeile an Spalte 1 abgelegt
+        channel_id = video_id_index.data(CHANNEL_ID_ROLE) or ""
+        channel_name = video_id_index.data(CHANNEL_NAME_ROLE) or ""
 
         # === SINGLE-SELECTION MENÜ ===
         if selected_count == 1:
-            if video_id:
-                open_file_action = menu.addAction(
-                    Icons.get(":/icons/markdown-document-programming.svg"),
-                    "Markdown-Datei öffnen",
-                    lambda: self.file_open_requested.emit(video_id),
-                )
-                editor_action = menu.addAction(
-                    Icons.get(":/icons/ai-edit-spark.svg"),
-                    "Im Editor-Fenster öffnen",
-                    lambda: self._open_in_editor_window(video_id),
-                )
-                download_action = menu.addAction(
-                    Icons.get(":/icons/download-file.svg"),
-                    "Transkript downloaden",
-                    lambda: self.single_transcription_requested.emit(video_id, channel_handle, False),
-                )
-                menu.addSeparator()
-                # Löschoptionen für einzelnes Video
-                delete_video_action = menu.addAction(
-                    Icons.get(":/icons/delete-1.svg"), "Video löschen", lambda: self._delete_video(video_id)
-                )
-                if channel_id and channel_name:
-                    delete_channel_action = menu.addAction(
-                        Icons.get(":/icons/delete-1.svg"),
-                        f"Kanal '{channel_name}' löschen",
-                        lambda: self._delete_channel(channel_id),
-                    )
-
-            if has_transcript and video_id:
-                menu.addSeparator()
-                chapter_action = menu.addAction(
-                    Icons.get(":/icons/send_to_notebooklm.svg"),
-                    "Starte Kapitelgenerierung",
-                    lambda: self.chapter_generation_requested.emit(video_id),
-                )
-            if youtube_url.startswith("http") or youtube_url.startswith("https"):
-                menu.addSeparator()
-                youtube_action = menu.addAction(
-                    Icons.get(":/icons/webcam-video.svg"),
-                    "YouTube-Link öffnen",
-                    lambda: QDesktopServices.openUrl(QUrl(youtube_url)),
-                )
+            self._ctx_video_id = video_id
+            self._ctx_channel_id = channel_id
+            self._ctx_channel_handle = channel_handle
+            self._ctx_youtube_url = youtube_url
+
+            for action in (
+                self._action_open_file,
+                self._action_open_editor,
+                self._action_download,
+                self._action_delete_video,
+            ):
+                action.setVisible(bool(video_id))
+            self._action_delete_channel.setText(f"Kanal '{channel_name}' löschen")
+            self._action_delete_channel.setVisible(bool(video_id and channel_id and channel_name))
+            self._action_generate_chapters.setVisible(bool(has_transcript and video_id))
+            self._action_open_youtube.setVisible(youtube_url.startswith("http"))
+            menu = self._menu_single
 
         # === MULTI-SELECTION MENÜ ===
         elif selected_count > 1:
             # Sammle alle Video-IDs der Selektion
-            selected_video_ids = self._get_selected_video_ids(selected_indexes)
-            not_transcribed_count = self._count_not_transcribed(selected_indexes)
+            self._ctx_selection_rows = self._collect_selection_rows()
+            self._ctx_selected_video_ids = self._get_selected_video_ids(self._ctx_selection_rows)
+            not_transcribed_count = self._count_not_transcribed(self._ctx_selection_rows)
             transcribed_count = selected_count - not_transcribed_count
 
-            info_action = menu.addAction(Icons.get(Icons.INFO), f"Auswahl: {selected_count} Videos", None)
-            info_action.setEnabled(False)  # Info-Header
-            menu.addSeparator()
+            self._action_selection_info.setText(f"Auswahl: {selected_count} Videos")
+            self._action_batch_download.setText(f"Batch-Download ({not_transcribed_count} Videos)")
+            self._action_batch_download.setVisible(not_transcribed_count > 0)
+            self._action_batch_chapters.setText(f"Batch-Kapitelgenerierung ({transcribed_count} Videos)")
+            self._action_batch_chapters.setVisible(transcribed_count > 0)
+            self._action_delete_selected.setText(f"{selected_count} Videos löschen")
+            menu = self._menu_multi
 
-            if not_transcribed_count > 0:
-                batch_download_action = menu.addAction(
-                    Icons.get(Icons.DOWNLOAD),
-                    f"Batch-Download ({not_transcribed_count} Videos)",
-                    lambda: self._start_batch_transcription(selected_video_ids),
-                )
+        else:
+            return
 
-            if transcribed_count > 0:
-                batch_chapter_action = menu.addAction(
-                    Icons.get(Icons.BOOK_OPEN),
-                    f"Batch-Kapitelgenerierung ({transcribed_count} Videos)",
-                    lambda: self._start_batch_chapter_generation(selected_video_ids),
-                )
+        menu.exec(self.table_view.viewport().mapToGlobal(position))
 
-            menu.addSeparator()
-            youtube_links_action = menu.addAction(
-                Icons.get(Icons.VIDEO),
-                "Alle YouTube-Links öffnen",
-                lambda: self._open_all_youtube_links(selected_indexes),
-            )
+    # === KONTEXTMENÜ-SLOTS ===
 
-            # Batch-Löschoptionen
-            menu.addSeparator()
-            delete_multiple_action = menu.addAction(
-                Icons.get(Icons.X_CIRCLE),
-                f"{selected_count} Videos löschen",
-                lambda: self._delete_multiple_videos(selected_video_ids),
-            )
+    @Slot()
+    def _on_open_file(self) -> None:
+        self.file_open_requested.emit(self._ctx_video_id)
 
-        menu.exec(self.table_view.viewport().mapToGlobal(position))
+    @Slot()
+    def _on_open_in_editor(self) -> None:
+        self._open_in_editor_window(self._ctx_video_id)
+
+    @Slot()
+    def _on_download_transcript(self) -> None:
+        self.single_transcription_requested.emit(self._ctx_video_id, self._ctx_channel_handle, False)
+
+    @Slot()
+    def _on_delete_video(self) -> None:
+        self._delete_video(self._ctx_video_id)
+
+    @Slot()
+    def _on_delete_channel(self) -> None:
+        self._delete_channel(self._ctx_channel_id)
+
+    @Slot()
+    def _on_generate_chapters(self) -> None:
+        self.chapter_generation_requested.emit(self._ctx_video_id)
+
+    @Slot()
+    def _on_open_youtube_link(self) -> None:
+        QDesktopServices.openUrl(QUrl(self._ctx_youtube_url))
+
+    @Slot()
+    def _on_batch_download(self) -> None:
+        self._start_batch_transcription(self._ctx_selected_video_ids)
+
+    @Slot()
+    def _on_batch_chapter_generation(self) -> None:
+        self._start_batch_chapter_generation(self._ctx_selected_video_ids)
+
+    @Slot()
+    def _on_open_all_youtube_links(self) -> None:
+        self._open_all_youtube_links(self._ctx_selection_rows)
+
+    @Slot()
+    def _on_delete_selected_videos(self) -> None:
+        self._delete_multiple_videos(self._ctx_selected_video_ids)
+
+    def _get_confirm_dialog(self, delete_type: str, preview_data: dict) -> DeleteConfirmationDialog:
+        """Liefert den wiederverwendeten Bestätigungsdialog, befüllt mit der aktuellen Löschvorschau."""
+        if self._confirm_dialog is None:
+            self._confirm_dialog = DeleteConfirmationDialog(
+                delete_type=delete_type, preview_data=preview_data, parent=self
+            )
+        else:
+            self._confirm_dialog.set_preview_data(delete_type, preview_data)
+        return self._confirm_dialog
 
     def _delete_video(self, video_id: str):
         """Löscht ein einzelnes Video nach Bestätigung."""
@@ -586,7 +705,7 @@ class DatabaseOverviewWidget(QWidget):
             preview = self.pm_service.get_deletion_preview("video", video_id)
 
             # Zeige Bestätigungsdialog
-            dialog = DeleteConfirmationDialog(delete_type="Video", preview_data=preview, parent=self)
+            dialog = self._get_confirm_dialog("Video", preview)
 
             if dialog.exec():
                 # Führe Löschung durch
@@ -602,6 +721,7 @@ class DatabaseOverviewWidget(QWidget):
                     )
                     # Aktualisiere die Anzeige
                     self.refresh_data()
+                    self.data_changed.emit()
                 else:
                     QMessageBox.warning(
                         self, "Fehler beim Löschen", f"Fehler beim Löschen des Videos:\n{result['error']}"
@@ -618,7 +738,7 @@ class DatabaseOverviewWidget(QWidget):
             preview = self.pm_service.get_deletion_preview("channel", channel_id)
 
             # Zeige Bestätigungsdialog
-            dialog = DeleteConfirmationDialog(delete_type="Kanal", preview_data=preview, parent=self)
+            dialog = self._get_confirm_dialog("Kanal", preview)
 
             if dialog.exec():
                 # Führe Löschung durch
@@ -634,6 +754,7 @@ class DatabaseOverviewWidget(QWidget):
                     )
                     # Aktualisiere die Anzeige
                     self.refresh_data()
+                    self.data_changed.emit()
                 else:
                     QMessageBox.warning(
                         self, "Fehler beim Löschen", f"Fehler beim Löschen des Kanals:\n{result['error']}"
@@ -649,70 +770,73 @@ class DatabaseOverviewWidget(QWidget):
             if not video_ids:
                 return
 
-            # Sammle Löschvorschau für alle Videos
-            total_chapters = 0
-            for video_id in video_ids:
-                try:
-                    preview = self.pm_service.get_deletion_preview("video", video_id)
-                    if preview.get("success"):
-                        total_chapters += preview.get("chapters_affected", 0)
-                except Exception as e:
-                    logger.warning(f"Fehler bei Löschvorschau für Video {video_id}: {e}")
-
-            # Erstelle Batch-Statistik
-            stats = {
-                "success": True,
-                "title": f"{len(video_ids)} Videos",
-                "videos_affected": len(video_ids),
-                "chapters_affected": total_chapters,
-                "channels_affected": 0,
-            }
+            # Löschvorschau für alle Videos mit einer Zählabfrage statt einer Abfrage je Video
+            stats = self.pm_service.get_batch_deletion_preview(video_ids)
+            if not stats.get("success"):
+                logger.warning(f"Löschvorschau nicht verfügbar: {stats.get('error')}")
+                stats = {
+                    "success": True,
+                    "title": f"{len(video_ids)} Videos",
+                    "videos_affected": len(video_ids),
+                    "chapters_affected": 0,
+                    "channels_affected": 0,
+                }
 
             # Zeige Bestätigungsdialog
-            dialog = DeleteConfirmationDialog(delete_type="Videos", preview_data=stats, parent=self)
+            dialog = self._get_confirm_dialog("Videos", stats)
 
             if dialog.exec():
-                # Führe Batch-Löschung durch
-                deleted_videos = 0
-                deleted_chapters = 0
-                errors = []
-
-                for video_id in video_ids:
-                    try:
-                        result = self.pm_service.delete_video_safe(video_id)
-                        if result["success"]:
-                            deleted_videos += 1
-                            deleted_chapters += result.get("chapters_deleted", 0)
-                        else:
-                            errors.append(f"Video {video_id}: {result['error']}")
-                    except Exception as e:
-                        errors.append(f"Video {video_id}: {str(e)}")
-
-                if errors:
-                    QMessageBox.warning(
-                        self,
-                        "Teilweise erfolgreich",
-                        f"Batch-Löschung abgeschlossen mit Fehlern:\n\n"
-                        f"Erfolgreich: {deleted_videos} Video(s), {deleted_chapters} Kapitel\n\n"
-                        f"Fehler:\n"
-                        + "\n".join(errors[:5])
-                        + (f"\n... und {len(errors)-5} weitere" if len(errors) > 5 else ""),
-                    )
-                else:
-                    QMessageBox.information(
-                        self,
-                        "Erfolgreich gelöscht",
-                        f"Batch-Löschung erfolgreich abgeschlossen.\n\n"
-                        f"Gelöscht: {deleted_videos} Video(s), {deleted_chapters} Kapitel",
-                    )
-
-                # Aktualisiere die Anzeige
-                self.refresh_data()
+                # Führe Batch-Löschung im Thread-Pool durch, die GUI bleibt bedienbar
+                self.progress_bar.setVisible(True)
+                self.progress_bar.setRange(0, 0)
+                task = _BatchDeleteTask(self.pm_service, video_ids)
+                task.signals.finished.connect(self._on_batch_delete_finished)
+                task.signals.error.connect(self._on_batch_delete_error)
+                task.signals.progress.connect(self._on_background_progress)
+                QThreadPool.globalInstance().start(task)
 
         except Exception as e:
             logger.error(f"Fehler beim Batch-Löschen: {e}")
             QMessageBox.critical(self, "Fehler", f"Unerwarteter Fehler beim Batch-Löschen:\n{str(e)}")
 
+    @Slot(dict)
+    def _on_batch_delete_finished(self, result: dict) -> None:
+        """Zeigt das Ergebnis der Batch-Löschung an und lädt die Tabelle neu."""
+        self.progress_bar.setVisible(False)
+        deleted_videos = result["deleted_videos"]
+        deleted_chapters = result["deleted_chapters"]
+        errors = result["errors"]
+
+        if errors:
+            QMessageBox.warning(
+                self,
+                "Teilweise erfolgreich",
+                f"Batch-Löschung abgeschlossen mit Fehlern:\n\n"
+                f"Erfolgreich: {deleted_videos} Video(s), {deleted_chapters} Kapitel\n\n"
+                f"Fehler:\n"
+                + "\n".join(errors[:5])
+                + (f"\n... und {len(errors)-5} weitere" if len(errors) > 5 else ""),
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Erfolgreich gelöscht",
+                f"Batch-Löschung erfolgreich abgeschlossen.\n\n"
+                f"Gelöscht: {deleted_videos} Video(s), {deleted_chapters} Kapitel",
+            )
+
+        # Aktualisiere die Anzeige
+        self.refresh_data()
+        if deleted_videos:
+            self.data_changed.emit()
+
+    @Slot(str)
+    def _on_batch_delete_error(self, message: str) -> None:
+        """Meldet einen Fehler der Batch-Löschung im Hintergrund."""
+        logger.error(f"Fehler beim Batch-Löschen: {message}")
+        self.progress_bar.setVisible(False)
+        QMessageBox.critical(self, "Fehler", f"Unerwarteter Fehler beim Batch-Löschen:\n{message}")
+
     def _open_in_editor_window(self, video_id: str) -> None:
         """Öffnet das Transkript zu einer Transcript-ID im separaten Editor-Fenster.
         Args:
@@ -728,14 +852,9 @@ class DatabaseOverviewWidget(QWidget):
             return
         editor = TextFileEditorWidget()
         editor.setWindowTitle(file_path)
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            editor._content = content
-            editor._file_path = file_path
-            editor.text_edit.setPlainText(content)
-        except Exception as e:
-            print(f"Fehler beim Öffnen der Datei im Editor-Fenster: {e}")
+        editor.fileSaved.connect(self.data_changed)
+        # Fenster sofort zeigen, der Inhalt wird im Hintergrund nachgeladen
+        editor.load_file_async(file_path)
         editor.show_as_window()
 
     def reload_videos_in_table(self) -> None:
@@ -745,29 +864,37 @@ class DatabaseOverviewWidget(QWidget):
 
     # === MULTI-SELECTION HELPER METHODS ===
 
-    def _get_selected_video_ids(self, selected_indexes) -> list[str]:
+    def _collect_selection_rows(self) -> list[SelectionRow]:
+        """Liest Video-ID, Transkript-Status und URL aller selektierten Zeilen in einem Durchlauf.
+
+        Die gesamte Selektion wird per ``mapSelectionToSource`` auf einmal ins Source-Model übertragen,
+        statt jeden Index einzeln über ``mapToSource`` abzubilden.
+        """
+        source_selection = self.proxy_model.mapSelectionToSource(self.table_view.selectionModel().selection())
+        model = self.model
+        rows = []
+        seen = set()
+        for selection_range in source_selection:
+            for row in range(selection_range.top(), selection_range.bottom() + 1):
+                if row in seen:
+                    continue
+                seen.add(row)
+                rows.append(
+                    SelectionRow(
+                        video_id=model.index(row, 1).data() or "",  # Video-ID ist Spalte 1
+                        has_transcript=model.has_transcript(row),
+                        url=model.index(row, 10).data() or "",  # Video-URL ist Spalte 10
+                    )
+                )
+        return rows
+
+    def _get_selected_video_ids(self, selection_rows: list[SelectionRow]) -> list[str]:
         """Extrahiert Video-IDs aus selektierten Tabellen-Zeilen."""
-        video_ids = []
-        for proxy_index in selected_indexes:
-            source_index = self.proxy_model.mapToSource(proxy_index)
-            row = source_index.row()
-            video_id = self.model.item(row, 1).text()  # Video-ID ist Spalte 1
-            if video_id:
-                video_ids.append(video_id)
-        return video_ids
-
-    def _count_not_transcribed(self, selected_indexes) -> int:
+        return [selection_row.video_id for selection_row in selection_rows if selection_row.video_id]
+
+    def _count_not_transcribed(self, selection_rows: list[SelectionRow]) -> int:
         """Zählt nicht-transkribierte Videos in der Selektion."""
-        count = 0
-        for proxy_index in selected_indexes:
-            source_index = self.proxy_model.mapToSource(proxy_index)
-            row = source_index.row()
-            has_transcript = (
-                not self.model.item(row, 7).icon().isNull()
-            )  # Transkribiert ist Spalte 7 - prüfen ob Icon gesetzt ist
-            if not has_transcript:
-                count += 1
-        return count
+        return sum(1 for selection_row in selection_rows if not selection_row.has_transcript)
 
     def _start_batch_transcription(self, video_ids: list[str]) -> None:
         """Startet Batch-Transcription für ausgewählte Videos."""
@@ -777,21 +904,17 @@ class DatabaseOverviewWidget(QWidget):
     def _start_batch_chapter_generation(self, video_ids: list[str]) -> None:
         """Startet Batch-Kapitelgenerierung für ausgewählte Videos."""
         logger.info(f"Database Widget: Starte Batch-Kapitelgenerierung für {len(video_ids)} Videos")
-        # TODO: Signal für Batch-Chapter-Generation hinzufügen
-        for video_id in video_ids:
-            self.chapter_generation_requested.emit(video_id)
+        self.batch_chapter_generation_requested.emit(video_ids)
 
-    def _open_all_youtube_links(self, selected_indexes) -> None:
+    def _open_all_youtube_links(self, selection_rows: list[SelectionRow]) -> None:
         """Öffnet alle YouTube-Links der Selektion."""
-        opened_count = 0
-        for proxy_index in selected_indexes:
-            source_index = self.proxy_model.mapToSource(proxy_index)
-            row = source_index.row()
-            youtube_url = self.model.item(row, 10).text()  # Video-URL ist Spalte 10
-            if youtube_url and youtube_url.startswith("http"):
-                QDesktopServices.openUrl(QUrl(youtube_url))
-                opened_count += 1
-        logger.info(f"Database Widget: {opened_count} YouTube-Links geöffnet")
+        # Doppelte und ungültige URLs verwerfen, Reihenfolge der Selektion beibehalten
+        urls = list(dict.fromkeys(row.url for row in selection_rows if urlparse(row.url).scheme in ("http", "https")))
+        if not urls:
+            return
+        for youtube_url in urls:
+            QDesktopServices.openUrl(QUrl(youtube_url))
+        logger.info(f"Database Widget: {len(urls)} YouTube-Links geöffnet")
 
     @Slot()
     def _on_transcript_download_finished(self):
@@ -801,19 +924,138 @@ class DatabaseOverviewWidget(QWidget):
         self.reload_videos_in_table()
 
 
+class TranscriptTableModel(QStandardItemModel):
+    """Tabellen-Model der Übersicht, das die Häkchen-Spalten ohne eigene Items darstellt.
+
+    Für "Kapitel" (Spalte 6) und "Transkribiert" (Spalte 7) wird pro Zeile nur ein bool
+    gespeichert; das Häkchen zeichnet der ``CheckMarkDelegate`` anhand von ``is_checked()``.
+    """
+
+    CHAPTERS_COLUMN = 6
+    TRANSCRIBED_COLUMN = 7
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._has_chapters: list[bool] = []
+        self._has_transcript: list[bool] = []
+
+    def append_transcript_row(self, items: list, has_chapters: bool, has_transcript: bool) -> None:
+        """Hängt eine Zeile an; ``None``-Einträge in ``items`` bleiben leere Zellen."""
+        row = self.rowCount()
+        self._has_chapters.append(bool(has_chapters))
+        self._has_transcript.append(bool(has_transcript))
+        self.insertRow(row)
+        for column, item in enumerate(items):
+            if item is not None:
+                self.setItem(row, column, item)
+
+    def set_transcript_rows(self, rows: list[tuple[list, bool, bool]]) -> None:
+        """Ersetzt alle Zeilen durch ``(items, has_chapters, has_transcript)``-Tupel.
+
+        Die Zeilenanzahl wird einmalig per ``setRowCount`` gesetzt, anschließend werden die
+        Zellen per ``setItem`` befüllt, statt das Model mit jedem ``appendRow`` wachsen zu lassen.
+        """
+        self.removeRows(0, self.rowCount())
+        self._has_chapters = [bool(has_chapters) for _, has_chapters, _ in rows]
+        self._has_transcript = [bool(has_transcript) for _, _, has_transcript in rows]
+        self.setRowCount(len(rows))
+        for row, (items, _, _) in enumerate(rows):
+            for column, item in enumerate(items):
+                if item is not None:
+                    self.setItem(row, column, item)
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        removed = super().removeRows(row, count, parent)
+        if removed and not parent.isValid():
+            del self._has_chapters[row : row + count]
+            del self._has_transcript[row : row + count]
+        return removed
+
+    def has_transcript(self, row: int) -> bool:
+        """Gibt zurück, ob das Video in der Zeile transkribiert ist."""
+        return 0 <= row < len(self._has_transcript) and self._has_transcript[row]
+
+    def is_checked(self, row: int, column: int) -> bool:
+        """Gibt zurück, ob die Häkchen-Spalte ``column`` in der Zeile gesetzt ist."""
+        if column == self.CHAPTERS_COLUMN:
+            flags = self._has_chapters
+        elif column == self.TRANSCRIBED_COLUMN:
+            flags = self._has_transcript
+        else:
+            return False
+        return 0 <= row < len(flags) and flags[row]
+
+
+class SearchableProxy(QSortFilterProxyModel):
+    """Proxy-Model, das den Suchtext gegen einen vorab berechneten Suchschlüssel prüft.
+
+    Beim Aufbau der Zeile wird in Spalte 0 unter ``SEARCH_KEY_ROLE`` ein kleingeschriebener
+    String aus Titel, Video-ID, Kanal-Handle und Fehlergrund abgelegt, die Felder durch
+    Zeilenumbrüche getrennt. Der Filter ist damit ein einzelner Teilstring-Vergleich pro Zeile,
+    ohne Regex und ohne Zugriff auf weitere Spalten.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+
+    def setFilterFixedString(self, pattern: str) -> None:
+        """Setzt den Suchtext und wertet den Filter neu aus."""
+        self._needle = pattern.lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._needle:
+            return True
+        key = self.sourceModel().index(source_row, 0, source_parent).data(SEARCH_KEY_ROLE)
+        return bool(key) and self._needle in key
+
+
+class CheckMarkDelegate(QStyledItemDelegate):
+    """Delegate, das in den Häkchen-Spalten des ``TranscriptTableModel`` ein zentriertes Icon zeichnet.
+
+    Das Model liefert für diese Spalten keine Daten; nur die sichtbaren Zellen fragen hier
+    die Zeilen-Flags ab.
+    """
+
+    def __init__(self, check_icon, parent=None):
+        super().__init__(parent)
+        self._check_icon = check_icon
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        model = index.model()
+        if isinstance(model, QSortFilterProxyModel):
+            index = model.mapToSource(index)
+            model = index.model()
+        option.displayAlignment = Qt.AlignmentFlag.AlignCenter
+        option.decorationAlignment = Qt.AlignmentFlag.AlignCenter
+        if model.is_checked(index.row(), index.column()):
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+            option.icon = self._check_icon
+
+
 class HyperlinkDelegate(QStyledItemDelegate):
     """Delegate für die Darstellung und Interaktion von Hyperlinks in einer Tabelle."""
 
+    _LINK_ALIGNMENT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._color = QColor(0, 102, 204)  # Blau
+        # Unterstrichene Link-Schrift, einmalig aus der Zellschrift abgeleitet
+        self._font: QFont | None = None
+
     def paint(self, painter, option, index):
         url = index.data()
         if url and url.startswith("http"):
+            if self._font is None:
+                self._font = QFont(option.font)
+                self._font.setUnderline(True)
             painter.save()
-            color = QColor(0, 102, 204)  # Blau
-            font = option.font
-            font.setUnderline(True)
-            painter.setFont(font)
-            painter.setPen(color)
-            painter.drawText(option.rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, url)
+            painter.setFont(self._font)
+            painter.setPen(self._color)
+            painter.drawText(option.rect, self._LINK_ALIGNMENT, url)
             painter.restore()
         else:
             super().paint(painter, option, index)
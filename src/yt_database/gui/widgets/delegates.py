@@ -1,29 +1,87 @@
 """
 Delegates für spezielle Rendering-Aufgaben in Item-Views.
 
-Enthält einen RichTextHighlightDelegate, der Suchbegriffe im Text per HTML
-farblich hervorhebt und mittels QTextDocument rendert.
+Enthält einen RichTextHighlightDelegate, der Suchbegriffe im Text farblich hervorhebt.
+Einzeilige Texte werden direkt als QPainter-Textläufe gezeichnet, alles andere per HTML
+und QTextDocument.
 """
 
 import html
 import re
-from typing import Callable, List
+from collections import OrderedDict
+from typing import Callable, List, Optional
 
-from PySide6.QtCore import QRect, QRectF, Qt
-from PySide6.QtGui import QTextDocument
+from PySide6.QtCore import QRect, QRectF, Qt, SignalInstance, Slot
+from PySide6.QtGui import QAbstractTextDocumentLayout, QColor, QFont, QFontMetrics, QPalette, QTextDocument
 from PySide6.QtWidgets import QStyle, QStyledItemDelegate
 
+# Meta-Rolle: Models können darüber alle fürs Zeichnen benötigten Rollen mit einem data()-Aufruf
+# als Dict {Rolle: Wert} liefern; ohne Unterstützung fragt der Delegate die Rollen einzeln ab.
+MULTIPLE_ROLES_ROLE = Qt.ItemDataRole.UserRole + 100
+
 
 class RichTextHighlightDelegate(QStyledItemDelegate):
     """Rendert Item-Texte mit HTML und hebt gegebene Suchbegriffe hervor.
 
     search_terms_provider: Callable, die eine aktuelle Liste der Suchbegriffe liefert.
+    terms_signal: Alternativ ein Signal(list), das bei geänderten Suchbegriffen feuert; dann wird
+        beim Zeichnen kein Provider mehr abgefragt.
     """
 
-    def __init__(self, search_terms_provider: Callable[[], List[str]], highlight_color: str = "#FFFF00"):
+    # Maximale Anzahl zwischengespeicherter, fertig gelayouteter QTextDocuments
+    _MAX_CACHED_DOCUMENTS = 512
+
+    def __init__(
+        self,
+        search_terms_provider: Optional[Callable[[], List[str]]] = None,
+        highlight_color: str = "#FFFF00",
+        terms_signal: Optional[SignalInstance] = None,
+    ):
         super().__init__()
         self._get_terms = search_terms_provider
         self._highlight_color = highlight_color
+        self._highlight_qcolor = QColor(highlight_color)
+        self._highlight_text_color = QColor("#000")
+        # Stil der Treffer einmalig als CSS-Klasse, damit jeder Treffer nur <span class="hl"> erzeugt
+        self._style_sheet = f".hl {{ background-color: {highlight_color}; color: #000; font-weight: bold; }}"
+        # Kombiniertes Muster aller Suchbegriffe, neu kompiliert nur bei geänderten Begriffen
+        self._pattern_cache: tuple | None = None
+        self._compiled: re.Pattern | None = None
+        # Dasselbe Muster für unescapten Text (direktes Zeichnen ohne HTML)
+        self._compiled_plain: re.Pattern | None = None
+        # LRU-Cache (Text, Suchbegriffe, Breite) -> QTextDocument, damit Scrollen kein HTML neu parst
+        self._doc_cache: OrderedDict[tuple, QTextDocument] = OrderedDict()
+        if terms_signal is not None:
+            terms_signal.connect(self._on_terms_changed)
+
+    @Slot(list)
+    def _on_terms_changed(self, terms: list) -> None:
+        """Übernimmt neue Suchbegriffe aus dem ``terms_signal``."""
+        self._set_terms(terms)
+
+    def _update_terms(self) -> tuple:
+        """Liefert die aktuellen Suchbegriffe; ein Provider wird dabei abgefragt, ein Signal nicht.
+
+        Returns:
+            tuple: Die normalisierten Suchbegriffe (längste zuerst); leer, wenn keine vorhanden sind.
+        """
+        if self._get_terms is not None:
+            self._set_terms(self._get_terms() or [])
+        return self._pattern_cache or ()
+
+    def _set_terms(self, terms: list) -> None:
+        """Normalisiert die Suchbegriffe und kompiliert die Muster bei Änderungen neu."""
+        terms = [t for t in terms if t and t.strip()]
+        # Längste zuerst, um Überlappungen zu minimieren
+        key = tuple(sorted(set(terms), key=lambda t: (-len(t), t)))
+        if key != self._pattern_cache:
+            self._compiled = (
+                re.compile("|".join(re.escape(html.escape(t)) for t in key), re.IGNORECASE) if key else None
+            )
+            self._compiled_plain = re.compile("|".join(re.escape(t) for t in key), re.IGNORECASE) if key else None
+            self._pattern_cache = key
+            # Gecachte Dokumente enthalten die alte Hervorhebung
+            self._doc_cache.clear()
 
     def _build_highlighted_html(self, plain_text: str) -> str:
         """Erzeugt HTML mit markierten Begriffen. Escaped zunächst den Text."""
@@ -31,32 +89,41 @@ class RichTextHighlightDelegate(QStyledItemDelegate):
             return ""
 
         escaped = html.escape(plain_text)
-        terms = [t for t in (self._get_terms() or []) if t and t.strip()]
-        if not terms:
+        if not self._update_terms():
             return escaped
 
-        # Längste zuerst, um Überlappungen zu minimieren
-        terms_sorted = sorted(terms, key=len, reverse=True)
-
-        highlighted = escaped
-        for term in terms_sorted:
-            pattern = re.compile(re.escape(html.escape(term)), re.IGNORECASE)
-            highlighted = pattern.sub(
-                lambda m: f'<span style="background-color: {self._highlight_color}; color: #000; font-weight: bold;">{m.group()}</span>',
-                highlighted,
-            )
-
-        return highlighted
+        # Ein Durchlauf über alle Begriffe; Teilstücke werden gesammelt und einmal verbunden
+        parts = []
+        pos = 0
+        for match in self._compiled.finditer(escaped):
+            parts.append(escaped[pos : match.start()])
+            parts.append(f'<span class="hl">{match.group()}</span>')
+            pos = match.end()
+        parts.append(escaped[pos:])
+        return "".join(parts)
 
     def paint(self, painter, option, index):  # type: ignore[override]
+        # Ohne Suchbegriffe gibt es nichts hervorzuheben: natives Zeichnen ist deutlich günstiger als QTextDocument
+        if not self._update_terms():
+            super().paint(painter, option, index)
+            return
+
         # Hintergrund/Selektion zeichnen
         painter.save()
         if option.state & QStyle.StateFlag.State_Selected:
             painter.fillRect(option.rect, option.palette.highlight())
         painter.restore()
 
+        # Anzeigetext und Icon möglichst in einem einzigen data()-Aufruf holen
+        roles = index.data(MULTIPLE_ROLES_ROLE)
+        if isinstance(roles, dict):
+            value = roles.get(Qt.ItemDataRole.DisplayRole)
+            icon = roles.get(Qt.ItemDataRole.DecorationRole)
+        else:
+            value = index.data()
+            icon = index.data(Qt.ItemDataRole.DecorationRole)
+
         # Icon rendern, falls vorhanden
-        icon = index.data(Qt.ItemDataRole.DecorationRole)
         if icon is not None:
             from PySide6.QtGui import QIcon
 
@@ -77,16 +144,92 @@ class RichTextHighlightDelegate(QStyledItemDelegate):
             text_rect = option.rect.adjusted(4, 0, -4, 0)
 
         # Textinhalt und HTML-Hervorhebung
-        value = index.data()
         text = "" if value is None else str(value)
-        html = self._build_highlighted_html(text)
+        # Einzeilige Texte direkt als Textläufe zeichnen; QTextDocument nur für umbrechende Texte
+        if self._paint_runs(painter, option, text, text_rect):
+            return
+
+        doc = self._get_document(text, text_rect.width())
 
-        # QTextDocument vorbereiten und zeichnen
+        # Gecachtes bzw. neu erstelltes QTextDocument in der Textfarbe des Zellzustands zeichnen
+        context = QAbstractTextDocumentLayout.PaintContext()
+        context.palette.setColor(QPalette.ColorRole.Text, self._text_color(option))
+        context.clip = QRectF(0, 0, text_rect.width(), text_rect.height())
         painter.save()
-        doc = QTextDocument()
-        doc.setDocumentMargin(0)
-        doc.setHtml(html)
-        doc.setTextWidth(text_rect.width())
         painter.translate(text_rect.topLeft())
-        doc.drawContents(painter, QRectF(0, 0, text_rect.width(), text_rect.height()))
+        painter.setClipRect(context.clip)
+        doc.documentLayout().draw(painter, context)
         painter.restore()
+
+    @staticmethod
+    def _text_color(option) -> QColor:
+        """Textfarbe der Zelle: auf selektierten Zeilen die Kontrastfarbe zur Selektion."""
+        if option.state & QStyle.StateFlag.State_Selected:
+            return option.palette.highlightedText().color()
+        return option.palette.text().color()
+
+    def _paint_runs(self, painter, option, text: str, text_rect: QRect) -> bool:
+        """Zeichnet den Text als normale und hervorgehobene Läufe direkt mit dem QPainter.
+
+        Returns:
+            bool: ``False``, wenn der Text umbrechen müsste; dann zeichnet der Aufrufer per QTextDocument.
+        """
+        if "\n" in text:
+            return False
+
+        font = option.font
+        bold_font = QFont(font)
+        bold_font.setBold(True)
+        metrics = QFontMetrics(font)
+        bold_metrics = QFontMetrics(bold_font)
+
+        runs = []
+        pos = 0
+        for match in self._compiled_plain.finditer(text):
+            if match.start() > pos:
+                segment = text[pos : match.start()]
+                runs.append((segment, False, metrics.horizontalAdvance(segment)))
+            runs.append((match.group(), True, bold_metrics.horizontalAdvance(match.group())))
+            pos = match.end()
+        if pos < len(text):
+            runs.append((text[pos:], False, metrics.horizontalAdvance(text[pos:])))
+
+        if sum(width for _, _, width in runs) > text_rect.width():
+            return False
+
+        painter.save()
+        text_color = self._text_color(option)
+        x = text_rect.left()
+        top = text_rect.top()
+        height = max(metrics.height(), bold_metrics.height())
+        for segment, highlighted, width in runs:
+            run_rect = QRect(x, top, width, height)
+            if highlighted:
+                painter.fillRect(run_rect, self._highlight_qcolor)
+                painter.setFont(bold_font)
+                painter.setPen(self._highlight_text_color)
+            else:
+                painter.setFont(font)
+                painter.setPen(text_color)
+            painter.drawText(run_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, segment)
+            x += width
+        painter.restore()
+        return True
+
+    def _get_document(self, text: str, width: int) -> QTextDocument:
+        """Liefert das gelayoutete QTextDocument für Text und Breite, bei Bedarf neu erstellt."""
+        key = (text, self._update_terms(), width)
+        doc = self._doc_cache.get(key)
+        if doc is not None:
+            self._doc_cache.move_to_end(key)
+            return doc
+
+        doc = QTextDocument()
+        doc.setDocumentMargin(0)
+        doc.setDefaultStyleSheet(self._style_sheet)
+        doc.setHtml(self._build_highlighted_html(text))
+        doc.setTextWidth(width)
+        self._doc_cache[key] = doc
+        if len(self._doc_cache) > self._MAX_CACHED_DOCUMENTS:
+            self._doc_cache.popitem(last=False)
+        return doc
@@ -21,16 +21,16 @@ class DeleteConfirmationDialog(QDialog):
 
     def __init__(self, delete_type: str, preview_data: dict, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(f"{delete_type} löschen - Bestätigung erforderlich")
         self.setModal(True)
         self.setMinimumWidth(400)
 
         self.preview_data = preview_data
+        self._content_widget: QWidget | None = None
         self.setup_ui(delete_type)
 
     def setup_ui(self, delete_type: str):
         """Erstellt die UI-Elemente des Dialogs."""
-        layout = QVBoxLayout(self)
+        self._layout = QVBoxLayout(self)
 
         # Warnung Header
 
@@ -50,54 +50,72 @@ class DeleteConfirmationDialog(QDialog):
         warning_layout.addWidget(warning_text_label)
         warning_layout.addStretch()
 
-        layout.addWidget(warning_widget)
-
-        # Statistiken anzeigen
-        if self.preview_data.get("success"):
-            stats_widget = self._create_stats_widget(delete_type)
-            layout.addWidget(stats_widget)
-        else:
-            error_widget = QWidget()
-            error_layout = QHBoxLayout(error_widget)
-            error_layout.setContentsMargins(0, 0, 0, 0)
-
-            error_icon_label = QLabel()
-            error_icon = Icons.get(Icons.X_CIRCLE)
-            error_icon_label.setPixmap(error_icon.pixmap(16, 16))
-
-            error_text_label = QLabel(f"Fehler: {self.preview_data.get('error', 'Unbekannter Fehler')}")
-            error_text_label.setStyleSheet("color: red; padding: 10px;")
-
-            error_layout.addWidget(error_icon_label)
-            error_layout.addWidget(error_text_label)
-            error_layout.addStretch()
-
-            layout.addWidget(error_widget)
-
-            # Nur Abbrechen-Button bei Fehlern
-            button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Cancel)
-            button_box.rejected.connect(self.reject)
-            layout.addWidget(button_box)
-            return
+        self._layout.addWidget(warning_widget)
 
         # Bestätigungs-Checkbox
         self.confirm_checkbox = QCheckBox("Ich verstehe, dass diese Aktion nicht rückgängig gemacht werden kann")
         self.confirm_checkbox.setStyleSheet("font-weight: bold; margin: 10px;")
         self.confirm_checkbox.stateChanged.connect(self._on_checkbox_changed)
-        layout.addWidget(self.confirm_checkbox)
+        self._layout.addWidget(self.confirm_checkbox)
 
         # Buttons
         self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         self.button_box.accepted.connect(self.accept)
         self.button_box.rejected.connect(self.reject)
 
-        # OK-Button initial deaktiviert
         self.ok_button = self.button_box.button(QDialogButtonBox.StandardButton.Ok)
         self.ok_button.setText("Löschen")
         self.ok_button.setStyleSheet("color: red; font-weight: bold;")
+
+        self._layout.addWidget(self.button_box)
+
+        self.set_preview_data(delete_type, self.preview_data)
+
+    def set_preview_data(self, delete_type: str, preview_data: dict) -> None:
+        """Befüllt den Dialog mit neuen Statistiken; Header, Checkbox und Buttons bleiben bestehen.
+
+        Dadurch kann ein Dialog für mehrere Löschvorgänge wiederverwendet werden.
+        """
+        self.preview_data = preview_data
+        self.setWindowTitle(f"{delete_type} löschen - Bestätigung erforderlich")
+
+        # Nur den Statistik- bzw. Fehlerbereich neu aufbauen
+        if self._content_widget is not None:
+            self._layout.removeWidget(self._content_widget)
+            self._content_widget.deleteLater()
+
+        success = bool(preview_data.get("success"))
+        if success:
+            self._content_widget = self._create_stats_widget(delete_type)
+        else:
+            self._content_widget = self._create_error_widget()
+        self._layout.insertWidget(1, self._content_widget)
+
+        # Bei Fehlern nur Abbrechen anbieten
+        self.confirm_checkbox.setChecked(False)
+        self.confirm_checkbox.setVisible(success)
+        self.ok_button.setVisible(success)
+        # OK-Button initial deaktiviert
         self.ok_button.setEnabled(False)
 
-        layout.addWidget(self.button_box)
+    def _create_error_widget(self) -> QWidget:
+        """Erstellt das Widget mit der Fehlermeldung der Löschvorschau."""
+        error_widget = QWidget()
+        error_layout = QHBoxLayout(error_widget)
+        error_layout.setContentsMargins(0, 0, 0, 0)
+
+        error_icon_label = QLabel()
+        error_icon = Icons.get(Icons.X_CIRCLE)
+        error_icon_label.setPixmap(error_icon.pixmap(16, 16))
+
+        error_text_label = QLabel(f"Fehler: {self.preview_data.get('error', 'Unbekannter Fehler')}")
+        error_text_label.setStyleSheet("color: red; padding: 10px;")
+
+        error_layout.addWidget(error_icon_label)
+        error_layout.addWidget(error_text_label)
+        error_layout.addStretch()
+
+        return error_widget
 
     def _create_stats_widget(self, delete_type: str) -> QWidget:
         """Erstellt das Widget mit den Löschungsstatistiken."""
@@ -5,6 +5,8 @@ PEP8, Google-Style Docstring, Typisierung.
 
 from __future__ import annotations
 
+import re
+
 from loguru import logger  # noqa: F401
 from PySide6.QtCore import Signal, Slot
 from PySide6.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
@@ -24,6 +26,10 @@ class LogWidget(QWidget):
     }
     CONTEXT_COLOR = QColor("#00bcd4")  # Cyan
     DEFAULT_COLOR = QColor("#a9b7c6")  # Grau/Weiß
+    # "Zeit | Level | Kontext | Nachricht" in einem Durchlauf zerlegen, Leerraum gehört nicht zu den Feldern
+    _LINE_RE = re.compile(r"^\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*(.*?)\s*$", re.DOTALL)
+    # Ältere Zeilen werden von Qt automatisch verworfen
+    MAX_LOG_LINES = 5000
 
     # --- Signale ---
     log_received = Signal(str, str)  # level, message
@@ -48,12 +54,24 @@ class LogWidget(QWidget):
         self.log_text.setPlaceholderText("Hier werden farbige Logs angezeigt ...")
         self.log_text.setMinimumHeight(300)
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.MAX_LOG_LINES)
 
         # Font und Styling
         font = QFont("Courier", 10)
         self.log_text.setFont(font)
         self.log_text.setStyleSheet("background-color: #2b2b2b; color: #a9b7c6;")
 
+        # Textformate einmalig anlegen statt pro Log-Zeile
+        self._fmt_default = QTextCharFormat()
+        self._fmt_default.setForeground(self.DEFAULT_COLOR)
+        self._fmt_context = QTextCharFormat()
+        self._fmt_context.setForeground(self.CONTEXT_COLOR)
+        self._level_formats: dict[str, QTextCharFormat] = {}
+        for level_name, color in self.LEVEL_COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(color)
+            self._level_formats[level_name] = fmt
+
         self.clear_btn = QPushButton("Log löschen")
         self.clear_btn.setObjectName("log_widget_clear_btn")
 
@@ -77,40 +95,53 @@ class LogWidget(QWidget):
 
     def append_log(self, message: str, level: str = "INFO") -> None:
         """Färbt und fügt eine formatierte Log-Nachricht hinzu."""
-        segments = message.split("|", 3)
-        if len(segments) == 4:
-            time_str, level_str, context_str, msg_str = [s.strip() for s in segments]
+        cursor = self.log_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        # Ein Edit-Block fasst alle Einfügungen der Zeile zu einem Layout-Durchlauf zusammen
+        cursor.beginEditBlock()
+        self._insert_log_line(cursor, message, level)
+        cursor.endEditBlock()
+
+        self.log_text.setTextCursor(cursor)
+        self.log_text.ensureCursorVisible()
+
+    @Slot(list)
+    def append_log_batch(self, entries: list[tuple[str, str]]) -> None:
+        """Fügt mehrere Log-Nachrichten ``(message, level)`` in einem Durchlauf hinzu."""
+        if not entries:
+            return
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            cursor = self.log_text.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.beginEditBlock()
+            for message, level in entries:
+                self._insert_log_line(cursor, message, level)
+            cursor.endEditBlock()
+            self.log_text.setTextCursor(cursor)
+        finally:
+            self.log_text.setUpdatesEnabled(True)
+        self.log_text.ensureCursorVisible()
+
+    def _insert_log_line(self, cursor: QTextCursor, message: str, level: str) -> None:
+        """Schreibt eine Log-Zeile mit farbigem Level und Kontext an die Cursor-Position."""
+        match = self._LINE_RE.match(message)
+        if match:
+            time_str, level_str, context_str, msg_str = match.groups()
         else:
             # Fallback: alles grau
             time_str, level_str, context_str, msg_str = "", level, "", message
 
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-
+        fmt_default = self._fmt_default
         # Zeitstempel (grau/weiß)
-        fmt_time = QTextCharFormat()
-        fmt_time.setForeground(self.DEFAULT_COLOR)
-        cursor.insertText(f"{time_str} | ", fmt_time)
-
+        cursor.insertText(f"{time_str} | ", fmt_default)
         # Level (farbig)
-        fmt_level = QTextCharFormat()
-        fmt_level.setForeground(self.LEVEL_COLORS.get(level_str, self.DEFAULT_COLOR))
-        cursor.insertText(f"{level_str}", fmt_level)
-        cursor.insertText(" | ", fmt_time)
-
+        cursor.insertText(level_str, self._level_formats.get(level_str, fmt_default))
+        cursor.insertText(" | ", fmt_default)
         # Kontext (cyan)
-        fmt_context = QTextCharFormat()
-        fmt_context.setForeground(self.CONTEXT_COLOR)
-        cursor.insertText(f"{context_str}", fmt_context)
-        cursor.insertText(" | ", fmt_time)
-
+        cursor.insertText(context_str, self._fmt_context)
         # Nachricht (grau/weiß)
-        fmt_msg = QTextCharFormat()
-        fmt_msg.setForeground(self.DEFAULT_COLOR)
-        cursor.insertText(f"{msg_str}\n", fmt_msg)
-
-        self.log_text.setTextCursor(cursor)
-        self.log_text.ensureCursorVisible()
+        cursor.insertText(f" | {msg_str}\n", fmt_default)
 
     @Slot()
     def clear_log(self) -> None:
@@ -4,8 +4,17 @@ import subprocess
 import sys
 
 from loguru import logger
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QFileSystemModel, QHeaderView, QLineEdit, QMenu, QTreeView, QVBoxLayout, QWidget
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
+from PySide6.QtWidgets import (
+    QFileIconProvider,
+    QFileSystemModel,
+    QHeaderView,
+    QLineEdit,
+    QMenu,
+    QTreeView,
+    QVBoxLayout,
+    QWidget,
+)
 
 from yt_database.gui.widgets.text_file_editor_widget import TextFileEditorWidget
 
@@ -44,7 +53,13 @@ class ProjectTreeWidget(QWidget):
 
     def _setup_widgets(self, root_path: str) -> None:
         """Initialisiert alle UI-Komponenten und konfiguriert ihre statischen Eigenschaften."""
+        self._icon_provider = QFileIconProvider()
+        self._icon_provider.setOptions(QFileIconProvider.Option.DontUseCustomDirectoryIcons)
         self.model = QFileSystemModel(self)
+        self.model.setResolveSymlinks(False)
+        self.model.setReadOnly(True)
+        # Das Model übernimmt den Icon-Provider nicht, daher hält ihn das Widget
+        self.model.setIconProvider(self._icon_provider)
         self.model.setRootPath(root_path)
 
         self.tree = QTreeView(self)
@@ -67,6 +82,11 @@ class ProjectTreeWidget(QWidget):
         self.search.setPlaceholderText("Suche nach Datei- oder Ordnername...")
         self.search.setMaximumHeight(30)  # Begrenze die Höhe des Suchfelds
 
+        # Entprellt die Suche, damit nicht jeder Tastendruck den ganzen Baum durchläuft
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+
     def _setup_layouts(self) -> None:
         """Ordnet die initialisierten Widgets in Layouts an."""
         layout = QVBoxLayout(self)
@@ -80,7 +100,8 @@ class ProjectTreeWidget(QWidget):
 
     def _setup_signals(self) -> None:
         """Verbindet die Signale der permanenten Widgets mit ihren Slots."""
-        self.search.textChanged.connect(self.on_search)
+        self.search.textChanged.connect(self._search_timer.start)
+        self._search_timer.timeout.connect(self._on_search_timer_timeout)
         self.tree.doubleClicked.connect(self.on_double_click)
         self.tree.customContextMenuRequested.connect(self.show_context_menu)
 
@@ -135,44 +156,53 @@ class ProjectTreeWidget(QWidget):
         logger.debug("Öffne Datei im Editor-Fenster: {}", file_path)
         editor = TextFileEditorWidget()
         editor.setWindowTitle(file_path)
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            editor._content = content
-            editor._file_path = file_path
-            editor.text_edit.setPlainText(content)
-        except Exception as e:
-            logger.error(f"Fehler beim Öffnen der Datei im Editor-Fenster: {e}")
+        # Fenster sofort zeigen, der Inhalt wird im Hintergrund nachgeladen
+        editor.load_file_async(file_path)
         editor.show_as_window()
 
     # --- Event-Handler ---
+    @Slot()
+    def _on_search_timer_timeout(self) -> None:
+        self.on_search(self.search.text())
+
     def on_search(self, text: str):
         """
-        Sucht rekursiv nach Dateien/Ordnern, die den Suchtext enthalten.
+        Sucht iterativ (Tiefensuche mit explizitem Stack) nach Dateien/Ordnern, die den Suchtext enthalten.
+
+        Alle Treffer werden aufgeklappt; nur zum ersten Treffer wird gescrollt und er wird ausgewählt.
         """
         logger.debug("ProjectTreeWidget: Suche nach '{}'.", text)
         text = text.strip().lower()
         model = self.model
         tree = self.tree
-        root = model.index(model.rootPath())
-
-        def match_recursive(parent):
-            for row in range(model.rowCount(parent)):
-                idx = model.index(row, 0, parent)
-                if not idx.isValid():
-                    continue
-                name = model.fileName(idx).lower()
-                # Ich expandiere und scrolle zu jedem Treffer, damit der Nutzer sofort sieht, wo das Ergebnis liegt.
-                if text and text in name:
-                    tree.expand(idx)
-                    tree.scrollTo(idx)
-                    tree.setCurrentIndex(idx)
-                if model.isDir(idx):
-                    match_recursive(idx)
+        root = tree.rootIndex()
 
         tree.collapseAll()
-        if text:
-            match_recursive(root)
+        if not text:
+            return
+
+        first_match = None
+        # Kinder in umgekehrter Reihenfolge ablegen, damit die Einträge in Anzeigereihenfolge besucht werden
+        stack = [model.index(row, 0, root) for row in reversed(range(model.rowCount(root)))]
+        while stack:
+            idx = stack.pop()
+            if not idx.isValid():
+                continue
+            if text in model.fileName(idx).lower():
+                # Treffer und seine Elternordner aufklappen, damit der Nutzer sieht, wo das Ergebnis liegt
+                tree.expand(idx)
+                ancestor = idx.parent()
+                while ancestor.isValid() and ancestor != root:
+                    tree.expand(ancestor)
+                    ancestor = ancestor.parent()
+                if first_match is None:
+                    first_match = idx
+            if model.isDir(idx):
+                stack.extend(model.index(row, 0, idx) for row in reversed(range(model.rowCount(idx))))
+
+        if first_match is not None:
+            tree.scrollTo(first_match)
+            tree.setCurrentIndex(first_match)
 
     def on_double_click(self, index):
         """Signalisiert, ob ein Ordner oder eine Datei doppelt angeklickt wurde."""
@@ -1,9 +1,11 @@
 # search_info_panel.py – fixed: keine Layouts in _setup_widgets
 
-from typing import Optional, List, Tuple
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QFrame, QLabel, QScrollArea, QWidget, QPushButton, QTextEdit, QVBoxLayout
-from yt_database.models.search_strategy import SearchStrategy, SEARCH_STRATEGIES
+from typing import Optional
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QShowEvent
+from PySide6.QtWidgets import QFrame, QLabel, QScrollArea, QVBoxLayout
+from yt_database.gui.widgets.search_strategy_cards_view import SearchStrategyCardsView
+from yt_database.models.search_strategy import SearchStrategy, build_fts_query
 
 
 class SearchInfoPanel(QFrame):
@@ -15,13 +17,12 @@ class SearchInfoPanel(QFrame):
 
         self.scroll_area: Optional[QScrollArea] = None
 
-        self._strategy_card_parts: List[Tuple[QFrame, QPushButton, QLabel, QLabel]] = []
-
-        self._strategy_buttons: List[Tuple[QPushButton, SearchStrategy]] = []
-
         self._current_query = ""
+        self._current_strategy = SearchStrategy.AUTO
+        self._last_display_text = ""
 
-        self._setup_ui()
+        # Widgets und Layouts entstehen erst beim ersten Anzeigen
+        self._built = False
 
     # Orchestrierung
     def _setup_ui(self):
@@ -29,6 +30,14 @@ class SearchInfoPanel(QFrame):
         self._setup_layouts()
         self._setup_signals()
 
+    def showEvent(self, event: QShowEvent) -> None:
+        if not self._built:
+            self._setup_ui()
+            self._built = True
+            if self._current_query:
+                self._preview_timer.start(0)
+        super().showEvent(event)
+
     # ---------------- Widgets (KEINE LAYOUTS!) ----------------
     def _setup_widgets(self):
         self.title_label = QLabel("Suchstrategien", self)
@@ -37,47 +46,37 @@ class SearchInfoPanel(QFrame):
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
-        self.strategies_widget = QWidget(self)
-
-        # Karten-Widgets „roh“ erstellen (nur Widgets, keine addWidget-Aufrufe)
-        self._strategy_card_parts.clear()
-        self._strategy_buttons.clear()
-        for info in SEARCH_STRATEGIES:
-            card = QFrame(self.strategies_widget)
-            name_btn = QPushButton(info.display_name, card)
-            desc_lbl = QLabel(info.description, card)
-            desc_lbl.setWordWrap(True)
-            example_lbl = QLabel(f"Beispiel: {info.example}", card)
-            example_lbl.setWordWrap(True)
-            self._strategy_card_parts.append((card, name_btn, desc_lbl, example_lbl))
-            self._strategy_buttons.append((name_btn, info.strategy))
+        # Gemeinsame Kartenansicht (auch im SearchStrategyInfoWindow verwendet)
+        self.strategies_widget = SearchStrategyCardsView(self)
 
         self.query_title = QLabel("Generierte FTS5-Query:", self)
-        self.query_display = QTextEdit(self)
-        self.query_display.setReadOnly(True)
-        self.query_display.setPlainText("Gib einen Suchbegriff ein, um die generierte Query zu sehen...")
+        self.query_display = QLabel(self)
+        self.query_display.setTextFormat(Qt.TextFormat.PlainText)
+        self.query_display.setWordWrap(True)
+        # Lange Queries dürfen das Layout nicht aufblähen, wie zuvor beim QTextEdit
+        self.query_display.setMaximumHeight(120)
+        self.query_display.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.query_display.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self._last_display_text = "Gib einen Suchbegriff ein, um die generierte Query zu sehen..."
+        self.query_display.setText(self._last_display_text)
+
+        # Debounce: die Vorschau wird erst nach einer Tipp-Pause neu gesetzt
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
 
     # ---------------- Layouts (ALLE Layout-Operationen hier!) ----------------
     def _setup_layouts(self):
-        main = QVBoxLayout(self)
+        # Idempotent: ein vorhandenes Hauptlayout wird geleert statt ein zweites anzulegen
+        main = self.layout()
+        if main is None:
+            main = QVBoxLayout(self)
+        else:
+            while main.count():
+                main.takeAt(0)
         main.setContentsMargins(12, 12, 12, 12)
         main.setSpacing(8)
 
         # Scroll-Inhalt layouten
-        container_layout = QVBoxLayout(self.strategies_widget)
-        container_layout.setContentsMargins(0, 0, 0, 0)
-        container_layout.setSpacing(12)
-
-        for card, name_btn, desc_lbl, example_lbl in self._strategy_card_parts:
-            card_layout = QVBoxLayout(card)
-            card_layout.setContentsMargins(8, 8, 8, 8)
-            card_layout.setSpacing(4)
-            card_layout.addWidget(name_btn)
-            card_layout.addWidget(desc_lbl)
-            card_layout.addWidget(example_lbl)
-            container_layout.addWidget(card)
-
-        container_layout.addStretch()
         if self.scroll_area is not None:
             self.scroll_area.setWidget(self.strategies_widget)
 
@@ -90,31 +89,30 @@ class SearchInfoPanel(QFrame):
 
     # ---------------- Signale ----------------
     def _setup_signals(self):
-        for btn, strategy in self._strategy_buttons:
-            btn.clicked.connect(lambda _, s=strategy: self.strategy_selected.emit(s))
+        self._preview_timer.timeout.connect(self._flush_preview)
+        self.strategies_widget.strategy_selected.connect(self.strategy_selected)
 
     # --------- Öffentliche API & Logik (unverändert) ---------
     def update_query_preview(self, query: str, strategy: SearchStrategy):
+        # Unveränderte Eingabe: Timer nicht erneut starten
+        if query == self._current_query and strategy == self._current_strategy:
+            return
         self._current_query = query
-        if not query or not query.strip():
-            self.query_display.setPlainText("Gib einen Suchbegriff ein, um die generierte Query zu sehen...")
+        self._current_strategy = strategy
+        if not self._built:
             return
-        words = query.strip().split()
-        if strategy == SearchStrategy.EXACT_PHRASE:
-            generated_query = f'"{query.strip()}"'
-        elif strategy == SearchStrategy.ALL_WORDS:
-            generated_query = " AND ".join(f"{w}*" for w in words) if len(words) > 1 else words[0]
-        elif strategy == SearchStrategy.ANY_WORD:
-            generated_query = " OR ".join(f"{w}*" for w in words)
-        elif strategy == SearchStrategy.FUZZY:
-            generated_query = " OR ".join((f"{w}*" if len(w) > 3 else w) for w in words)
-        else:  # AUTO
-            generated_query = (
-                f"{query.strip()}*"
-                if len(words) == 1
-                else f'("{query.strip()}") OR (' + " AND ".join(f"{w}*" for w in words) + ")"
-            )
+        self._preview_timer.start(150)
 
-        self.query_display.setPlainText(
-            f"Strategie: {strategy.name}\nEingabe: '{query}'\nFTS5-Query: {generated_query}"
-        )
+    def _flush_preview(self):
+        query = self._current_query
+        strategy = self._current_strategy
+        if not query or not query.strip():
+            display_text = "Gib einen Suchbegriff ein, um die generierte Query zu sehen..."
+        else:
+            display_text = (
+                f"Strategie: {strategy.name}\nEingabe: '{query}'\nFTS5-Query: {build_fts_query(query, strategy)}"
+            )
+        # Label nur neu befüllen, wenn sich der Text tatsächlich geändert hat
+        if display_text != self._last_display_text:
+            self._last_display_text = display_text
+            self.query_display.setText(display_text)
@@ -0,0 +1,157 @@
+"""
+Gemeinsame Kartenansicht der Suchstrategien.
+
+Wird sowohl im SearchStrategyInfoWindow als auch im SearchInfoPanel eingebettet, damit beide
+dieselben Karten (Name, Auswahl-Button, Beschreibung, Beispiel) verwenden.
+"""
+
+from PySide6.QtCore import QTimer, Signal
+from PySide6.QtGui import QResizeEvent
+from PySide6.QtWidgets import QGridLayout, QLabel, QPushButton, QWidget
+
+from yt_database.models.search_strategy import SEARCH_STRATEGIES, SearchStrategy
+
+# Einmal auf der Kartenansicht gesetzt statt Rahmen und Styles pro Karte zu konfigurieren
+_CARDS_STYLE_SHEET = """
+QLabel#strategy_name {
+    font-weight: bold;
+    padding-top: 6px;
+    border-top: 1px solid palette(mid);
+}
+QLabel[role="example_label"] {
+    font-style: italic;
+}
+QLabel[role="example_text"] {
+    color: palette(dark);
+    padding-left: 8px;
+}
+"""
+
+
+class SearchStrategyCardsView(QWidget):
+    """Zeigt alle Suchstrategien in einem gemeinsamen Grid an."""
+
+    # --------------------
+    # Initialisierung
+    # --------------------
+    strategy_selected = Signal(SearchStrategy)  # Signal wenn Benutzer eine Strategie auswählt
+
+    def __init__(self, parent=None):
+        """Initialisiert die Kartenansicht."""
+        super().__init__(parent)
+        self.setObjectName("strategy_cards_view")
+
+        self.strategy_cards: list[tuple[QLabel, QPushButton, QLabel, QLabel, QLabel]] = []
+        self._button_strategies: dict[QPushButton, SearchStrategy] = {}
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """Initialisiert die UI durch Aufruf der Helper-Methoden."""
+        # Karten gesammelt aufbauen: Geometrie und Repaint erst nach dem letzten addWidget
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self._setup_widgets()
+            self._setup_layouts()
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        self._setup_signals()
+        self._setup_styles()
+
+    def _setup_widgets(self):
+        """Instanziiert die Widgets aller Strategie-Karten."""
+        for strategy_info in SEARCH_STRATEGIES:
+            card = self._create_strategy_card(strategy_info)
+            self.strategy_cards.append(card)
+            self._button_strategies[card[1]] = strategy_info.strategy
+
+        # Word-Wrap nur für Labels, die nicht in eine Zeile passen; nach Resize entprellt neu prüfen
+        self._wrap_timer = QTimer(self)
+        self._wrap_timer.setSingleShot(True)
+
+    def _setup_layouts(self):
+        """Platziert alle Karten in einem einzigen Grid: 4 Zeilen je Strategie plus Abstand."""
+        self.container_layout = QGridLayout(self)
+        self.container_layout.setVerticalSpacing(4)
+        self.container_layout.setColumnStretch(0, 1)
+        row = 0
+        for name_label, select_button, description, example_label, example_text in self.strategy_cards:
+            self.container_layout.addWidget(name_label, row, 0)
+            self.container_layout.addWidget(select_button, row, 1)
+            self.container_layout.addWidget(description, row + 1, 0, 1, 2)
+            self.container_layout.addWidget(example_label, row + 2, 0, 1, 2)
+            self.container_layout.addWidget(example_text, row + 3, 0, 1, 2)
+            # Abstand zur nächsten Strategie
+            self.container_layout.setRowMinimumHeight(row + 4, 12)
+            row += 5
+        self.container_layout.setRowStretch(row, 1)
+
+    def _setup_signals(self):
+        """Verbindet alle permanenten Signal-Slot-Verbindungen."""
+        # Ein gemeinsamer Slot für alle Auswahl-Buttons statt einer Lambda pro Karte
+        for select_button in self._button_strategies:
+            select_button.clicked.connect(self._on_select_button_clicked)
+        self._wrap_timer.timeout.connect(self._update_word_wrap)
+
+    def _setup_styles(self):
+        """Setzt das gemeinsame Stylesheet für alle Karten."""
+        self.setStyleSheet(_CARDS_STYLE_SHEET)
+
+    # --------------------
+    # Event-Handler
+    # --------------------
+    def showEvent(self, event) -> None:
+        """Prüft den Umbruch der Labels beim Anzeigen."""
+        self._update_word_wrap()
+        super().showEvent(event)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Prüft den Umbruch der Labels nach einer Größenänderung (entprellt)."""
+        super().resizeEvent(event)
+        self._wrap_timer.start(100)
+
+    def _on_select_button_clicked(self):
+        """Ermittelt die Strategie des geklickten Auswahl-Buttons."""
+        strategy = self._button_strategies.get(self.sender())
+        if strategy is not None:
+            self.strategy_selected.emit(strategy)
+
+    # --------------------
+    # Hilfsmethoden
+    # --------------------
+    def _create_strategy_card(self, strategy_info) -> tuple:
+        """Erstellt die Widgets für eine einzelne Strategie (Name, Button, Beschreibung, Beispiel)."""
+        # Strategie-Name
+        name_label = QLabel(strategy_info.display_name, self)
+        name_label.setObjectName("strategy_name")
+
+        # Auswahl-Button
+        select_button = QPushButton("Auswählen", self)
+        select_button.setObjectName("select_button")
+
+        # Beschreibung
+        description = QLabel(strategy_info.description, self)
+        description.setObjectName("strategy_description")
+
+        # Beispiel: beide Labels direkt im Grid, gestylt über die role-Property statt eines eigenen Frames
+        example_label = QLabel("Beispiel:", self)
+        example_label.setObjectName("example_label")
+        example_label.setProperty("role", "example_label")
+
+        example_text = QLabel(strategy_info.example, self)
+        example_text.setObjectName("example_text")
+        example_text.setProperty("role", "example_text")
+
+        return name_label, select_button, description, example_label, example_text
+
+    def _update_word_wrap(self):
+        """Aktiviert den Umbruch nur für Labels, die breiter als der sichtbare Bereich sind."""
+        # In einer QScrollArea ist der Viewport maßgeblich, nicht die eigene (ggf. breitere) Größe
+        available = (self.parentWidget() or self).width() - 40
+        for _, _, description, _, example_text in self.strategy_cards:
+            for label in (description, example_text):
+                wrap = label.fontMetrics().horizontalAdvance(label.text()) > available
+                if label.wordWrap() != wrap:
+                    label.setWordWrap(wrap)
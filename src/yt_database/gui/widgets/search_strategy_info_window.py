@@ -6,6 +6,7 @@ verfügbaren Suchstrategien mit Live-Query-Vorschau bietet.
 """
 
 from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtGui import QShowEvent
 from PySide6.QtWidgets import (
     QDialog,
     QFrame,
@@ -13,13 +14,32 @@ from PySide6.QtWidgets import (
     QLabel,
     QScrollArea,
     QVBoxLayout,
-    QWidget,
     QPushButton,
-    QTextEdit,
     QGroupBox,
 )
 
-from yt_database.models.search_strategy import SearchStrategy, SEARCH_STRATEGIES
+from yt_database.gui.widgets.search_strategy_cards_view import SearchStrategyCardsView
+from yt_database.models.search_strategy import (
+    SEARCH_STRATEGIES_BY_KEY,
+    SearchStrategy,
+    build_fts_query,
+)
+
+# Erklärungstexte je Strategie für die Query-Vorschau
+_STRATEGY_EXPLANATIONS: dict[SearchStrategy, str] = {
+    SearchStrategy.AUTO: "Intelligente Auswahl: Versucht sowohl exakte Phrasen als auch AND-Verknüpfung",
+    SearchStrategy.EXACT_PHRASE: "Sucht nach der kompletten Eingabe als zusammenhängender Text",
+    SearchStrategy.ALL_WORDS: "Alle Wörter müssen im Text vorkommen (AND-Verknüpfung mit Wildcards)",
+    SearchStrategy.ANY_WORD: "Mindestens eines der Wörter muss vorkommen (OR-Verknüpfung)",
+    SearchStrategy.FUZZY: "Unscharfe Suche mit Wildcards für längere Wörter (>3 Zeichen)",
+}
+
+# Fester Aufbau der Query-Vorschau; format einmal gebunden statt fünf Teilstrings pro Update
+_DISPLAY_TEMPLATE = (
+    "Eingabe: {query}\nStrategie: {strategy_name}\nGenerierte FTS5-Query:\n{generated_query}\n\n"
+    "Erklärung: {explanation}"
+)
+_FORMAT_DISPLAY = _DISPLAY_TEMPLATE.format
 
 
 class SearchStrategyInfoWindow(QDialog):
@@ -35,20 +55,22 @@ class SearchStrategyInfoWindow(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Suchstrategien & Query-Hilfe")
         self.setObjectName("search_strategy_info_window")
-        self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.WindowStaysOnTopHint)
+        # Kein WindowStaysOnTopHint: show_and_raise() holt das Fenster bei Bedarf nach vorne
+        self.setWindowFlags(Qt.WindowType.Window)
         self.setModal(False)  # Nicht-modal
         self.resize(500, 700)
 
         # Aktueller Query-Status
         self._current_query = ""
         self._current_strategy = SearchStrategy.AUTO
+        self._last_rendered = ""
 
         # Auto-Update Timer für bessere Performance
         self._update_timer = QTimer()
         self._update_timer.setSingleShot(True)
 
-        self._setup_ui()
-        self._setup_styles()
+        # Die UI wird erst beim ersten Anzeigen aufgebaut, da das Fenster oft nie geöffnet wird
+        self._built = False
 
     def _setup_ui(self):
         """Initialisiert die UI durch Aufruf der Helper-Methoden."""
@@ -78,11 +100,17 @@ class SearchStrategyInfoWindow(QDialog):
         self.preview_layout = QVBoxLayout(self.preview_group)
         self.current_status = QLabel("Gib in der Suche einen Begriff ein...")
         self.current_status.setObjectName("query_status")
-        self.query_display = QTextEdit()
+        # Reiner Text ohne QTextDocument-Pipeline; markierbar zum Kopieren der Query
+        self.query_display = QLabel()
         self.query_display.setObjectName("query_display")
-        self.query_display.setReadOnly(True)
+        self.query_display.setTextFormat(Qt.TextFormat.PlainText)
+        self.query_display.setWordWrap(True)
+        # Lange Queries dürfen das Layout nicht aufblähen, wie zuvor beim QTextEdit
         self.query_display.setMaximumHeight(120)
-        self.query_display.setPlainText("Keine aktive Suche")
+        self.query_display.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.query_display.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self._last_rendered = "Keine aktive Suche"
+        self.query_display.setText(self._last_rendered)
 
         # Strategien-Übersicht
         self.strategies_group = QGroupBox("Verfügbare Strategien")
@@ -90,15 +118,7 @@ class SearchStrategyInfoWindow(QDialog):
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.strategies_container = QWidget()
-        self.container_layout = QVBoxLayout(self.strategies_container)
-        self.container_layout.setSpacing(12)
-        self.strategy_cards = []
-        for strategy_info in SEARCH_STRATEGIES:
-            card = self._create_strategy_card(strategy_info)
-            self.strategy_cards.append(card)
-            self.container_layout.addWidget(card)
-        self.container_layout.addStretch()
+        self.strategies_container = SearchStrategyCardsView()
         self.scroll_area.setWidget(self.strategies_container)
 
         # Footer
@@ -107,8 +127,23 @@ class SearchStrategyInfoWindow(QDialog):
         self.close_button.setObjectName("close_button")
 
     def _setup_layouts(self):
-        """Fügt die Komponenten in die Layouts ein und setzt das Hauptlayout."""
-        self.main_layout = QVBoxLayout(self)
+        """Fügt die Komponenten in die Layouts ein und setzt das Hauptlayout.
+
+        Darf erneut aufgerufen werden: Haupt- und Teillayouts werden vorher geleert und neu befüllt,
+        da Qt kein zweites Layout auf demselben Widget zulässt. _setup_widgets und _setup_signals
+        sind dagegen nur für den einmaligen Aufbau gedacht.
+        """
+        existing = self.layout()
+        self.main_layout = QVBoxLayout(self) if existing is None else existing
+        for layout in (
+            self.main_layout,
+            self.header_layout,
+            self.preview_layout,
+            self.strategies_layout,
+            self.footer_layout,
+        ):
+            while layout.count():
+                layout.takeAt(0)
         self.main_layout.setContentsMargins(16, 16, 16, 16)
         self.main_layout.setSpacing(16)
 
@@ -135,10 +170,21 @@ class SearchStrategyInfoWindow(QDialog):
         """Verbindet alle permanenten Signal-Slot-Verbindungen."""
         self._update_timer.timeout.connect(self._perform_query_update)
         self.close_button.clicked.connect(self.close)
+        self.strategies_container.strategy_selected.connect(self._on_strategy_selected)
 
     def _setup_styles(self):
         """Definiert die Styles für das Fenster."""
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Baut die UI beim ersten Anzeigen auf und holt eine vorgemerkte Vorschau nach."""
+        if not self._built:
+            self._setup_ui()
+            self._setup_styles()
+            self._built = True
+            if self._current_query:
+                self._update_timer.start(0)
+        super().showEvent(event)
+
     # --------------------
     # Öffentliche Methoden
     # --------------------
@@ -150,11 +196,15 @@ class SearchStrategyInfoWindow(QDialog):
 
     def update_query_preview(self, query: str, strategy: SearchStrategy):
         """Aktualisiert die Query-Vorschau (mit Debouncing)."""
+        # Mehrfach ausgelöste Signale mit unveränderter Eingabe starten den Timer nicht neu
+        if query == self._current_query and strategy == self._current_strategy:
+            return
         self._current_query = query
         self._current_strategy = strategy
+        if not self._built:
+            return
 
-        # Debounce die Updates für bessere Performance
-        self._update_timer.stop()
+        # Debounce die Updates für bessere Performance (start() setzt einen laufenden Timer zurück)
         self._update_timer.start(200)  # 200ms Verzögerung
 
     # --------------------
@@ -174,11 +224,11 @@ class SearchStrategyInfoWindow(QDialog):
 
         if not query or not query.strip():
             self.current_status.setText("Gib in der Suche einen Begriff ein...")
-            self.query_display.setPlainText("Keine aktive Suche")
+            self._render_query_display("Keine aktive Suche")
             return
 
         # Status aktualisieren
-        strategy_info = next((s for s in SEARCH_STRATEGIES if s.strategy == strategy), None)
+        strategy_info = SEARCH_STRATEGIES_BY_KEY.get(strategy)
         strategy_name = strategy_info.display_name if strategy_info else str(strategy)
 
         self.current_status.setText(f"Aktuelle Suche: '{query}' mit {strategy_name}")
@@ -186,109 +236,27 @@ class SearchStrategyInfoWindow(QDialog):
         # Query generieren und anzeigen
         generated_query = self._simulate_fts_query(query.strip(), strategy)
 
-        display_text = f"Eingabe: {query}\n"
-        display_text += f"Strategie: {strategy_name}\n"
-        display_text += f"Generierte FTS5-Query:\n{generated_query}\n\n"
-
-        # Erklärung hinzufügen
-        explanation = self._get_strategy_explanation(strategy)
-        display_text += f"Erklärung: {explanation}"
+        display_text = _FORMAT_DISPLAY(
+            query=query,
+            strategy_name=strategy_name,
+            generated_query=generated_query,
+            explanation=self._get_strategy_explanation(strategy),
+        )
+        self._render_query_display(display_text)
 
-        self.query_display.setPlainText(display_text)
+    def _render_query_display(self, display_text: str):
+        """Setzt den Vorschautext nur, wenn er sich vom zuletzt angezeigten unterscheidet."""
+        if display_text != self._last_rendered:
+            self._last_rendered = display_text
+            self.query_display.setText(display_text)
 
     # --------------------
     # Hilfsmethoden
     # --------------------
-    def _create_strategy_card(self, strategy_info) -> QWidget:
-        """Erstellt eine Karte für eine einzelne Strategie."""
-        card = QFrame()
-        card.setObjectName("strategy_card")
-        card.setFrameStyle(QFrame.Shape.StyledPanel)
-
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(8)
-
-        # Header mit Name und Button
-        header_layout = QHBoxLayout()
-
-        # Strategie-Name
-        name_label = QLabel(strategy_info.display_name)
-        name_label.setObjectName("strategy_name")
-        header_layout.addWidget(name_label)
-
-        header_layout.addStretch()
-
-        # Auswahl-Button
-        select_button = QPushButton("Auswählen")
-        select_button.setObjectName("select_button")
-        select_button.clicked.connect(lambda: self._on_strategy_selected(strategy_info.strategy))
-        header_layout.addWidget(select_button)
-
-        layout.addLayout(header_layout)
-
-        # Beschreibung
-        description = QLabel(strategy_info.description)
-        description.setObjectName("strategy_description")
-        description.setWordWrap(True)
-        layout.addWidget(description)
-
-        # Beispiel
-        example_frame = QFrame()
-        example_frame.setObjectName("example_frame")
-        example_layout = QVBoxLayout(example_frame)
-        example_layout.setContentsMargins(8, 8, 8, 8)
-
-        example_label = QLabel("Beispiel:")
-        example_label.setObjectName("example_label")
-        example_layout.addWidget(example_label)
-
-        example_text = QLabel(strategy_info.example)
-        example_text.setObjectName("example_text")
-        example_text.setWordWrap(True)
-        example_layout.addWidget(example_text)
-
-        layout.addWidget(example_frame)
-
-        return card
-
     def _simulate_fts_query(self, query: str, strategy: SearchStrategy) -> str:
         """Simuliert die FTS5-Query-Generierung."""
-        words = query.split()
-
-        if strategy == SearchStrategy.EXACT_PHRASE:
-            return f'"{query}"'
-        elif strategy == SearchStrategy.ALL_WORDS:
-            if len(words) == 1:
-                return query
-            return " AND ".join(f"{word}*" for word in words)
-        elif strategy == SearchStrategy.ANY_WORD:
-            return " OR ".join(f"{word}*" for word in words)
-        elif strategy == SearchStrategy.FUZZY:
-            fuzzy_words = []
-            for word in words:
-                if len(word) > 3:
-                    fuzzy_words.append(f"{word}*")
-                else:
-                    fuzzy_words.append(word)
-            return " OR ".join(fuzzy_words)
-        elif strategy == SearchStrategy.AUTO:
-            if len(words) == 1:
-                return f"{query}*"
-            else:
-                exact_phrase = f'"{query}"'
-                all_words = " AND ".join(f"{word}*" for word in words)
-                return f"({exact_phrase}) OR ({all_words})"
-        else:
-            return query
+        return build_fts_query(query, strategy)
 
     def _get_strategy_explanation(self, strategy: SearchStrategy) -> str:
         """Gibt eine Erklärung der Strategie zurück."""
-        explanations = {
-            SearchStrategy.AUTO: "Intelligente Auswahl: Versucht sowohl exakte Phrasen als auch AND-Verknüpfung",
-            SearchStrategy.EXACT_PHRASE: "Sucht nach der kompletten Eingabe als zusammenhängender Text",
-            SearchStrategy.ALL_WORDS: "Alle Wörter müssen im Text vorkommen (AND-Verknüpfung mit Wildcards)",
-            SearchStrategy.ANY_WORD: "Mindestens eines der Wörter muss vorkommen (OR-Verknüpfung)",
-            SearchStrategy.FUZZY: "Unscharfe Suche mit Wildcards für längere Wörter (>3 Zeichen)",
-        }
-        return explanations.get(strategy, "Unbekannte Strategie")
+        return _STRATEGY_EXPLANATIONS.get(strategy, "Unbekannte Strategie")
@@ -5,11 +5,24 @@ Dieses Widget kombiniert ein TreeView (oben) für hierarchische Suchergebnisse m
 TableView (unten) für detaillierte Zeitstempel-Anzeige des ausgewählten Videos.
 """
 
-from typing import List
+import re
+from typing import List, Optional
 
 from loguru import logger
-from PySide6.QtCore import Qt, QUrl, Signal, Slot
-from PySide6.QtGui import QDesktopServices, QStandardItem, QStandardItemModel
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QDesktopServices, QIcon
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QHeaderView,
@@ -21,16 +34,167 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from yt_database.database import Chapter, Transcript, db
 from yt_database.gui.utils.icons import Icons
-from yt_database.gui.widgets.delegates import RichTextHighlightDelegate
-from yt_database.gui.widgets.search_widget_tree import SearchWidgetTree
+from yt_database.gui.widgets.delegates import MULTIPLE_ROLES_ROLE, RichTextHighlightDelegate
+from yt_database.gui.widgets.search_widget_tree import VIDEO_ID_ROLE, SearchWidgetTree
 from yt_database.models.search_models import SearchResult
+from yt_database.models.search_strategy import SearchStrategy
+
+# Ab dieser Kapitelanzahl zeichnet die Tabelle keine alternierenden Zeilenfarben mehr
+_ALTERNATING_ROWS_LIMIT = 500
+
+
+def _format_seconds_to_time(seconds: int) -> str:
+    """Formatiert Sekunden zu einer lesbaren Zeitangabe (MM:SS bzw. HH:MM:SS)."""
+    hours = seconds // 3600
+    rest = seconds - hours * 3600
+    minutes = rest // 60
+    secs = rest - minutes * 60
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
+
+
+class _ChapterLoadSignals(QObject):
+    """Signale des Kapitel-Ladevorgangs im Thread-Pool (QRunnable ist kein QObject)."""
+
+    finished = Signal(str, list)  # Video-ID, (titel, start_sekunden)-Tupel
+    error = Signal(str, str)  # Video-ID, Fehlermeldung
+
+
+class _ChapterLoadTask(QRunnable):
+    """Lädt Titel und Startzeit aller Kapitel eines Videos im Thread-Pool."""
+
+    def __init__(self, video_id: str):
+        super().__init__()
+        self.signals = _ChapterLoadSignals()
+        self._video_id = video_id
+
+    def run(self):
+        try:
+            with db.connection_context():
+                # Tupel statt Peewee-Modellinstanzen
+                chapters = list(
+                    Chapter.select(Chapter.title, Chapter.start_seconds)
+                    .join(Transcript)
+                    .where(Transcript.video_id == self._video_id)
+                    .order_by(Chapter.start_seconds)
+                    .tuples()
+                    .iterator()
+                )
+        except Exception as e:
+            self.signals.error.emit(self._video_id, str(e))
+            return
+        self.signals.finished.emit(self._video_id, chapters)
+
+
+class ChapterTableModel(QAbstractTableModel):
+    """Tabellenmodell für alle Kapitel eines Videos.
+
+    Hält nur ``(titel, start_sekunden)``-Tupel und die Video-ID; Zeitstempel, URL und Icons werden
+    erst in ``data()`` für die Zellen erzeugt, die die View tatsächlich anfragt.
+    """
+
+    HEADERS = ("Kapitel-Titel", "Zeitstempel", "YouTube-Link")
+    # Sortierschlüssel für den Proxy: Titel klein geschrieben bzw. Startzeit in Sekunden
+    SORT_ROLE = Qt.ItemDataRole.UserRole + 2
+    # Alle Zellen sind nur auswählbar; die View fragt flags() sehr häufig ab
+    _FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._column_icons: tuple[QIcon, ...] = ()
+        self._rows: list[tuple[str, int]] = []
+        self._video_id = ""
+        # Gemeinsamer URL-Anfang aller Zeilen; pro Zelle wird nur noch die Startzeit angehängt
+        self._url_prefix = ""
+        # Kombiniertes Muster aller Suchbegriffe für den Tooltip, neu kompiliert nur in set_search_terms
+        self._terms_re: re.Pattern | None = None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(self.HEADERS)
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return self._FLAGS if index.isValid() else Qt.ItemFlag.NoItemFlags
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        title, start_seconds = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return title
+            if column == 1:
+                return _format_seconds_to_time(start_seconds)
+            return self._youtube_url(start_seconds)
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._column_icons[column] if self._column_icons else None
+        if role == MULTIPLE_ROLES_ROLE and column == 0:
+            # Alles, was der Highlight-Delegate zum Zeichnen der Titelzelle braucht, in einem Aufruf
+            return {
+                Qt.ItemDataRole.DisplayRole: title,
+                Qt.ItemDataRole.DecorationRole: self._column_icons[0] if self._column_icons else None,
+            }
+        if role == Qt.ItemDataRole.UserRole:
+            # URL für den Doppelklick
+            return self._youtube_url(start_seconds)
+        if role == self.SORT_ROLE:
+            return (title or "").lower() if column == 0 else start_seconds
+        if role == Qt.ItemDataRole.ToolTipRole and column == 0:
+            if title and self._terms_re is not None and self._terms_re.search(title):
+                return f"Suchbegriff gefunden: {title}"
+        return None
+
+    def set_rows(self, chapters: list[tuple[str, int]], video_id: str) -> None:
+        """Ersetzt alle Zeilen (``(titel, start_sekunden)``) in einem einzigen Model-Reset."""
+        self.beginResetModel()
+        self._rows = list(chapters)
+        self._video_id = video_id
+        self._url_prefix = f"https://youtube.com/watch?v={video_id}&t="
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Entfernt alle Zeilen."""
+        self.set_rows([], "")
+
+    def set_column_icons(self, icons: tuple[QIcon, ...]) -> None:
+        """Setzt die Icons je Spalte; sie werden einmal vom Widget erzeugt und für alle Zeilen genutzt."""
+        self._column_icons = icons
+
+    def set_search_terms(self, search_terms: List[str]) -> None:
+        """Setzt die Suchbegriffe und meldet nur die Titelspalte als geändert."""
+        terms = sorted({t for t in search_terms if t and t.strip()}, key=len, reverse=True)
+        self._terms_re = re.compile("|".join(map(re.escape, terms)), re.IGNORECASE) if terms else None
+        if self._rows:
+            # Nur Spalte 0 nutzt den Highlight-Delegate bzw. den Tooltip
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._rows) - 1, 0),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole],
+            )
+
+    def _youtube_url(self, start_seconds: int) -> str:
+        return f"{self._url_prefix}{start_seconds}s"
 
 
 class SearchWidget(QWidget):
     """Ein Widget zur Suche in Kapiteln und zur Anzeige der Ergebnisse."""
 
     search_requested = Signal(str)
+    terms_changed = Signal(list)  # Suchbegriffe für die Hervorhebung im Delegate
 
     def __init__(self):
         super().__init__()
@@ -40,6 +204,8 @@ class SearchWidget(QWidget):
         # Status-Tracking
         self._is_search_running = False
         self._current_search_terms = []  # Speichert die aktuellen Suchbegriffe für Hervorhebung
+        self._requested_video_id: Optional[str] = None  # Zuletzt angefordertes Video der Zeitstempel-Tabelle
+        self._pending_video_id = ""  # Video des letzten Klicks, geladen nach Ablauf der Entprellung
 
         self._setup_widgets()
         self._setup_layouts()
@@ -65,8 +231,12 @@ class SearchWidget(QWidget):
         self.results_table.setToolTip(
             "Detaillierte Zeitstempel-Liste des oben ausgewählten Videos. Doppelklick öffnet YouTube-Link."
         )
-        self.results_model = QStandardItemModel(self)
-        self.results_table.setModel(self.results_model)
+        self.results_model = ChapterTableModel(self)
+        # Sortierung über einen Proxy mit numerischem Schlüssel für die Zeitstempel
+        self.results_proxy = QSortFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_proxy.setSortRole(ChapterTableModel.SORT_ROLE)
+        self.results_table.setModel(self.results_proxy)
 
         # Label für TableView Status
         self.table_status_label = QLabel("Wählen Sie ein Video im oberen Bereich aus, um alle Zeitstempel zu sehen.")
@@ -100,14 +270,13 @@ class SearchWidget(QWidget):
         self.splitter.setStretchFactor(1, 1)  # TableView bekommt 1/4 des Platzes
 
         # Setze explizite Anfangsgrößen (TreeView größer als TableView)
-        self.splitter.setSizes([500, 200])  # TreeView: 500px, TableView: 200px
+        self.splitter.setSizes([400, 300])  # TreeView: 400px, TableView: 300px
         self.splitter.setHandleWidth(8)  # Sichtbarer Griff zum Ziehen
 
-        # Setze Splitter-Verhältnis explizit nach dem Setup
-        # Verwende QTimer um sicherzustellen, dass der Splitter vollständig initialisiert ist
-        from PySide6.QtCore import QTimer
-
-        QTimer.singleShot(100, lambda: self.splitter.setSizes([400, 300]))
+        # Schnelle Klickfolgen im Baum (z. B. Pfeiltasten) zu einem einzigen Ladevorgang bündeln
+        self._click_debounce = QTimer(self)
+        self._click_debounce.setSingleShot(True)
+        self._click_debounce.setInterval(50)
 
     def _setup_layouts(self):
         """Ordnet die UI-Komponenten in Layouts an."""
@@ -121,12 +290,13 @@ class SearchWidget(QWidget):
 
         # Verbinde TreeView Selection mit TableView Update
         self.tree_widget.results_tree.clicked.connect(self._on_tree_item_clicked)
+        self._click_debounce.timeout.connect(self._run_pending_load)
 
         # TableView Doppelklick für YouTube Links
         self.results_table.doubleClicked.connect(self._on_result_double_clicked)
 
-    @Slot(str)
-    def _on_search_requested(self, search_query: str):
+    @Slot(str, SearchStrategy)
+    def _on_search_requested(self, search_query: str, strategy: Optional[SearchStrategy] = None):
         """Behandelt Suchanfragen und extrahiert Suchbegriffe für Hervorhebung."""
         # Extrahiere Suchbegriffe aus der Suchanfrage (einfache Worttrennung)
         search_terms = [term.strip() for term in search_query.split() if term.strip()]
@@ -135,12 +305,19 @@ class SearchWidget(QWidget):
         # Leite Suchbegriffe auch an das TreeWidget weiter
         self.tree_widget.set_search_terms(search_terms)
 
+        # Wiederholte Suchen direkt aus dem Ergebnis-Cache anzeigen, ohne Backend-Abfrage
+        if strategy is not None:
+            cached = self.tree_widget.cached_results(search_query, strategy)
+            if cached is not None:
+                logger.debug(f"Zeige zwischengespeicherte Ergebnisse für '{search_query}'")
+                self.display_results(cached)
+                return
+
         # Leite Signal weiter
         self.search_requested.emit(search_query)
 
     def _setup_table(self):
         """Konfiguriert die Ergebnistabelle."""
-        self.results_model.setHorizontalHeaderLabels(["Kapitel-Titel", "Zeitstempel", "YouTube-Link"])
         header = self.results_table.horizontalHeader()
         # Benutzer-resizable Spalten
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)  # Kapitel-Spalte
@@ -152,13 +329,27 @@ class SearchWidget(QWidget):
         header.resizeSection(1, 120)
         header.resizeSection(2, 260)
 
+        # Icons einmal erzeugen statt pro Zelle Icons.get(...) aufzurufen
+        self._icon_title = Icons.get(Icons.BOOK_OPEN)  # Icon für Kapitel
+        self._icon_time = Icons.get(Icons.PLAY)  # Icon für Zeitstempel
+        self._icon_url = Icons.get(Icons.VIDEO)  # Icon für YouTube-Link
+        self.results_model.set_column_icons((self._icon_title, self._icon_time, self._icon_url))
+
+        # Einheitliche, feste Zeilenhöhe: die View muss beim Scrollen keine sizeHints messen
+        vertical_header = self.results_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setMinimumSectionSize(0)
+        vertical_header.setDefaultSectionSize(vertical_header.fontMetrics().height() + 8)
+
         self.results_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.results_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        # Standardmäßig chronologisch nach Zeitstempel sortieren (entspricht der Reihenfolge der Abfrage)
+        header.setSortIndicator(1, Qt.SortOrder.AscendingOrder)
         self.results_table.setSortingEnabled(True)
         self.results_table.setAlternatingRowColors(True)
 
         # Delegate für Wort-Hervorhebung in der Titelspalte
-        self._table_highlight_delegate = RichTextHighlightDelegate(lambda: self._current_search_terms)
+        self._table_highlight_delegate = RichTextHighlightDelegate(terms_signal=self.terms_changed)
         self.results_table.setItemDelegateForColumn(0, self._table_highlight_delegate)
 
     @Slot()
@@ -171,270 +362,87 @@ class SearchWidget(QWidget):
                 logger.debug("Ungültiger Index")
                 return
 
-            # Hole das Model Item (wir wissen, dass es ein QStandardItemModel ist)
-            model = self.tree_widget.results_tree.model()
-            if not isinstance(model, QStandardItemModel):
-                logger.debug("Kein QStandardItemModel gefunden")
-                return
-
-            item = model.itemFromIndex(index)
-            if not item:
-                logger.debug("Kein Item für Index gefunden")
-                return
-
-            logger.debug(f"Item Text: {item.text()}")
-
-            # Extrahiere Video-ID vom angeklickten Item
-            video_id = self._extract_video_id_from_model_item(item)
-            logger.debug(f"Extrahierte Video-ID: {video_id}")
-
+            # Die Video-ID liegt direkt auf Spalte 0 der Zeile; das Model leitet sie bei älteren
+            # Ergebnissen ohne ID aus der URL ab
+            video_id = index.siblingAtColumn(0).data(VIDEO_ID_ROLE) or ""
             if video_id:
-                # Lade alle Zeitstempel für dieses Video
-                self._load_all_timestamps_for_video(video_id)
+                self._queue_timestamps_load(video_id)
             else:
                 logger.debug("Keine Video-ID gefunden - TableView wird nicht aktualisiert")
 
         except Exception as e:
             logger.error(f"Fehler beim Verarbeiten des TreeView-Klicks: {e}")
 
-    def _extract_video_id_from_tree_selection(self, index) -> str:
-        """Extrahiert die Video-ID aus der TreeView-Auswahl."""
-        try:
-            # Navigiere durch die Hierarchie, um eine URL zu finden
-            model = self.tree_widget.results_model
-
-            # Wenn es ein Video-Item ist, schaue nach einem Child mit URL
-            item = model.itemFromIndex(index)
-            if item:
-                # Durchsuche alle Kinder nach URLs
-                for row in range(item.rowCount()):
-                    child = item.child(row, 0)
-                    if child:
-                        url = child.data(Qt.ItemDataRole.UserRole)
-                        if url:
-                            return self._extract_video_id_from_url(url)
-
-                        # Rekursiv in weitere Kinder schauen
-                        for subrow in range(child.rowCount()):
-                            subchild = child.child(subrow, 0)
-                            if subchild:
-                                suburl = subchild.data(Qt.ItemDataRole.UserRole)
-                                if suburl:
-                                    return self._extract_video_id_from_url(suburl)
-
-                # Falls das Item selbst eine URL hat
-                url = item.data(Qt.ItemDataRole.UserRole)
-                if url:
-                    return self._extract_video_id_from_url(url)
-
-            return ""
-        except Exception as e:
-            logger.warning(f"Fehler beim Extrahieren der Video-ID: {e}")
-            return ""
-
-    def _extract_video_id_from_model_item(self, item: QStandardItem) -> str:
-        """Extrahiert die Video-ID aus einem Model-Item."""
-        try:
-            # Zuerst schauen wir, ob das Item selbst eine URL hat
-            url = item.data(Qt.ItemDataRole.UserRole)
-            if url and isinstance(url, str):
-                video_id = self._extract_video_id_from_url(url)
-                if video_id:
-                    logger.debug(f"Video-ID aus Item selbst extrahiert: {video_id}")
-                    return video_id
-
-            # Wenn das Item keine URL hat, schauen wir in die Children
-            # Traverse alle Children auf der ersten Ebene
-            for row in range(item.rowCount()):
-                child = item.child(row, 0)
-                if child:
-                    child_url = child.data(Qt.ItemDataRole.UserRole)
-                    if child_url and isinstance(child_url, str):
-                        video_id = self._extract_video_id_from_url(child_url)
-                        if video_id:
-                            logger.debug(f"Video-ID aus Child-Item extrahiert: {video_id}")
-                            return video_id
-
-                    # Traverse auch Sub-Children (zweite Ebene)
-                    for subrow in range(child.rowCount()):
-                        subchild = child.child(subrow, 0)
-                        if subchild:
-                            subchild_url = subchild.data(Qt.ItemDataRole.UserRole)
-                            if subchild_url and isinstance(subchild_url, str):
-                                video_id = self._extract_video_id_from_url(subchild_url)
-                                if video_id:
-                                    logger.debug(f"Video-ID aus Sub-Child-Item extrahiert: {video_id}")
-                                    return video_id
-
-            # Falls wir ein Child-Item geklickt haben, schauen wir nach oben zum Parent
-            parent_item = item.parent()
-            if parent_item:
-                # Durchsuche alle Siblings des Parent nach URLs
-                for row in range(parent_item.rowCount()):
-                    sibling = parent_item.child(row, 0)
-                    if sibling:
-                        for subrow in range(sibling.rowCount()):
-                            subsibling = sibling.child(subrow, 0)
-                            if subsibling:
-                                subsibling_url = subsibling.data(Qt.ItemDataRole.UserRole)
-                                if subsibling_url and isinstance(subsibling_url, str):
-                                    video_id = self._extract_video_id_from_url(subsibling_url)
-                                    if video_id:
-                                        logger.debug(f"Video-ID aus Parent-Sibling extrahiert: {video_id}")
-                                        return video_id
-
-            logger.debug(f"Keine Video-ID gefunden für Item: {item.text()}")
-            return ""
-        except Exception as e:
-            logger.warning(f"Fehler beim Extrahieren der Video-ID aus Model-Item: {e}")
-            return ""
-
-    def _extract_video_id_from_url(self, timestamp_url: str) -> str:
-        """Extrahiert die Video-ID aus einer YouTube-URL."""
-        try:
-            import re
-
-            patterns = [
-                r"youtube\.com/watch\?v=([a-zA-Z0-9_-]+)",
-                r"youtu\.be/([a-zA-Z0-9_-]+)",
-                r"youtube\.com/embed/([a-zA-Z0-9_-]+)",
-            ]
+    def _queue_timestamps_load(self, video_id: str):
+        """Merkt das Video vor und (re)startet die Entprellung; geladen wird nur der letzte Klick."""
+        self._pending_video_id = video_id
+        self._click_debounce.start()
 
-            for pattern in patterns:
-                match = re.search(pattern, timestamp_url)
-                if match:
-                    return match.group(1)
-
-            return ""
-        except Exception as e:
-            logger.warning(f"Fehler beim Extrahieren der Video-ID aus URL {timestamp_url}: {e}")
-            return ""
+    @Slot()
+    def _run_pending_load(self):
+        """Lädt die Zeitstempel des zuletzt angeklickten Videos."""
+        self._load_all_timestamps_for_video(self._pending_video_id)
 
     def _load_all_timestamps_for_video(self, video_id: str):
-        """Lädt alle Zeitstempel für ein Video und zeigt sie in der Tabelle an."""
-        try:
-            from yt_database.database import Chapter, Transcript
-
-            # Hole alle Kapitel des Videos
-            chapters = list(
-                Chapter.select().join(Transcript).where(Transcript.video_id == video_id).order_by(Chapter.start_seconds)
-            )
-
-            # Leere die Tabelle
-            self.results_model.removeRows(0, self.results_model.rowCount())
-
-            if not chapters:
-                self.table_status_label.setText("Keine Zeitstempel für dieses Video gefunden.")
-                self.table_status_label.show()
-                self.results_table.hide()
-                return
-
-            self.table_status_label.hide()
-            self.results_table.show()
-
-            # Fülle die Tabelle mit allen Kapiteln
-            for chapter in chapters:
-                # Formatiere Zeitstempel
-                time_str = self._format_seconds_to_time(chapter.start_seconds)
-
-                # Erstelle YouTube-URL
-                youtube_url = f"https://youtube.com/watch?v={video_id}&t={chapter.start_seconds}s"
-
-                # Wende Hervorhebung auf Titel an und erstelle Items
-                title_item = self._create_highlighted_item(chapter.title)
-                title_item.setIcon(Icons.get(Icons.BOOK_OPEN))  # Icon für Kapitel
-
-                time_item = QStandardItem(time_str)
-                time_item.setIcon(Icons.get(Icons.PLAY))  # Icon für Zeitstempel
-
-                url_item = QStandardItem(youtube_url)
-                url_item.setIcon(Icons.get(Icons.VIDEO))  # Icon für YouTube-Link
-
-                row = [title_item, time_item, url_item]
-
-                # Speichere URL für Doppelklick
-                for item in row:
-                    item.setData(youtube_url, Qt.ItemDataRole.UserRole)
-
-                self.results_model.appendRow(row)
+        """Startet das Laden aller Zeitstempel eines Videos im Thread-Pool."""
+        # Nur das Ergebnis des zuletzt angeforderten Videos wird angezeigt
+        self._requested_video_id = video_id
+        task = _ChapterLoadTask(video_id)
+        task.signals.finished.connect(self._on_chapters_loaded)
+        task.signals.error.connect(self._on_chapters_load_error)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(str, list)
+    def _on_chapters_loaded(self, video_id: str, chapters: list):
+        """Zeigt die im Hintergrund geladenen Zeitstempel in der Tabelle an."""
+        if video_id != self._requested_video_id:
+            logger.debug(f"Verwerfe veraltete Zeitstempel für Video {video_id}")
+            return
 
-            logger.debug(f"Zeige {len(chapters)} Zeitstempel für Video {video_id} an")
+        # Ersetze den Tabelleninhalt in einem einzigen Model-Reset; der Proxy sortiert dabei
+        # einmal gemäß der aktuell gewählten Spalte
+        self.results_table.setAlternatingRowColors(len(chapters) < _ALTERNATING_ROWS_LIMIT)
+        self.results_model.set_rows(chapters, video_id)
 
-        except Exception as e:
-            logger.error(f"Fehler beim Laden der Zeitstempel für Video {video_id}: {e}")
-            self.table_status_label.setText("Fehler beim Laden der Zeitstempel.")
+        if not chapters:
+            self.table_status_label.setText("Keine Zeitstempel für dieses Video gefunden.")
             self.table_status_label.show()
             self.results_table.hide()
+            return
 
-    def _highlight_search_terms(self, text: str) -> str:
-        """Hebt Suchbegriffe im Text farblich hervor - verwendet Rich Text für Qt."""
-        if not self._current_search_terms or not text:
-            return text
-
-        highlighted_text = text
-
-        # Sortiere Suchbegriffe nach Länge (längste zuerst) um Überschneidungen zu vermeiden
-        sorted_terms = sorted(self._current_search_terms, key=len, reverse=True)
-
-        for term in sorted_terms:
-            if term.strip():  # Nur nicht-leere Begriffe
-                # Case-insensitive Suche mit Rich Text Hervorhebung für Qt
-                import re
-
-                pattern = re.compile(re.escape(term), re.IGNORECASE)
-                highlighted_text = pattern.sub(
-                    lambda match: f'<span style="background-color: #FFFF00; color: #000000; font-weight: bold;">{match.group()}</span>',
-                    highlighted_text,
-                )
-
-        return highlighted_text
-
-    def _create_highlighted_item(self, text: str) -> QStandardItem:
-        """Erstellt ein QStandardItem mit farblicher Hervorhebung."""
-        item = QStandardItem(text)
-        item.setEditable(False)
-
-        # Optional: Tooltip, wenn Suchbegriff vorkommt
-        if self._current_search_terms and any(
-            t.strip() and t.lower() in text.lower() for t in self._current_search_terms
-        ):
-            item.setToolTip(f"Suchbegriff gefunden: {text}")
-
-        return item
+        self.table_status_label.hide()
+        self.results_table.show()
 
-    def _format_seconds_to_time(self, seconds: int) -> str:
-        """Formatiert Sekunden zu einer lesbaren Zeitangabe."""
-        try:
-            hours, remainder = divmod(seconds, 3600)
-            minutes, secs = divmod(remainder, 60)
+        logger.debug(f"Zeige {len(chapters)} Zeitstempel für Video {video_id} an")
 
-            if hours > 0:
-                return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-            else:
-                return f"{minutes:02d}:{secs:02d}"
-        except Exception:
-            return f"{seconds}s"
+    @Slot(str, str)
+    def _on_chapters_load_error(self, video_id: str, message: str):
+        """Zeigt einen Hinweis an, wenn das Laden der Zeitstempel fehlgeschlagen ist."""
+        logger.error(f"Fehler beim Laden der Zeitstempel für Video {video_id}: {message}")
+        if video_id != self._requested_video_id:
+            return
+        self.table_status_label.setText("Fehler beim Laden der Zeitstempel.")
+        self.table_status_label.show()
+        self.results_table.hide()
 
     def set_search_terms(self, search_terms: List[str]):
         """Setzt die aktuellen Suchbegriffe für die Hervorhebung."""
         self._current_search_terms = search_terms if search_terms else []
+        self.terms_changed.emit(self._current_search_terms)
+        self.results_model.set_search_terms(self._current_search_terms)
         logger.debug(f"SearchWidget: Suchbegriffe für Hervorhebung gesetzt: {self._current_search_terms}")
-        # Refresh Table-Rendering
-        if self.results_model is not None and self.results_model.rowCount() > 0:
-            top_left = self.results_model.index(0, 0)
-            bottom_right = self.results_model.index(
-                max(0, self.results_model.rowCount() - 1), max(0, self.results_model.columnCount() - 1)
-            )
-            self.results_model.dataChanged.emit(top_left, bottom_right)
-            self.results_table.viewport().update()
 
     @Slot(list)
     def display_results(self, results: List[SearchResult]):
         """Slot zum Weiterleiten der Suchergebnisse an das TreeWidget."""
         self.tree_widget.display_results(results)
 
+        # Ausstehende Klicks und noch laufende Ladevorgänge der vorherigen Ergebnisse verwerfen
+        self._click_debounce.stop()
+        self._requested_video_id = None
+
         # Leere die Tabelle und zeige Hinweis
-        self.results_model.removeRows(0, self.results_model.rowCount())
+        self.results_model.clear()
         self.table_status_label.setText("Wählen Sie ein Video im oberen Bereich aus, um alle Zeitstempel zu sehen.")
         self.table_status_label.show()
         self.results_table.hide()
@@ -442,11 +450,10 @@ class SearchWidget(QWidget):
     @Slot()
     def _on_result_double_clicked(self, index):
         """Öffnet den YouTube-Link beim Doppelklick auf eine Zeile."""
-        item = self.results_model.itemFromIndex(index)
-        if not item:
+        if not index.isValid():
             return
 
-        url_str = item.data(Qt.ItemDataRole.UserRole)
+        url_str = index.data(Qt.ItemDataRole.UserRole)
         if url_str:
             logger.info(f"Öffne YouTube-Link: {url_str}")
             QDesktopServices.openUrl(QUrl(url_str))
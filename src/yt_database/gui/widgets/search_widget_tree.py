@@ -5,12 +5,26 @@ Dieses Widget stellt eine benutzerfreundliche Oberfläche für die Suche in Kapi
 bereit und zeigt die Ergebnisse in einem hierarchischen TreeView an, gruppiert nach Videos.
 """
 
-from collections import defaultdict
+import heapq
+import re
+from collections import OrderedDict
+from html import unescape
+from operator import attrgetter
 from typing import Callable, Dict, List, Optional
 
 from loguru import logger
-from PySide6.QtCore import QStringListModel, Qt, QUrl, Signal, Slot
-from PySide6.QtGui import QDesktopServices, QStandardItem, QStandardItemModel
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    QStringListModel,
+    Qt,
+    QTimer,
+    QUrl,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QDesktopServices, QIcon
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QComboBox,
@@ -26,21 +40,247 @@ from PySide6.QtWidgets import (
 )
 
 from yt_database.gui.utils.icons import Icons
-from yt_database.gui.widgets.delegates import RichTextHighlightDelegate
+from yt_database.gui.widgets.delegates import MULTIPLE_ROLES_ROLE, RichTextHighlightDelegate
 from yt_database.gui.widgets.search_strategy_info_window import SearchStrategyInfoWindow
 from yt_database.models.search_models import SearchResult
 from yt_database.models.search_strategy import SearchStrategy, SEARCH_STRATEGIES
+from yt_database.search.prefix_trie import PrefixTrie
 from yt_database.search.query_parser import parse_search_query, tokens_for_highlighting
 
+# HTML-Tags in FTS5-Snippets (z. B. <mark>), die vor der Anzeige entfernt werden
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Video-ID aus watch-, Kurz- und Embed-Links in einem Durchlauf
+_VIDEO_ID_RE = re.compile(r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]+)")
+
+# Sortierschlüssel der Kapitel (C-seitiger Attributzugriff statt Lambda)
+_RELEVANCE = attrgetter("relevance_score")
+
+
+def _video_relevance(video: tuple) -> float:
+    """Sortierschlüssel für ``(Titel, [Kapitel, beste Relevanz])`` aus der Gruppierung der Ergebnisse."""
+    return video[1][1]
+
+
+# Rolle für die Video-ID auf Spalte 0 von Video- und Kapitelzeilen
+VIDEO_ID_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Ergebniszellen sind nur auswählbar, nicht editierbar
+NON_EDIT_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+
+def _snippet_to_plain_text(text: str) -> str:
+    """Wandelt ein FTS5-Snippet mit HTML-Markup in Plain-Text um.
+
+    Der Delegate rendert Hervorhebung per HTML selbst. Um sichtbare
+    Tags wie <mark> in der TreeView zu vermeiden, entfernen wir
+    HTML-Markup aus Snippets und überlassen die farbliche Hervorhebung
+    dem Delegate anhand der gesetzten Suchbegriffe.
+
+    Args:
+        text: Snippet-Text, potenziell mit HTML-Tags.
+
+    Returns:
+        Bereinigter Plain-Text ohne Tags und mit decodierten Entities.
+    """
+    if not text:
+        return ""
+    return unescape(_TAG_RE.sub("", text))
+
+
+def _video_id_from_url(timestamp_url: str) -> str:
+    """Extrahiert die Video-ID aus einer YouTube-URL."""
+    match = _VIDEO_ID_RE.search(timestamp_url or "")
+    return match.group(1) if match else ""
+
+
+def _video_id_of(result: SearchResult) -> str:
+    """Liefert die Video-ID eines Ergebnisses; ältere Ergebnisse ohne ID werden aus der URL gelesen."""
+    return result.video_id or _video_id_from_url(result.timestamp_url)
+
+
+class SearchResultsModel(QAbstractItemModel):
+    """Baummodell der Suchergebnisse: Videos auf oberster Ebene, ihre Kapitel als Kinder.
+
+    Hält pro Video nur ein Tupel ``(titel, kanal, kapitel, beste_relevanz, video_id)`` mit den
+    ``SearchResult``-Objekten der Kapitel; Texte, Tooltips und Icons werden erst in ``data()`` für die
+    Zellen erzeugt, die die View tatsächlich anfragt.
+
+    Die ``internalId`` eines Index ist 0 für Videozeilen und ``video_zeile + 1`` für Kapitelzeilen.
+    Zeilen werden nur angehängt oder per Reset ersetzt, daher bleiben diese IDs gültig.
+    """
+
+    HEADERS = ("Video / Kapitel", "Kanal", "Zeitstempel")
+    # Sortierschlüssel für den Proxy: Texte klein geschrieben, Trefferzahl numerisch
+    SORT_ROLE = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._videos: list[tuple[str, str, list[SearchResult], float, str]] = []
+        self._video_icon: Optional[QIcon] = None
+        self._chapter_icon: Optional[QIcon] = None
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not 0 <= column < len(self.HEADERS):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0) if 0 <= row < len(self._videos) else QModelIndex()
+        # Nur Spalte 0 einer Videozeile hat Kinder
+        if parent.internalId() or parent.column() != 0:
+            return QModelIndex()
+        if 0 <= row < len(self._videos[parent.row()][2]):
+            return self.createIndex(row, column, parent.row() + 1)
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid() or not index.internalId():
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._videos)
+        if parent.internalId() or parent.column() != 0:
+            return 0
+        return len(self._videos[parent.row()][2])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(self.HEADERS)
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return NON_EDIT_FLAGS if index.isValid() else Qt.ItemFlag.NoItemFlags
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        parent_row = index.internalId() - 1
+        if parent_row < 0:
+            return self._video_data(self._videos[index.row()], index.column(), role)
+        return self._chapter_data(self._videos[parent_row][2][index.row()], index.column(), role)
+
+    def set_videos(self, videos: List[tuple]) -> None:
+        """Ersetzt alle Videos (``(titel, [kapitel, beste_relevanz])``) in einem einzigen Model-Reset."""
+        self.beginResetModel()
+        self._videos = [self._video_row(video_title, entry) for video_title, entry in videos]
+        self.endResetModel()
+
+    def append_videos(self, videos: List[tuple]) -> None:
+        """Hängt Videos (``(titel, [kapitel, beste_relevanz])``) mit einem einzigen rowsInserted an."""
+        if not videos:
+            return
+        first_row = len(self._videos)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(videos) - 1)
+        self._videos.extend(self._video_row(video_title, entry) for video_title, entry in videos)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Entfernt alle Videos."""
+        self.set_videos([])
+
+    def set_icons(self, video_icon: QIcon, chapter_icon: QIcon) -> None:
+        """Setzt die Icons für Video- und Kapitelzeilen; sie werden einmal vom Widget erzeugt."""
+        self._video_icon = video_icon
+        self._chapter_icon = chapter_icon
+
+    @staticmethod
+    def _video_row(video_title: str, entry: list) -> tuple:
+        chapters, best_relevance = entry
+        # Hole Kanalinformationen vom ersten Kapitel (alle haben den gleichen Kanal)
+        first_chapter = chapters[0]
+        channel_display = first_chapter.channel_name
+        if first_chapter.channel_handle:
+            channel_display = f"{first_chapter.channel_name} ({first_chapter.channel_handle})"
+        # Kapitel nach Relevanz sortieren (beste zuerst)
+        chapters_sorted = sorted(chapters, key=_RELEVANCE, reverse=True)
+        return video_title, channel_display, chapters_sorted, best_relevance, _video_id_of(first_chapter)
+
+    def _video_data(self, video: tuple, column: int, role: int):
+        title, channel_display, chapters, best_relevance, video_id = video
+        if role == Qt.ItemDataRole.DisplayRole:
+            return (title, channel_display, f"{len(chapters)} Treffer")[column]
+        if role == MULTIPLE_ROLES_ROLE:
+            # Alles, was der Highlight-Delegate zum Zeichnen braucht, in einem Aufruf
+            return {
+                Qt.ItemDataRole.DisplayRole: (title, channel_display, f"{len(chapters)} Treffer")[column],
+                Qt.ItemDataRole.DecorationRole: self._video_icon if column == 0 else None,
+            }
+        if column == 0:
+            # Kein Link (UserRole) für Videozeilen; Relevanz-Info als Tooltip
+            if role == Qt.ItemDataRole.DecorationRole:
+                return self._video_icon
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return f"Beste Relevanz: {best_relevance:.2f}"
+            if role == VIDEO_ID_ROLE:
+                return video_id
+        if role == self.SORT_ROLE:
+            return (title.lower(), channel_display.lower(), len(chapters))[column]
+        return None
+
+    def _chapter_data(self, chapter: SearchResult, column: int, role: int):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._chapter_text(chapter, column)
+        if role == MULTIPLE_ROLES_ROLE:
+            return {
+                Qt.ItemDataRole.DisplayRole: self._chapter_text(chapter, column),
+                Qt.ItemDataRole.DecorationRole: self._chapter_icon if column == 0 else None,
+            }
+        if role == Qt.ItemDataRole.UserRole and column != 1:
+            # Link für den Doppelklick
+            return chapter.timestamp_url
+        if column == 0:
+            if role == Qt.ItemDataRole.DecorationRole:
+                return self._chapter_icon
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return f"Relevanz: {chapter.relevance_score:.2f}\nKlicken um Video an dieser Stelle zu öffnen"
+            if role == VIDEO_ID_ROLE:
+                return _video_id_of(chapter)
+        if role == self.SORT_ROLE:
+            text = self._chapter_text(chapter, column)
+            return text.lower() if text else ""
+        return None
+
+    @staticmethod
+    def _chapter_text(chapter: SearchResult, column: int) -> Optional[str]:
+        if column == 0:
+            # Verwende highlighted_snippet falls verfügbar, sonst chapter_title
+            if chapter.highlighted_snippet:
+                return _snippet_to_plain_text(chapter.highlighted_snippet)
+            return chapter.chapter_title
+        if column == 2:
+            # Zeitstempel mit Relevanz-Indikator
+            return f"{chapter.start_time_str} ({chapter.relevance_score:.1f})"
+        # Die Kanal-Spalte bleibt bei Kapiteln leer
+        return None
+
 
 class SearchWidgetTree(QWidget):
     """Ein Widget zur Suche in Kapiteln und zur hierarchischen Anzeige der Ergebnisse."""
 
     search_requested = Signal(str, SearchStrategy)  # Erweitert um SearchStrategy
+    terms_changed = Signal(list)  # Suchbegriffe für die Hervorhebung im Delegate
     # Class-level attribute annotations for tooling
     _completer: Optional[QCompleter]
     _completer_model: Optional[QStringListModel]
     _suggest_provider: Optional[Callable[[str], List[str]]]
+    _suggest_trie: Optional[PrefixTrie]
+
+    # Maximale Anzahl Vorschläge aus dem Präfix-Trie
+    MAX_SUGGESTIONS = 50
+    # Anzahl zwischengespeicherter Suchergebnisse (LRU über Suchbegriff und Strategie)
+    RESULT_CACHE_SIZE = 16
+    # Bis zu dieser Anzahl Videos wird der Baum automatisch expandiert
+    AUTO_EXPAND_MAX_VIDEOS = 3
+    # Anzahl Videos, die pro Schritt aufgebaut werden; weitere folgen beim Scrollen ans Ende
+    VIDEO_BATCH_SIZE = 50
 
     def __init__(self, parent=None):
         """Initialisiert das Widget."""
@@ -50,6 +290,14 @@ class SearchWidgetTree(QWidget):
 
         # Speichere Suchbegriffe für Hervorhebung
         self._current_search_terms = []
+        # Sortierte Begriffe der letzten Hervorhebung; unveränderte Begriffe lösen kein Repaint aus
+        self._current_search_terms_key: tuple[str, ...] = ()
+
+        # Ergebnisse der letzten Suchen, Schlüssel (Suchbegriff, Strategie)
+        self._result_cache: OrderedDict[tuple[str, str], List[SearchResult]] = OrderedDict()
+        self._pending_cache_key: Optional[tuple[str, str]] = None
+        # Noch nicht angezeigte Videos (unsortiert) als (Titel, [Kapitel, beste Relevanz])
+        self._deferred_videos: List[tuple] = []
 
         self._setup_ui()
 
@@ -61,6 +309,12 @@ class SearchWidgetTree(QWidget):
 
     def _setup_widgets(self) -> None:
         """Initialisiert alle UI-Komponenten und konfiguriert ihre statischen Eigenschaften."""
+        # Icons einmal erzeugen statt pro Ergebniszeile Icons.get(...) aufzurufen
+        self._icon_video = Icons.get(Icons.VIDEO)
+        self._icon_book = Icons.get(Icons.BOOK_OPEN)
+        self._icon_search = Icons.get(Icons.SEARCH)
+        self._icon_info = Icons.get(Icons.INFO)
+
         self.search_input = QLineEdit()
         self.search_input.setObjectName("search_widget_tree_input")
         self.search_input.setPlaceholderText("Stichwort in Kapiteln suchen (z.B. 'Kritik', 'Politik', 'Analyse')...")
@@ -71,7 +325,7 @@ class SearchWidgetTree(QWidget):
         self.search_button = QPushButton("Suchen")
         self.search_button.setObjectName("search_widget_tree_button")
         self.search_button.setToolTip("Startet die Suche nach den eingegebenen Begriffen (Enter möglich).")
-        self.search_button.setIcon(Icons.get(Icons.SEARCH))
+        self.search_button.setIcon(self._icon_search)
 
         # Strategieauswahl-ComboBox
         self.strategy_combo = QComboBox()
@@ -84,15 +338,11 @@ class SearchWidgetTree(QWidget):
                 strategy_info.display_name, strategy_info.strategy  # Strategy als UserData speichern
             )
 
-        # Tooltip für aktuelle Auswahl dynamisch setzen
-        self.strategy_combo.currentTextChanged.connect(self._update_strategy_tooltip)
-
         # Info-Fenster Button
         self.info_button = QPushButton("Info")
-        self.info_button.setIcon(Icons.get(Icons.INFO))
+        self.info_button.setIcon(self._icon_info)
         self.info_button.setObjectName("search_info_button")
         self.info_button.setToolTip("Öffne Informationsfenster zu den Suchstrategien")
-        self.info_button.clicked.connect(self._show_info_window)
 
         # Info-Fenster (wird lazy erstellt)
         self.info_window: Optional[SearchStrategyInfoWindow] = None
@@ -100,11 +350,15 @@ class SearchWidgetTree(QWidget):
         self.results_tree = QTreeView()
         self.results_tree.setObjectName("search_widget_tree_results")
         self.results_tree.setToolTip("Hier werden die Suchergebnisse als Baum angezeigt: Video → Sektion → Kapitel.")
-        self.results_model = QStandardItemModel(self)
-        self.results_tree.setModel(self.results_model)
+        self.results_model = SearchResultsModel(self)
+        self.results_model.set_icons(self._icon_video, self._icon_book)
+        # Sortierung per Header-Klick über einen Proxy; ohne Klick bleibt die Relevanz-Reihenfolge
+        self.results_proxy = QSortFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_proxy.setSortRole(SearchResultsModel.SORT_ROLE)
+        self.results_tree.setModel(self.results_proxy)
 
         # Konfiguration der TreeView (ursprünglich in _setup_tree)
-        self.results_model.setHorizontalHeaderLabels(["Video / Kapitel", "Kanal", "Zeitstempel"])
         header = self.results_tree.header()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
@@ -113,11 +367,13 @@ class SearchWidgetTree(QWidget):
         header.resizeSection(1, 150)  # Mindestbreite Kanal
         self.results_tree.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.results_tree.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        # Ohne Sortier-Indikator sortiert setSortingEnabled nicht sofort nach Spalte 0
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.results_tree.setSortingEnabled(True)
         self.results_tree.setAlternatingRowColors(True)
 
         # Delegate für Wort-Hervorhebung einsetzen (Spalten 0 und 1)
-        self._highlight_delegate = RichTextHighlightDelegate(lambda: self._current_search_terms)
+        self._highlight_delegate = RichTextHighlightDelegate(terms_signal=self.terms_changed)
         self.results_tree.setItemDelegateForColumn(0, self._highlight_delegate)
         self.results_tree.setItemDelegateForColumn(1, self._highlight_delegate)
 
@@ -131,6 +387,16 @@ class SearchWidgetTree(QWidget):
         self._completer = None
         self._completer_model = None
         self._suggest_provider = None
+        self._suggest_trie = None
+
+        # Live-Auswertung der Eingabe erst nach einer kurzen Tipp-Pause
+        self._pending_text = ""
+        self._query_timer = QTimer(self)
+        self._query_timer.setSingleShot(True)
+        self._query_timer.setInterval(150)
+        # Trie-Knoten der letzten Eingabe, um beim Weitertippen nicht ab der Wurzel abzusteigen
+        self._locus_node: Optional[dict] = None
+        self._locus_prefix = ""
 
     def _setup_layouts(self) -> None:
         """Ordnet die initialisierten Widgets in Layouts an."""
@@ -151,14 +417,18 @@ class SearchWidgetTree(QWidget):
         self.search_button.clicked.connect(self._on_search_clicked)
         self.search_input.returnPressed.connect(self._on_search_clicked)
         self.results_tree.doubleClicked.connect(self._on_result_double_clicked)
+        scroll_bar = self.results_tree.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._show_deferred_videos)
+        scroll_bar.rangeChanged.connect(self._show_deferred_videos)
+        self.info_button.clicked.connect(self._show_info_window)
 
-        # Such-Input Änderungen für Query-Vorschau
-        self.search_input.textChanged.connect(self._update_info_window)
+        # Tooltip für aktuelle Auswahl dynamisch setzen
+        self.strategy_combo.currentTextChanged.connect(self._update_strategy_tooltip)
+        # Strategie-Änderungen für Query-Vorschau; Texteingaben aktualisieren sie entprellt
         self.strategy_combo.currentTextChanged.connect(self._update_info_window)
-        self.search_input.returnPressed.connect(self._on_search_clicked)
-        self.results_tree.doubleClicked.connect(self._on_result_double_clicked)
         # Live-Parsing zur besseren Hervorhebung beim Tippen (nicht invasiv, keine Backend-Suche)
         self.search_input.textChanged.connect(self._on_query_changed)
+        self._query_timer.timeout.connect(self._apply_pending_query)
 
     def _update_strategy_tooltip(self, display_name: str) -> None:
         """Aktualisiert den Tooltip der Strategieauswahl basierend auf der aktuellen Auswahl."""
@@ -175,84 +445,21 @@ class SearchWidgetTree(QWidget):
 
     def set_search_terms(self, search_terms: List[str]):
         """Setzt die aktuellen Suchbegriffe für die Hervorhebung."""
+        key = tuple(sorted(search_terms or ()))
+        if key == self._current_search_terms_key:
+            return
+        self._current_search_terms_key = key
         self._current_search_terms = search_terms if search_terms else []
+        self.terms_changed.emit(self._current_search_terms)
         logger.debug(f"SearchWidgetTree: Suchbegriffe für Hervorhebung gesetzt: {self._current_search_terms}")
         self._refresh_highlighting()
 
-    def _highlight_search_terms(self, text: str) -> str:
-        """Hebt Suchbegriffe im Text farblich hervor - verwendet Rich Text für Qt."""
-        if not self._current_search_terms or not text:
-            return text
-
-        highlighted_text = text
-
-        # Sortiere Suchbegriffe nach Länge (längste zuerst) um Überschneidungen zu vermeiden
-        sorted_terms = sorted(self._current_search_terms, key=len, reverse=True)
-
-        for term in sorted_terms:
-            if term.strip():  # Nur nicht-leere Begriffe
-                # Case-insensitive Suche mit Rich Text Hervorhebung für Qt
-                import re
-
-                pattern = re.compile(re.escape(term), re.IGNORECASE)
-                highlighted_text = pattern.sub(
-                    lambda match: f'<span style="background-color: #FFFF00; color: #000000; font-weight: bold;">{match.group()}</span>',
-                    highlighted_text,
-                )
-
-        return highlighted_text
-
-    def _create_highlighted_item(self, text: str, prefix: str = "") -> QStandardItem:
-        """Erstellt ein QStandardItem mit farblicher Hervorhebung."""
-
-        full_text = f"{prefix}{text}"
-        item = QStandardItem(full_text)
-        item.setEditable(False)
-
-        # Optional: Tooltip setzen, wenn ein Begriff vorkommt
-        if self._current_search_terms and any(
-            t.strip() and t.lower() in text.lower() for t in self._current_search_terms
-        ):
-            item.setToolTip(f"Suchbegriff gefunden: {text}")
-
-        return item
-
-    def _snippet_to_plain_text(self, text: str) -> str:
-        """Wandelt ein FTS5-Snippet mit HTML-Markup in Plain-Text um.
-
-        Der Delegate rendert Hervorhebung per HTML selbst. Um sichtbare
-        Tags wie <mark> in der TreeView zu vermeiden, entfernen wir
-        HTML-Markup aus Snippets und überlassen die farbliche Hervorhebung
-        dem Delegate anhand der gesetzten Suchbegriffe.
-
-        Args:
-            text: Snippet-Text, potenziell mit HTML-Tags.
-
-        Returns:
-            Bereinigter Plain-Text ohne Tags und mit decodierten Entities.
-        """
-        if not text:
-            return ""
-        try:
-            import re
-            import html as py_html
-
-            no_tags = re.sub(r"<[^>]+>", "", text)
-            return py_html.unescape(no_tags)
-        except Exception:
-            return text
-
     def _refresh_highlighting(self) -> None:
         """Erzwingt ein Redraw aller sichtbaren Zellen, damit der Delegate neu zeichnet."""
-        if not self.results_model or self.results_model.rowCount() == 0:
+        # Die Daten selbst ändern sich nicht, nur die Hervorhebung im Delegate: ein Repaint des
+        # Viewports zeichnet genau die sichtbaren Zellen neu, ohne dataChanged über das ganze Model
+        if self.results_model.rowCount() > 0:
             self.results_tree.viewport().update()
-            return
-        top_left = self.results_model.index(0, 0)
-        bottom_right = self.results_model.index(
-            max(0, self.results_model.rowCount() - 1), max(0, self.results_model.columnCount() - 1)
-        )
-        self.results_model.dataChanged.emit(top_left, bottom_right)
-        self.results_tree.viewport().update()
 
     @Slot()
     def _on_search_clicked(self) -> None:
@@ -262,12 +469,16 @@ class SearchWidgetTree(QWidget):
             strategy = self._get_selected_strategy()
             logger.debug(f"Benutzer startet Suche nach: '{keyword}' mit Strategie: {strategy.value}")
 
-            # Query parsen und Tokens für Hervorhebung übernehmen
+            # Query parsen und Tokens für Hervorhebung übernehmen; ausstehende Live-Auswertung entfällt
+            self._query_timer.stop()
             q = parse_search_query(keyword)
             self.set_search_terms(tokens_for_highlighting(q))
 
+            # Ergebnisse dieser Suche später unter ihrem Schlüssel im Cache ablegen
+            self._pending_cache_key = self._cache_key(keyword, strategy)
+
             # UI für den Ladezustand vorbereiten
-            self.results_model.removeRows(0, self.results_model.rowCount())
+            self._clear_results()
             self.status_label.setText("Suche läuft...")
             self.status_label.show()
             self.results_tree.hide()
@@ -284,8 +495,31 @@ class SearchWidgetTree(QWidget):
         Args:
             provider: Funktion str -> list[str].
         """
+        self._suggest_provider = provider
+        if self._completer_model is not None:
+            # Vorhandenen Completer weiterverwenden, nur Vorschläge des alten Providers verwerfen
+            self._completer_model.setStringList([])
+            return
+        self._ensure_completer()
+
+    def set_completer_corpus(self, words: List[str]) -> None:
+        """Setzt einen festen Vorschlagskorpus, der einmal in einen Präfix-Trie eingefügt wird.
+
+        Vorschläge für die aktuelle Eingabe kommen dann aus dem Trie; der Provider wird nur noch
+        gefragt, wenn der Trie für die Eingabe keinen Treffer hat.
+
+        Args:
+            words: Alle Begriffe, die vorgeschlagen werden können.
+        """
+        self._suggest_trie = PrefixTrie(words)
+        self._locus_node, self._locus_prefix = None, ""
+        self._ensure_completer()
+
+    def _ensure_completer(self) -> None:
+        """Erstellt den QCompleter samt Model beim ersten Bedarf."""
+        if self._completer is not None:
+            return
         try:
-            self._suggest_provider = provider
             self._completer_model = QStringListModel([], self)
             self._completer = QCompleter(self)
             self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
@@ -296,9 +530,40 @@ class SearchWidgetTree(QWidget):
         except Exception as e:
             logger.warning(f"QCompleter konnte nicht initialisiert werden: {e}")
 
+    def _suggestions_for(self, text: str) -> List[str]:
+        """Liefert Vorschläge aus dem Trie und fällt ohne Treffer auf den Provider zurück."""
+        if self._suggest_trie is not None and text:
+            node = self._descend_suggest_trie(text.lower())
+            matches = self._suggest_trie.collect(node, self.MAX_SUGGESTIONS) if node is not None else []
+            if matches:
+                return matches
+        if self._suggest_provider is not None:
+            return self._suggest_provider(text) or []
+        return []
+
+    def _descend_suggest_trie(self, prefix: str) -> Optional[dict]:
+        """Steigt im Trie zum Knoten von ``prefix`` ab und setzt dabei am letzten Knoten fort.
+
+        Beim Tippen verlängert sich die Eingabe meist nur um ein Zeichen; dann wird ab dem
+        gemerkten Knoten der vorigen Eingabe nur über die neuen Zeichen abgestiegen.
+        """
+        if self._locus_node is not None and prefix.startswith(self._locus_prefix):
+            node = self._suggest_trie.descend(prefix[len(self._locus_prefix) :], self._locus_node)
+        else:
+            node = self._suggest_trie.descend(prefix)
+        self._locus_node, self._locus_prefix = (node, prefix) if node is not None else (None, "")
+        return node
+
     @Slot(str)
     def _on_query_changed(self, text: str) -> None:
+        """Merkt die Eingabe vor; ausgewertet wird erst, wenn eine Tipp-Pause eintritt."""
+        self._pending_text = text
+        self._query_timer.start()
+
+    @Slot()
+    def _apply_pending_query(self) -> None:
         """Parst die Eingabe live für bessere Hervorhebung und aktualisiert ggf. Vorschläge."""
+        text = self._pending_text
         try:
             q = parse_search_query(text)
             self.set_search_terms(tokens_for_highlighting(q))
@@ -307,15 +572,15 @@ class SearchWidgetTree(QWidget):
             search_terms = [t.strip() for t in (text or "").split() if t.strip()]
             self.set_search_terms(search_terms)
 
-        # Completer-Update, wenn Provider gesetzt ist
-        if self._completer is not None and self._suggest_provider is not None:
+        # Completer-Update, wenn Trie oder Provider gesetzt ist
+        if self._completer_model is not None:
             try:
-                suggestions = self._suggest_provider(text) or []
-                if self._completer_model is not None:
-                    self._completer_model.setStringList(suggestions)
+                self._completer_model.setStringList(self._suggestions_for(text))
             except Exception as e:
                 logger.warning(f"QCompleter konnte nicht aktualisiert werden: {e}")
 
+        self._update_info_window()
+
     @Slot()
     def _show_info_window(self) -> None:
         """Zeigt das Info-Fenster für Suchstrategien."""
@@ -351,11 +616,11 @@ class SearchWidgetTree(QWidget):
     def display_results(self, results: List[SearchResult]) -> None:
         """Slot zum Anzeigen der Suchergebnisse in der TreeView mit BM25-Relevanz-Sortierung."""
         logger.debug(f"Zeige {len(results)} Suchergebnisse hierarchisch an (mit Relevanz-Scores).")
-        self.results_model.removeRows(0, self.results_model.rowCount())
-        # Wichtig: Header neu setzen, da removeRows sie löschen kann
-        self.results_model.setHorizontalHeaderLabels(["Video / Kapitel", "Kanal", "Zeitstempel"])
+        self._remember_results(results)
+        self._deferred_videos = []
 
         if not results:
+            self._clear_results()
             self.status_label.setText("Keine Ergebnisse für deine Suche gefunden.")
             self.status_label.show()
             self.results_tree.hide()
@@ -364,96 +629,107 @@ class SearchWidgetTree(QWidget):
         self.status_label.hide()
         self.results_tree.show()
 
-        # Schritt 1: Ergebnisse nach Video gruppieren
-        videos: Dict[str, List[SearchResult]] = defaultdict(list)
+        # Schritt 1: Ergebnisse in einem Durchlauf nach Video gruppieren und dabei die beste
+        # (höchste) Kapitel-Relevanz als Video-Relevanz mitführen
+        videos: Dict[str, list] = {}
         for res in results:
-            videos[res.video_title].append(res)
-
-        # Schritt 2: Videos nach bester Kapitel-Relevanz sortieren für bessere UX
-        video_relevance = {}
-        for video_title, chapters in videos.items():
-            # Verwende die beste (höchste) Relevanz der Kapitel als Video-Relevanz
-            video_relevance[video_title] = max(chapter.relevance_score for chapter in chapters)
-
-        # Videos nach Relevanz sortiert verarbeiten
-        sorted_videos = sorted(videos.items(), key=lambda x: video_relevance[x[0]], reverse=True)
-
-        # Schritt 3: Baumstruktur aufbauen mit Relevanz-basierten Tooltips
-        for video_title, chapters in sorted_videos:
-            # Hole Kanalinformationen vom ersten Kapitel (alle haben den gleichen Kanal)
-            first_chapter = chapters[0]
-            channel_display = first_chapter.channel_name
-            if first_chapter.channel_handle:
-                channel_display = f"{first_chapter.channel_name} ({first_chapter.channel_handle})"
-
-            # Top-Level-Item für das Video erstellen
-            video_item = self._create_highlighted_item(video_title, "")
-            video_item.setData(None, Qt.ItemDataRole.UserRole)  # Kein Link für Video-Item
-            video_item.setIcon(Icons.get(Icons.VIDEO))
-            # Relevanz-Info als Tooltip hinzufügen
-            video_item.setToolTip(f"Beste Relevanz: {video_relevance[video_title]:.2f}")
-
-            channel_item = QStandardItem(channel_display)
-            channel_item.setEditable(False)
-            channel_item.setData(None, Qt.ItemDataRole.UserRole)
-
-            chapter_count_item = QStandardItem(f"{len(chapters)} Treffer")
-            chapter_count_item.setEditable(False)
-            chapter_count_item.setData(None, Qt.ItemDataRole.UserRole)
-
-            self.results_model.appendRow([video_item, channel_item, chapter_count_item])
-
-            # Kapitel nach Relevanz sortieren (beste zuerst)
-            chapters_sorted = sorted(chapters, key=lambda c: c.relevance_score, reverse=True)
-
-            # Child-Items für jedes gefundene Kapitel direkt unter dem Video-Item erstellen
-            for chapter in chapters_sorted:
-                # Verwende highlighted_snippet falls verfügbar, sonst chapter_title
-                display_title = (
-                    self._snippet_to_plain_text(chapter.highlighted_snippet)
-                    if chapter.highlighted_snippet
-                    else chapter.chapter_title
-                )
-                chapter_item = self._create_highlighted_item(display_title, "")
-                chapter_item.setIcon(Icons.get(Icons.BOOK_OPEN))
-                # Link im Item speichern
-                chapter_item.setData(chapter.timestamp_url, Qt.ItemDataRole.UserRole)
-                # Erweiterte Tooltip-Info mit Relevanz
-                chapter_item.setToolTip(
-                    f"Relevanz: {chapter.relevance_score:.2f}\nKlicken um Video an dieser Stelle zu öffnen"
-                )
-
-                channel_child = QStandardItem("")
-                channel_child.setEditable(False)
-                channel_child.setData(chapter.timestamp_url, Qt.ItemDataRole.UserRole)
-
-                # Zeitstempel mit Relevanz-Indikator
-                timestamp_display = f"{chapter.start_time_str} ({chapter.relevance_score:.1f})"
-                timestamp_item = QStandardItem(timestamp_display)
-                timestamp_item.setEditable(False)
-                timestamp_item.setData(chapter.timestamp_url, Qt.ItemDataRole.UserRole)
-
-                video_item.appendRow([chapter_item, channel_child, timestamp_item])
-
-        # Performance-Optimierung: Nur bei wenigen Videos automatisch expandieren
-        if len(videos) <= 3:
-            self.results_tree.expandAll()
+            entry = videos.get(res.video_title)
+            if entry is None:
+                videos[res.video_title] = [[res], res.relevance_score]
+            else:
+                entry[0].append(res)
+                if res.relevance_score > entry[1]:
+                    entry[1] = res.relevance_score
+
+        video_count = len(videos)
+
+        # Schritt 2: Videos nach bester Kapitel-Relevanz sortieren für bessere UX. Bei sehr vielen
+        # Videos nur die besten VIDEO_BATCH_SIZE auswählen; der Rest folgt beim Scrollen ans Ende
+        if video_count > self.VIDEO_BATCH_SIZE:
+            sorted_videos = heapq.nlargest(self.VIDEO_BATCH_SIZE, videos.items(), key=_video_relevance)
+            for video_title, _ in sorted_videos:
+                del videos[video_title]
+            self._deferred_videos = list(videos.items())
         else:
-            logger.debug(f"Viele Ergebnisse ({len(videos)} Videos) - TreeView nicht automatisch expandiert")
+            sorted_videos = sorted(videos.items(), key=_video_relevance, reverse=True)
+
+        # Schritt 3: Videos mit einem Model-Reset übernehmen; die View zeichnet erst am Ende neu
+        self.results_tree.setUpdatesEnabled(False)
+        try:
+            self.results_model.set_videos(sorted_videos)
+
+            # Performance-Optimierung: Nur bei wenigen Videos automatisch expandieren
+            if video_count <= self.AUTO_EXPAND_MAX_VIDEOS:
+                self.results_tree.expandAll()
+            else:
+                logger.debug(f"Viele Ergebnisse ({video_count} Videos) - TreeView nicht automatisch expandiert")
+        finally:
+            self.results_tree.setUpdatesEnabled(True)
 
         # Sortierung nach Relevanz ist bereits erfolgt, daher keine alphabetische Sortierung
         logger.debug("Ergebnisse nach BM25-Relevanz sortiert angezeigt")
 
+    def _clear_results(self) -> None:
+        """Leert den Baum samt zurückgestellter Videos."""
+        self._deferred_videos = []
+        self.results_model.clear()
+
+    @Slot()
+    def _show_deferred_videos(self) -> None:
+        """Fügt die nächsten zurückgestellten Videos an, sobald das Ende der Liste sichtbar ist."""
+        if not self._deferred_videos:
+            return
+        scroll_bar = self.results_tree.verticalScrollBar()
+        if scroll_bar.value() < scroll_bar.maximum():
+            return
+
+        batch = heapq.nlargest(self.VIDEO_BATCH_SIZE, self._deferred_videos, key=_video_relevance)
+        shown = {video_title for video_title, _ in batch}
+        self._deferred_videos = [video for video in self._deferred_videos if video[0] not in shown]
+        logger.debug(f"Zeige {len(batch)} weitere Videos, {len(self._deferred_videos)} verbleiben")
+
+        self.results_tree.setUpdatesEnabled(False)
+        try:
+            self.results_model.append_videos(batch)
+        finally:
+            self.results_tree.setUpdatesEnabled(True)
+
+    def _remember_results(self, results: List[SearchResult]) -> None:
+        """Legt die Ergebnisse der zuletzt gestarteten Suche im LRU-Cache ab (leere Ergebnisse nicht)."""
+        key, self._pending_cache_key = self._pending_cache_key, None
+        if key is None or not results:
+            return
+        self._result_cache[key] = list(results)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    @staticmethod
+    def _cache_key(keyword: str, strategy: SearchStrategy) -> tuple[str, str]:
+        """Schlüssel für den Ergebnis-Cache: Suchbegriff ohne Groß-/Kleinschreibung plus Strategie."""
+        return (keyword.strip().casefold(), strategy.value)
+
+    def cached_results(self, keyword: str, strategy: SearchStrategy) -> Optional[List[SearchResult]]:
+        """Liefert zwischengespeicherte Ergebnisse einer früheren Suche oder None."""
+        key = self._cache_key(keyword, strategy)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+        return cached
+
+    def invalidate_cache(self) -> None:
+        """Verwirft alle zwischengespeicherten Suchergebnisse, z. B. nach neuen Kapiteln in der Datenbank."""
+        self._result_cache.clear()
+        self._pending_cache_key = None
+
     @Slot()
     def _on_result_double_clicked(self, index) -> None:
         """Öffnet den YouTube-Link beim Doppelklick auf eine Zeile."""
-        # Hole das geklickte Item aus dem Model
-        item = self.results_model.itemFromIndex(index)
-        if not item:
+        if not index.isValid():
             return
 
-        # Hole den im Item gespeicherten Link (UserRole)
-        url_str = item.data(Qt.ItemDataRole.UserRole)
+        # Der Link liegt auf Spalte 0 der Zeile (UserRole), auch bei Klick auf leere Zellen
+        url_str = index.siblingAtColumn(0).data(Qt.ItemDataRole.UserRole)
 
         if url_str:
             logger.info(f"Öffne YouTube-Link: {url_str}")
@@ -461,28 +737,6 @@ class SearchWidgetTree(QWidget):
         else:
             logger.debug("Doppelklick auf Video-Item (kein Link verfügbar)")
 
-    def _extract_video_id_from_url(self, timestamp_url: str) -> str:
-        """Extrahiert die Video-ID aus einer YouTube-URL."""
-        try:
-            import re
-
-            # Regex für YouTube URLs: youtube.com/watch?v=VIDEO_ID oder youtu.be/VIDEO_ID
-            patterns = [
-                r"youtube\.com/watch\?v=([a-zA-Z0-9_-]+)",
-                r"youtu\.be/([a-zA-Z0-9_-]+)",
-                r"youtube\.com/embed/([a-zA-Z0-9_-]+)",
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, timestamp_url)
-                if match:
-                    return match.group(1)
-
-            return ""
-        except Exception as e:
-            logger.warning(f"Fehler beim Extrahieren der Video-ID aus URL {timestamp_url}: {e}")
-            return ""
-
     def _get_all_chapters_for_video(self, video_id: str) -> List:
         """Holt alle Kapitel für ein Video aus der Datenbank."""
         try:
@@ -9,7 +9,8 @@ import os
 from typing import Optional
 
 from loguru import logger
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QMainWindow,
@@ -21,9 +22,49 @@ from PySide6.QtWidgets import (
 )
 
 
+class _FileLoadSignals(QObject):
+    """Signale des Datei-Ladevorgangs im Thread-Pool (QRunnable ist kein QObject)."""
+
+    chunk_read = Signal(int, str)  # Ladevorgang, nächster Textblock
+    finished = Signal(int, str)  # Ladevorgang, Dateipfad
+    error = Signal(int, str, str)  # Ladevorgang, Dateipfad, Fehlermeldung
+
+
+class _FileLoadTask(QRunnable):
+    """Liest eine Textdatei blockweise im Thread-Pool und reicht die Blöcke per Signal an die GUI weiter."""
+
+    def __init__(self, file_path: str, chunk_size: int, generation: int):
+        super().__init__()
+        self.signals = _FileLoadSignals()
+        self._file_path = file_path
+        self._chunk_size = chunk_size
+        self._generation = generation
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Bricht das Einlesen nach dem aktuellen Block ab; es folgen keine weiteren Signale."""
+        self._cancelled = True
+
+    def run(self):
+        try:
+            with open(self._file_path, "r", encoding="utf-8") as f:
+                while chunk := f.read(self._chunk_size):
+                    if self._cancelled:
+                        return
+                    self.signals.chunk_read.emit(self._generation, chunk)
+        except Exception as e:
+            self.signals.error.emit(self._generation, self._file_path, str(e))
+            return
+        if not self._cancelled:
+            self.signals.finished.emit(self._generation, self._file_path)
+
+
 class TextFileEditorWidget(QWidget):
     """Widget zur Anzeige und Bearbeitung von Dateiinhalten mit Speichern-Funktion."""
 
+    # Blockgröße beim Einlesen von Dateien
+    READ_CHUNK_SIZE = 64 * 1024
+
     # --- Signale für externe Kommunikation ---
     fileSaved = Signal(str)  # Signal mit dem Dateipfad, wenn gespeichert wurde
     widgetClosed = Signal()  # Signal, wenn das Widget geschlossen wird
@@ -40,6 +81,9 @@ class TextFileEditorWidget(QWidget):
         self._content = content
         self._file_path = file_path
         self._window: Optional[QMainWindow] = None
+        self._load_task: Optional[_FileLoadTask] = None
+        # Zählt die Ladevorgänge hoch; Signale älterer Vorgänge werden daran erkannt und verworfen
+        self._load_generation = 0
 
         self._setup_ui()
 
@@ -113,17 +157,109 @@ class TextFileEditorWidget(QWidget):
             # Wenn im MainWindow eingebettet, einfach ausblenden oder schließen
             self.close()
 
-    def load_file(self, file_path: str) -> None:
+    def stream_file(self, file_path: str) -> None:
         """
-        Lädt eine neue Datei in den Editor.
+        Liest eine Datei blockweise in den Editor, statt sie komplett als String zu laden.
+
+        Die Blöcke werden strikt als UTF-8 dekodiert. Der Dateipfad wird erst nach einem
+        vollständigen Lesen übernommen; bei einem Fehler wird der teilweise gelesene Inhalt
+        verworfen, damit er nicht über die Datei gespeichert werden kann. Der Inhalt steht
+        danach über ``text_edit.toPlainText()`` zur Verfügung.
+
+        Raises:
+            OSError: Wenn die Datei nicht geöffnet werden kann.
+            UnicodeDecodeError: Wenn die Datei kein gültiges UTF-8 enthält.
         """
+        # Ein laufender Hintergrund-Ladevorgang darf nicht in diesen Inhalt schreiben
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+        self._load_generation += 1
+
+        self.text_edit.clear()
+        self.text_edit.setPlaceholderText("")
+        # Das Einlesen soll nicht als rückgängig machbare Bearbeitung zählen
+        self.text_edit.setUndoRedoEnabled(False)
+        cursor = QTextCursor(self.text_edit.document())
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+                while chunk := f.read(self.READ_CHUNK_SIZE):
+                    cursor.insertText(chunk)
+        except (OSError, UnicodeDecodeError):
+            self._file_path = ""
+            self.text_edit.clear()
+            self._set_editable(True)
+            raise
+        self._file_path = file_path
+        self._set_editable(True)
+        self.text_edit.moveCursor(QTextCursor.MoveOperation.Start)
 
-            self._file_path = file_path
-            self._content = content
-            self.text_edit.setPlainText(content)
+    def load_file_async(self, file_path: str) -> None:
+        """
+        Lädt eine Datei im Hintergrund; der Editor kann sofort angezeigt werden.
+
+        Die Blöcke werden über Queued-Signals im GUI-Thread eingefügt. Bis ``finished`` eintrifft, ist der
+        Editor schreibgeschützt, Speichern deaktiviert und kein Dateipfad gesetzt, damit ein unvollständig
+        geladener Inhalt nie über die Datei geschrieben werden kann.
+        """
+        # Einen noch laufenden Ladevorgang abbrechen, damit seine Blöcke nicht in die neue Datei geraten
+        if self._load_task is not None:
+            self._load_task.cancel()
+        self._load_generation += 1
+
+        self._file_path = ""
+        self.text_edit.clear()
+        self.text_edit.setPlaceholderText("Lade Datei …")
+        self._set_editable(False)
+
+        self._load_task = _FileLoadTask(file_path, self.READ_CHUNK_SIZE, self._load_generation)
+        self._load_task.signals.chunk_read.connect(self._on_file_chunk_read)
+        self._load_task.signals.finished.connect(self._on_file_load_finished)
+        self._load_task.signals.error.connect(self._on_file_load_error)
+        QThreadPool.globalInstance().start(self._load_task)
+
+    @Slot(int, str)
+    def _on_file_chunk_read(self, generation: int, chunk: str) -> None:
+        if generation != self._load_generation:
+            return
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk)
+
+    @Slot(int, str)
+    def _on_file_load_finished(self, generation: int, file_path: str) -> None:
+        if generation != self._load_generation:
+            return
+        self._load_task = None
+        # Erst der vollständig gelesene Inhalt darf wieder unter dem Dateipfad gespeichert werden
+        self._file_path = file_path
+        self.text_edit.setPlaceholderText("")
+        self._set_editable(True)
+        self.text_edit.moveCursor(QTextCursor.MoveOperation.Start)
+        logger.debug(f"Datei im Hintergrund geladen: {file_path}")
+
+    @Slot(int, str, str)
+    def _on_file_load_error(self, generation: int, file_path: str, message: str) -> None:
+        if generation != self._load_generation:
+            return
+        self._load_task = None
+        logger.error(f"Fehler beim Laden von {file_path}: {message}")
+        # Teilweise geladenen Text verwerfen; Editor bleibt schreibgeschützt und ohne Dateipfad
+        self.text_edit.clear()
+        self.text_edit.setPlaceholderText(f"Fehler beim Laden der Datei: {message}")
+
+    def _set_editable(self, editable: bool) -> None:
+        """Schaltet Bearbeiten, Rückgängig und Speichern gemeinsam frei bzw. ab."""
+        self.text_edit.setReadOnly(not editable)
+        self.text_edit.setUndoRedoEnabled(editable)
+        self.save_button.setEnabled(editable)
+
+    def load_file(self, file_path: str) -> None:
+        """
+        Lädt eine neue Datei in den Editor.
+        """
+        try:
+            self.stream_file(file_path)
 
             # Update window title
             self.setWindowTitle(f"Text Editor - {os.path.basename(file_path)}")
@@ -18,3 +18,5 @@ class SearchResult:
     # Neue Felder für BM25-Ranking und Snippet-Highlighting
     relevance_score: float = 0.0
     highlighted_snippet: str = ""
+    # YouTube-Video-ID, damit die GUI sie nicht aus timestamp_url parsen muss
+    video_id: str = ""
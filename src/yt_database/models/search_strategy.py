@@ -5,7 +5,7 @@ Defines different approaches for interpreting and executing search queries.
 """
 
 from enum import Enum
-from typing import NamedTuple
+from typing import Callable, Dict, List, NamedTuple
 
 
 class SearchStrategy(Enum):
@@ -74,3 +74,38 @@ SEARCH_STRATEGIES = [
         example="machine learning → AI-Bedeutung + exakte Keywords, gewichtet kombiniert",
     ),
 ]
+
+# Schneller Zugriff auf die Anzeigeinformationen einer Strategie
+SEARCH_STRATEGIES_BY_KEY: Dict[SearchStrategy, SearchStrategyInfo] = {s.strategy: s for s in SEARCH_STRATEGIES}
+
+
+# Vorschau-Builder pro Strategie: (bereinigte Eingabe, Wörter, Wörter mit "*") -> FTS5-Query.
+# Einmal beim Import aufgebaut, damit die Live-Vorschau nur noch ein Dict-Lookup braucht.
+_QUERY_BUILDERS: Dict[SearchStrategy, Callable[[str, List[str], List[str]], str]] = {
+    SearchStrategy.EXACT_PHRASE: lambda q, w, ws: f'"{q}"',
+    SearchStrategy.ALL_WORDS: lambda q, w, ws: w[0] if len(w) == 1 else " AND ".join(ws),
+    SearchStrategy.ANY_WORD: lambda q, w, ws: " OR ".join(ws),
+    SearchStrategy.FUZZY: lambda q, w, ws: " OR ".join([x + "*" if len(x) > 3 else x for x in w]),
+    SearchStrategy.AUTO: lambda q, w, ws: f"{q}*" if len(w) == 1 else f'("{q}") OR ({" AND ".join(ws)})',
+}
+
+
+def _passthrough_query(query: str, words: List[str], words_star: List[str]) -> str:
+    return query
+
+
+def build_fts_query(query: str, strategy: SearchStrategy) -> str:
+    """Erzeugt die FTS5-Query, wie sie in der Vorschau der Suchstrategien angezeigt wird.
+
+    Args:
+        query: Die Sucheingabe des Benutzers (nicht leer).
+        strategy: Die gewählte Suchstrategie.
+
+    Returns:
+        str: Die generierte FTS5-Query; unbekannte Strategien liefern die Eingabe unverändert.
+    """
+    query = query.strip()
+    words = query.split()
+    # Wildcard-Varianten nur einmal erzeugen, AND- und OR-Verknüpfung nutzen dieselbe Liste
+    words_star = [w + "*" for w in words]
+    return _QUERY_BUILDERS.get(strategy, _passthrough_query)(query, words, words_star)
@@ -0,0 +1,81 @@
+"""
+Präfix-Trie für Suchvorschläge.
+
+Der Korpus wird einmal eingefügt; danach kostet eine Vorschlagsabfrage nur den Abstieg über die
+Zeichen des Präfixes plus das Einsammeln der Treffer unterhalb dieses Knotens. Die Reihenfolge
+des Korpus (z. B. nach Beliebtheit sortiert) bleibt als Rang erhalten.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+# Schlüssel für die (Rang, Wort)-Einträge, die an einem Knoten enden (kann kein Zeichen eines
+# Präfixes sein, da Präfixe zeichenweise abgestiegen werden)
+_WORDS = "$$"
+
+
+class PrefixTrie:
+    """Trie aus verschachtelten Dicts: ``{zeichen: knoten, "$$": [(rang, wort)]}``.
+
+    Die Suche ist case-insensitiv; eingefügte Wörter werden in ihrer ursprünglichen Schreibweise
+    zurückgegeben. Der Rang ist die Einfügereihenfolge, Treffer werden in dieser Reihenfolge geliefert.
+    """
+
+    def __init__(self, words: Optional[List[str]] = None):
+        """Initialisiert den Trie und fügt optional einen Startkorpus ein."""
+        self.root: Dict = {}
+        self._size = 0
+        if words:
+            self.insert_all(words)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, word: str) -> None:
+        """Fügt ein Wort mit dem nächsten Rang ein; Duplikate (ohne Beachtung der Schreibweise) werden ignoriert."""
+        key = word.strip().lower()
+        if not key:
+            return
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        words = node.setdefault(_WORDS, [])
+        if not any(existing.lower() == key for _, existing in words):
+            words.append((self._size, word.strip()))
+            self._size += 1
+
+    def insert_all(self, words: List[str]) -> None:
+        """Fügt mehrere Wörter ein; frühere Wörter erhalten den besseren Rang."""
+        for word in words:
+            self.insert(word)
+
+    def descend(self, prefix: str, node: Optional[Dict] = None) -> Optional[Dict]:
+        """Steigt ab ``node`` (Standard: Wurzel) über die Zeichen von ``prefix`` ab.
+
+        Returns:
+            Der Knoten des Präfixes oder ``None``, wenn kein Wort mit diesem Präfix existiert.
+        """
+        node = self.root if node is None else node
+        for char in prefix.lower():
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def collect(self, node: Dict, limit: int = 50) -> List[str]:
+        """Liefert die ``limit`` Wörter mit dem besten Rang unterhalb von ``node``, in Rangfolge."""
+        entries: List[Tuple[int, str]] = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for key, child in current.items():
+                if key == _WORDS:
+                    entries.extend(child)
+                else:
+                    stack.append(child)
+        return [word for _, word in heapq.nsmallest(limit, entries)]
+
+    def complete(self, prefix: str, limit: int = 50) -> List[str]:
+        """Liefert bis zu ``limit`` Wörter, die mit ``prefix`` beginnen."""
+        node = self.descend(prefix)
+        return self.collect(node, limit) if node is not None else []
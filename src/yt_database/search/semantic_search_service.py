@@ -318,6 +318,7 @@ class SemanticSearchService:
                 start_time_str=start_time_str,
                 relevance_score=similarity,  # Semantic Similarity als Relevanz
                 highlighted_snippet=snippet,
+                video_id=video_id,
             )
             results.append(result)
 
@@ -6,7 +6,9 @@ Diese Klasse lädt alle Videos aus der Datenbank in einem separaten Thread,
 um die GUI-Responsivität zu gewährleisten.
 """
 
+import mmap
 import os
+import re
 import time
 from typing import Any, List, Optional
 
@@ -16,6 +18,9 @@ from PySide6.QtCore import QObject, Signal
 from yt_database.database import Transcript
 from yt_database.services.protocols import ProjectManagerProtocol
 
+# Frontmatter-Schlüssel für Kapitel, unabhängig von Groß-/Kleinschreibung
+_CHAPTERS_KEY_PATTERN = re.compile(rb"chapters:", re.IGNORECASE)
+
 
 class DatabaseVideoLoaderWorker(QObject):
     """
@@ -322,10 +327,13 @@ class DatabaseVideoLoaderWorker(QObject):
             if not transcript_path or not os.path.exists(transcript_path):
                 return False
 
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                # Einfache Heuristik: Suche nach Kapitel-Markierungen
-                return "## Kapitel" in content or "# Kapitel" in content or "chapters:" in content.lower()
+            if os.path.getsize(transcript_path) == 0:
+                return False
+
+            # Datei per mmap durchsuchen statt komplett einzulesen: das OS lädt nur die berührten Seiten
+            with open(transcript_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Einfache Heuristik: Suche nach Kapitel-Markierungen ("# Kapitel" deckt auch "## Kapitel" ab)
+                return mm.find(b"# Kapitel") != -1 or _CHAPTERS_KEY_PATTERN.search(mm) is not None
 
         except Exception as e:
             logger.warning(f"DatabaseVideoLoaderWorker: Fehler beim Chapter-Check für Datei {transcript_path}: {e}")
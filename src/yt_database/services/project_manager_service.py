@@ -11,7 +11,8 @@ Dieser Service kapselt alle Operationen rund um Kanäle, Videos und Transkripte:
 """
 
 import os
-from typing import List, Optional
+from itertools import islice
+from typing import Callable, List, Optional
 
 import yaml
 from loguru import logger
@@ -656,6 +657,7 @@ class ProjectManagerService(ProjectManagerProtocol):
                         start_time_str=start_time_str,
                         relevance_score=relevance_score,
                         highlighted_snippet=clean_snippet,
+                        video_id=video_id,
                     )
                     results.append(result)
 
@@ -834,6 +836,66 @@ class ProjectManagerService(ProjectManagerProtocol):
             logger.error(f"Fehler beim Löschen von Video {video_id}: {e}")
             return {"success": False, "error": f"Fehler beim Löschen: {e}"}
 
+    # Maximale Anzahl IDs pro ``IN (...)``-Klausel (SQLite-Variablenlimit)
+    DELETE_BATCH_SIZE = 1000
+
+    def delete_videos_safe(
+        self, video_ids: List[str], progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> dict:
+        """
+        Löscht mehrere Videos samt Kapiteln in einer einzigen Transaktion.
+
+        Die IDs werden in Blöcken zu ``DELETE_BATCH_SIZE`` per ``IN (...)`` gelöscht, statt
+        für jedes Video eine eigene Abfrage und Transaktion auszuführen.
+
+        Args:
+            video_ids (List[str]): Die Video-IDs.
+            progress_callback (Callable[[int, int], None], optional): Wird nach jedem Block mit
+                (verarbeitet, gesamt) aufgerufen.
+
+        Returns:
+            dict: Aggregierte Statistiken (``deleted_videos``, ``deleted_chapters``, ``errors``).
+        """
+        deleted_videos = 0
+        deleted_chapters = 0
+        errors: list[str] = []
+        unique_ids = list(dict.fromkeys(video_ids))
+        ids = iter(unique_ids)
+        processed = 0
+        try:
+            with db.atomic():
+                while chunk := list(islice(ids, self.DELETE_BATCH_SIZE)):
+                    processed += len(chunk)
+                    existing = {
+                        row[0]
+                        for row in Transcript.select(Transcript.video_id).where(Transcript.video_id.in_(chunk)).tuples()
+                    }
+                    errors.extend(
+                        f"Video {video_id}: nicht gefunden." for video_id in chunk if video_id not in existing
+                    )
+                    if existing:
+                        deleted_chapters += Chapter.delete().where(Chapter.transcript.in_(list(existing))).execute()
+                        deleted_videos += Transcript.delete().where(Transcript.video_id.in_(list(existing))).execute()
+                    if progress_callback:
+                        progress_callback(processed, len(unique_ids))
+
+            logger.info(f"{deleted_videos} Videos mit {deleted_chapters} Kapiteln gelöscht.")
+            return {
+                "success": True,
+                "deleted_videos": deleted_videos,
+                "deleted_chapters": deleted_chapters,
+                "errors": errors,
+            }
+
+        except Exception as e:
+            logger.error(f"Fehler beim Batch-Löschen von {len(video_ids)} Videos: {e}")
+            return {
+                "success": False,
+                "deleted_videos": 0,
+                "deleted_chapters": 0,
+                "errors": [f"Fehler beim Löschen: {e}"],
+            }
+
     def delete_channel_safe(self, channel_id: str) -> dict:
         """
         Löscht einen Kanal und alle zugehörigen Videos/Kapitel sicher mit Statistiken.
@@ -931,6 +993,38 @@ class ProjectManagerService(ProjectManagerProtocol):
             logger.error(f"Fehler beim Löschen von Kapiteln für Video {video_id}: {e}")
             return {"success": False, "error": f"Fehler beim Löschen: {e}"}
 
+    def get_batch_deletion_preview(self, video_ids: List[str]) -> dict:
+        """
+        Gibt eine Vorschau der Löschung mehrerer Videos zurück ohne zu löschen.
+
+        Die betroffenen Kapitel werden mit einer COUNT-Abfrage pro Block zu ``DELETE_BATCH_SIZE``
+        IDs gezählt (bei üblichen Selektionen also einer einzigen), statt eine Vorschau je Video abzufragen.
+
+        Args:
+            video_ids (List[str]): Die Video-IDs.
+
+        Returns:
+            dict: Vorschau-Statistiken wie bei ``get_deletion_preview``.
+        """
+        unique_ids = list(dict.fromkeys(video_ids))
+        ids = iter(unique_ids)
+        chapter_count = 0
+        try:
+            while chunk := list(islice(ids, self.DELETE_BATCH_SIZE)):
+                chapter_count += Chapter.select().where(Chapter.transcript.in_(chunk)).count()
+        except Exception as e:
+            logger.error(f"Fehler bei Löschungsvorschau für {len(unique_ids)} Videos: {e}")
+            return {"success": False, "error": f"Fehler bei Vorschau: {e}"}
+
+        return {
+            "success": True,
+            "type": "videos",
+            "title": f"{len(unique_ids)} Videos",
+            "videos_affected": len(unique_ids),
+            "chapters_affected": chapter_count,
+            "channels_affected": 0,
+        }
+
     def get_deletion_preview(self, item_type: str, item_id: str) -> dict:
         """
         Gibt eine Vorschau der Löschungsauswirkungen zurück ohne zu löschen.
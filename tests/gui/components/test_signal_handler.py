@@ -58,6 +58,7 @@ class DummyDatabaseWidget(QObject):
     text_editor_open_requested = DummySignal()
     single_transcription_requested = DummySignal()
     batch_transcription_requested = DummySignal()
+    batch_chapter_generation_requested = DummySignal()
 
 class DummySearchWidget(QObject):
     search_requested = DummySignal()
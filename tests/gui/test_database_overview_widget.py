@@ -7,3 +7,133 @@ def test_database_table_view_widget_import():
     from yt_database.gui.widgets.database_table_view_widget import DatabaseOverviewWidget
 
     assert DatabaseOverviewWidget is not None
+
+
+def test_searchable_proxy_filters_on_search_key(qtbot):
+    from PySide6.QtGui import QStandardItem, QStandardItemModel
+
+    from yt_database.gui.widgets.database_table_view_widget import SEARCH_KEY_ROLE, SearchableProxy
+
+    model = QStandardItemModel()
+    for title, duration in (("Hallo Welt", "00:01:00"), ("Anderes Video", "Welt")):
+        row = [QStandardItem("") for _ in range(12)]
+        row[0].setText(title)
+        row[0].setData(f"{title}\nabc123\n@kanal\n".lower(), SEARCH_KEY_ROLE)
+        row[2].setText(duration)  # Dauer ist nicht Teil des Suchschlüssels
+        model.appendRow(row)
+
+    proxy = SearchableProxy()
+    proxy.setSourceModel(model)
+
+    proxy.setFilterFixedString("WELT")
+    assert proxy.rowCount() == 1
+
+    proxy.setFilterFixedString("@Kanal")
+    assert proxy.rowCount() == 2
+
+    # Ein Treffer darf nicht über die Feldgrenze zwischen Titel und Video-ID reichen
+    proxy.setFilterFixedString("welt abc")
+    assert proxy.rowCount() == 0
+
+    proxy.setFilterFixedString("")
+    assert proxy.rowCount() == 2
+
+
+def test_format_duration():
+    from yt_database.gui.widgets.database_table_view_widget import _format_duration
+
+    assert _format_duration(3725) == "01:02:05"
+    assert _format_duration(None) == "00:00:00"
+
+
+def test_transcript_table_model_serves_check_columns_without_items(qtbot):
+    from PySide6.QtCore import QSortFilterProxyModel
+    from PySide6.QtGui import QIcon, QPixmap, QStandardItem
+    from PySide6.QtWidgets import QStyleOptionViewItem
+
+    from yt_database.gui.widgets.database_table_view_widget import CheckMarkDelegate, TranscriptTableModel
+
+    model = TranscriptTableModel()
+    items = [QStandardItem(str(column)) for column in range(12)]
+    items[6] = items[7] = None
+    model.append_transcript_row(items, has_chapters=True, has_transcript=False)
+
+    assert model.item(0, 6) is None
+    assert model.is_checked(0, 6)
+    assert not model.is_checked(0, 7)
+    assert not model.has_transcript(0)
+    assert model.index(0, 11).data() == "11"
+
+    # Der Delegate liest die Flags auch durch ein Proxy-Model hindurch
+    pixmap = QPixmap(4, 4)
+    pixmap.fill()
+    proxy = QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    delegate = CheckMarkDelegate(QIcon(pixmap))
+    for column, expected in ((6, True), (7, False)):
+        option = QStyleOptionViewItem()
+        delegate.initStyleOption(option, proxy.index(0, column))
+        assert bool(option.features & QStyleOptionViewItem.ViewItemFeature.HasDecoration) is expected
+
+    model.removeRows(0, model.rowCount())
+    assert model.rowCount() == 0
+    assert not model.has_transcript(0)
+
+
+def test_batch_delete_task_reports_service_result(qtbot):
+    from yt_database.gui.widgets.database_table_view_widget import _BatchDeleteTask
+
+    class DummyProjectManagerService:
+        def delete_videos_safe(self, video_ids, progress_callback=None):
+            progress_callback(len(video_ids), len(video_ids))
+            return {"success": True, "deleted_videos": len(video_ids), "deleted_chapters": 0, "errors": []}
+
+    task = _BatchDeleteTask(DummyProjectManagerService(), ["v1", "v2"])
+    progress = []
+    task.signals.progress.connect(lambda done, total: progress.append((done, total)))
+    with qtbot.waitSignal(task.signals.finished) as blocker:
+        task.run()
+
+    assert blocker.args[0]["deleted_videos"] == 2
+    assert progress == [(2, 2)]
+
+
+def test_open_all_youtube_links_skips_duplicates_and_invalid_urls(monkeypatch):
+    from yt_database.gui.widgets import database_table_view_widget as module
+
+    opened = []
+    monkeypatch.setattr(module.QDesktopServices, "openUrl", lambda url: opened.append(url.toString()))
+    rows = [
+        module.SelectionRow("v1", True, "https://youtu.be/v1"),
+        module.SelectionRow("v1", True, "https://youtu.be/v1"),
+        module.SelectionRow("v2", False, ""),
+        module.SelectionRow("v3", False, "httpx://kaputt"),
+        module.SelectionRow("v4", False, "http://youtu.be/v4"),
+    ]
+
+    module.DatabaseOverviewWidget._open_all_youtube_links(None, rows)
+
+    assert opened == ["https://youtu.be/v1", "http://youtu.be/v4"]
+
+
+def test_transcripts_of_stale_refresh_are_ignored(qtbot):
+    from types import SimpleNamespace
+
+    from yt_database.gui.widgets.database_table_view_widget import DatabaseOverviewWidget
+
+    populated = []
+    widget = SimpleNamespace(
+        _fetch_generation=2,
+        _adjust_column_sizes=lambda: None,
+        _create_enriched_video_with_batch_info=lambda transcript: transcript,
+        _populate_table_with_videos=populated.append,
+        progress_bar=SimpleNamespace(setVisible=lambda visible: None),
+    )
+    rows = [{"video_id": "neu"}]
+
+    # Ein zuvor gestarteter, später fertiger Ladevorgang darf die Tabelle nicht überschreiben
+    DatabaseOverviewWidget._on_transcripts_fetched(widget, 1, [{"video_id": "alt"}])
+    assert populated == []
+
+    DatabaseOverviewWidget._on_transcripts_fetched(widget, 2, rows)
+    assert populated == [rows]
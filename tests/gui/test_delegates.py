@@ -0,0 +1,99 @@
+"""
+Tests für RichTextHighlightDelegate
+"""
+
+
+def test_build_highlighted_html_marks_all_terms(qtbot):
+    from yt_database.gui.widgets.delegates import RichTextHighlightDelegate
+
+    terms = ["welt", "hallo welt", "<b>"]
+    delegate = RichTextHighlightDelegate(lambda: terms)
+
+    result = delegate._build_highlighted_html("Hallo Welt, schöne Welt <b>")
+
+    assert result.count("<span") == 3
+    assert '<span class="hl">Hallo Welt</span>' in result
+    assert ">Welt</span>" in result
+    assert ">&lt;b&gt;</span>" in result
+
+
+def test_build_highlighted_html_without_terms_only_escapes(qtbot):
+    from yt_database.gui.widgets.delegates import RichTextHighlightDelegate
+
+    delegate = RichTextHighlightDelegate(lambda: [])
+
+    assert delegate._build_highlighted_html("a < b") == "a &lt; b"
+
+
+def test_document_cache_reuses_layout_until_terms_change(qtbot):
+    from yt_database.gui.widgets.delegates import RichTextHighlightDelegate
+
+    terms = ["welt"]
+    delegate = RichTextHighlightDelegate(lambda: terms)
+
+    doc = delegate._get_document("Hallo Welt", 100)
+    assert delegate._get_document("Hallo Welt", 100) is doc
+    assert delegate._get_document("Hallo Welt", 120) is not doc
+
+    terms.append("hallo")
+    assert delegate._get_document("Hallo Welt", 100) is not doc
+    assert len(delegate._doc_cache) == 1
+
+
+def test_paint_runs_draws_single_line_without_document(qtbot):
+    from PySide6.QtCore import QRect
+    from PySide6.QtGui import QPainter, QPixmap
+    from PySide6.QtWidgets import QStyleOptionViewItem
+
+    from yt_database.gui.widgets.delegates import RichTextHighlightDelegate
+
+    delegate = RichTextHighlightDelegate(lambda: ["welt"])
+    delegate._update_terms()
+    pixmap = QPixmap(400, 20)
+    painter = QPainter(pixmap)
+    option = QStyleOptionViewItem()
+    try:
+        assert delegate._paint_runs(painter, option, "Hallo Welt", QRect(0, 0, 400, 20))
+        # Zu schmal oder mehrzeilig: Rückfall auf QTextDocument
+        assert not delegate._paint_runs(painter, option, "Hallo Welt", QRect(0, 0, 5, 20))
+        assert not delegate._paint_runs(painter, option, "Hallo\nWelt", QRect(0, 0, 400, 20))
+    finally:
+        painter.end()
+    assert not delegate._doc_cache
+
+
+def test_selected_rows_use_highlighted_text_color(qtbot):
+    from PySide6.QtGui import QColor, QPalette
+    from PySide6.QtWidgets import QStyle, QStyleOptionViewItem
+
+    from yt_database.gui.widgets.delegates import RichTextHighlightDelegate
+
+    option = QStyleOptionViewItem()
+    option.palette.setColor(QPalette.ColorRole.Text, QColor("black"))
+    option.palette.setColor(QPalette.ColorRole.HighlightedText, QColor("white"))
+
+    assert RichTextHighlightDelegate._text_color(option) == QColor("black")
+    option.state |= QStyle.StateFlag.State_Selected
+    assert RichTextHighlightDelegate._text_color(option) == QColor("white")
+
+
+def test_terms_signal_replaces_provider_polling(qtbot):
+    from PySide6.QtCore import QObject, Signal
+
+    from yt_database.gui.widgets.delegates import RichTextHighlightDelegate
+
+    class _Owner(QObject):
+        terms_changed = Signal(list)
+
+    owner = _Owner()
+    delegate = RichTextHighlightDelegate(terms_signal=owner.terms_changed)
+    assert delegate._update_terms() == ()
+
+    owner.terms_changed.emit(["welt"])
+    doc = delegate._get_document("Hallo Welt", 100)
+    assert delegate._pattern_cache == ("welt",)
+    assert delegate._get_document("Hallo Welt", 100) is doc
+
+    owner.terms_changed.emit([])
+    assert delegate._update_terms() == ()
+    assert not delegate._doc_cache
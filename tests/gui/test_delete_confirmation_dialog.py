@@ -0,0 +1,21 @@
+"""
+Tests für DeleteConfirmationDialog
+"""
+
+
+def test_set_preview_data_reuses_dialog(qtbot):
+    from yt_database.gui.widgets.delete_confirmation_dialog import DeleteConfirmationDialog
+
+    dialog = DeleteConfirmationDialog("Video", {"success": True, "title": "Erstes", "videos_affected": 1})
+    qtbot.addWidget(dialog)
+    dialog.confirm_checkbox.setChecked(True)
+    assert dialog.ok_button.isEnabled()
+
+    dialog.set_preview_data("Kanal", {"success": True, "title": "Zweites", "videos_affected": 3})
+    assert dialog.windowTitle().startswith("Kanal löschen")
+    assert not dialog.confirm_checkbox.isChecked()
+    assert not dialog.ok_button.isEnabled()
+
+    dialog.set_preview_data("Video", {"success": False, "error": "nicht gefunden"})
+    assert dialog.ok_button.isHidden()
+    assert dialog.confirm_checkbox.isHidden()
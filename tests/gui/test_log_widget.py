@@ -0,0 +1,18 @@
+"""
+Tests für LogWidget
+"""
+
+
+def test_append_log_and_batch_render_same_lines(qtbot):
+    from yt_database.gui.widgets.log_widget import LogWidget
+
+    widget = LogWidget()
+    qtbot.addWidget(widget)
+    line = "12:00:00 | INFO | modul:1 | Nachricht"
+
+    widget.append_log(line)
+    widget.append_log_batch([(line, "INFO"), ("ohne Trenner", "ERROR")])
+
+    lines = widget.log_text.toPlainText().splitlines()
+    assert lines[0] == lines[1] == "12:00:00 | INFO | modul:1 | Nachricht"
+    assert lines[2] == " | ERROR |  | ohne Trenner"
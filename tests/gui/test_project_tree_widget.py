@@ -7,3 +7,26 @@ def test_projects_tree_view_widget_import():
     from yt_database.gui.widgets.projects_tree_view_widget import ProjectTreeWidget
 
     assert ProjectTreeWidget is not None
+
+
+def test_project_tree_widget_roots_view_at_root_path(qtbot, tmp_path):
+    from yt_database.gui.widgets.projects_tree_view_widget import ProjectTreeWidget
+
+    widget = ProjectTreeWidget(str(tmp_path))
+    qtbot.addWidget(widget)
+
+    assert widget.model.isReadOnly()
+    assert widget.model.filePath(widget.tree.rootIndex()) == str(tmp_path)
+
+
+def test_on_search_matches_case_insensitively(qtbot, tmp_path):
+    from yt_database.gui.widgets.projects_tree_view_widget import ProjectTreeWidget
+
+    (tmp_path / "Kapitel_Transcript.md").write_text("x", encoding="utf-8")
+    widget = ProjectTreeWidget(str(tmp_path))
+    qtbot.addWidget(widget)
+    qtbot.waitUntil(lambda: widget.model.rowCount(widget.tree.rootIndex()) > 0)
+
+    widget.on_search("TRANSCRIPT")
+
+    assert widget.model.fileName(widget.tree.currentIndex()) == "Kapitel_Transcript.md"
@@ -0,0 +1,179 @@
+"""
+Tests für SearchStrategyInfoWindow und SearchInfoPanel
+"""
+
+from yt_database.models.search_strategy import SearchStrategy
+
+
+def test_info_window_builds_ui_on_first_show(qtbot):
+    from yt_database.gui.widgets.search_strategy_info_window import SearchStrategyInfoWindow
+
+    window = SearchStrategyInfoWindow()
+    qtbot.addWidget(window)
+    assert not hasattr(window, "query_display")
+
+    window.update_query_preview("israel politik", SearchStrategy.ALL_WORDS)
+    window.show()
+
+    qtbot.waitUntil(lambda: "israel* AND politik*" in window.query_display.text())
+    assert window.query_display.maximumHeight() == 120
+
+
+def test_info_panel_builds_ui_on_first_show(qtbot):
+    from yt_database.gui.widgets.search_info_panel import SearchInfoPanel
+
+    panel = SearchInfoPanel()
+    qtbot.addWidget(panel)
+    panel.update_query_preview("a bcde", SearchStrategy.FUZZY)
+    assert not hasattr(panel, "query_display")
+
+    panel.show()
+
+    qtbot.waitUntil(lambda: "a OR bcde*" in panel.query_display.text())
+    assert panel.query_display.maximumHeight() == 120
+
+
+def test_info_panel_skips_unchanged_preview(qtbot):
+    from yt_database.gui.widgets.search_info_panel import SearchInfoPanel
+
+    panel = SearchInfoPanel()
+    qtbot.addWidget(panel)
+    panel.show()
+    panel.update_query_preview("politik", SearchStrategy.ANY_WORD)
+    panel._flush_preview()
+    panel.query_display.setText("unverändert")
+
+    panel.update_query_preview("politik", SearchStrategy.ANY_WORD)
+    panel._flush_preview()
+
+    assert panel.query_display.text() == "unverändert"
+    panel._last_display_text = ""
+    panel._flush_preview()
+    assert "politik*" in panel.query_display.text()
+
+
+def test_info_window_lays_out_strategies_in_one_grid(qtbot):
+    from PySide6.QtWidgets import QGridLayout
+
+    from yt_database.gui.widgets.search_strategy_info_window import SearchStrategyInfoWindow
+    from yt_database.models.search_strategy import SEARCH_STRATEGIES
+
+    window = SearchStrategyInfoWindow()
+    qtbot.addWidget(window)
+    window.show()
+
+    cards_view = window.strategies_container
+    assert isinstance(cards_view.container_layout, QGridLayout)
+    assert cards_view.container_layout.count() == 5 * len(SEARCH_STRATEGIES)
+
+
+def test_strategy_buttons_emit_their_strategy(qtbot):
+    from yt_database.gui.widgets.search_info_panel import SearchInfoPanel
+    from yt_database.gui.widgets.search_strategy_info_window import SearchStrategyInfoWindow
+
+    window = SearchStrategyInfoWindow()
+    panel = SearchInfoPanel()
+    qtbot.addWidget(window)
+    qtbot.addWidget(panel)
+    window.show()
+    panel.show()
+
+    for owner, strategy in ((window, SearchStrategy.FUZZY), (panel, SearchStrategy.ANY_WORD)):
+        cards_view = owner.strategies_container if owner is window else owner.strategies_widget
+        button = next(b for b, s in cards_view._button_strategies.items() if s == strategy)
+        with qtbot.waitSignal(owner.strategy_selected) as blocker:
+            button.click()
+        assert blocker.args == [strategy]
+
+
+def test_cards_view_wraps_only_labels_that_overflow(qtbot):
+    from yt_database.gui.widgets.search_info_panel import SearchInfoPanel
+
+    panel = SearchInfoPanel()
+    qtbot.addWidget(panel)
+    panel.resize(4000, 600)
+    panel.show()
+    cards = panel.strategies_widget.strategy_cards
+    labels = [label for _, _, description, _, example in cards for label in (description, example)]
+    assert not any(label.wordWrap() for label in labels)
+
+    panel.resize(200, 600)
+    qtbot.waitUntil(lambda: all(label.wordWrap() for label in labels))
+
+
+def test_cards_view_reenables_updates_after_build(qtbot):
+    from yt_database.gui.widgets.search_strategy_cards_view import SearchStrategyCardsView
+
+    view = SearchStrategyCardsView()
+    qtbot.addWidget(view)
+
+    assert view.updatesEnabled()
+    assert not view.signalsBlocked()
+
+
+def test_cards_view_marks_example_labels_with_role(qtbot):
+    from PySide6.QtWidgets import QFrame
+
+    from yt_database.gui.widgets.search_strategy_cards_view import SearchStrategyCardsView
+
+    view = SearchStrategyCardsView()
+    qtbot.addWidget(view)
+
+    _, _, _, example_label, example_text = view.strategy_cards[0]
+    assert example_label.property("role") == "example_label"
+    assert example_text.property("role") == "example_text"
+    assert example_text.parentWidget() is view
+    assert not view.findChildren(QFrame, "example_frame")
+
+
+def test_info_window_ignores_unchanged_query(qtbot):
+    from yt_database.gui.widgets.search_strategy_info_window import SearchStrategyInfoWindow
+
+    window = SearchStrategyInfoWindow()
+    qtbot.addWidget(window)
+    window.show()
+    window.update_query_preview("politik", SearchStrategy.ANY_WORD)
+    window._update_timer.stop()
+    window._perform_query_update()
+    window.query_display.setText("unverändert")
+
+    window.update_query_preview("politik", SearchStrategy.ANY_WORD)
+    assert not window._update_timer.isActive()
+
+    window._perform_query_update()
+    assert window.query_display.text() == "unverändert"
+
+
+def test_info_window_is_not_always_on_top(qtbot):
+    from PySide6.QtCore import Qt
+
+    from yt_database.gui.widgets.search_strategy_info_window import SearchStrategyInfoWindow
+
+    window = SearchStrategyInfoWindow()
+    qtbot.addWidget(window)
+
+    assert not window.windowFlags() & Qt.WindowType.WindowStaysOnTopHint
+
+
+def test_setup_layouts_reuses_existing_main_layout(qtbot):
+    from yt_database.gui.widgets.search_info_panel import SearchInfoPanel
+    from yt_database.gui.widgets.search_strategy_info_window import SearchStrategyInfoWindow
+
+    window = SearchStrategyInfoWindow()
+    panel = SearchInfoPanel()
+    qtbot.addWidget(window)
+    qtbot.addWidget(panel)
+    window.show()
+    panel.show()
+
+    for widget in (window, panel):
+        layout = widget.layout()
+        count = layout.count()
+        widget._setup_layouts()
+        assert widget.layout() is layout
+        assert layout.count() == count
+
+    sub_layouts = (window.header_layout, window.preview_layout, window.strategies_layout, window.footer_layout)
+    counts = [layout.count() for layout in sub_layouts]
+    window._setup_layouts()
+    assert [layout.count() for layout in sub_layouts] == counts
@@ -0,0 +1,181 @@
+"""
+Tests für das SearchWidget mit der Zeitstempel-Tabelle (ChapterTableModel).
+"""
+
+import pytest
+from PySide6.QtCore import Qt
+
+from yt_database.gui.widgets.search_widget_table import ChapterTableModel, SearchWidget
+
+
+@pytest.fixture
+def search_widget(qtbot):
+    """Fixture für ein SearchWidget."""
+    widget = SearchWidget()
+    qtbot.addWidget(widget)
+    return widget
+
+
+@pytest.fixture
+def chapters():
+    """Fixture für Kapitel eines Videos als (titel, start_sekunden)-Tupel."""
+    return [("Einleitung", 0), ("Politik heute", 3725), ("Abschluss", 95)]
+
+
+def test_chapter_table_model_provides_cells_on_demand(qtbot, chapters):
+    model = ChapterTableModel()
+    model.set_rows(chapters, "abc123")
+
+    assert model.rowCount() == 3
+    assert model.columnCount() == 3
+    assert model.headerData(1, Qt.Orientation.Horizontal) == "Zeitstempel"
+    assert model.index(1, 0).data() == "Politik heute"
+    assert model.index(1, 1).data() == "01:02:05"
+    assert model.index(2, 1).data() == "01:35"
+    assert model.index(1, 2).data() == "https://youtube.com/watch?v=abc123&t=3725s"
+    assert model.index(1, 1).data(Qt.ItemDataRole.UserRole) == "https://youtube.com/watch?v=abc123&t=3725s"
+    assert model.index(0, 0).data(Qt.ItemDataRole.DecorationRole) is None
+    assert model.flags(model.index(2, 2)) == Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    from PySide6.QtGui import QIcon
+
+    icons = (QIcon(), QIcon(), QIcon())
+    model.set_column_icons(icons)
+    assert isinstance(model.index(0, 2).data(Qt.ItemDataRole.DecorationRole), QIcon)
+
+    from yt_database.gui.widgets.delegates import MULTIPLE_ROLES_ROLE
+
+    roles = model.index(1, 0).data(MULTIPLE_ROLES_ROLE)
+    assert roles[Qt.ItemDataRole.DisplayRole] == "Politik heute"
+    assert roles[Qt.ItemDataRole.DecorationRole] is icons[0]
+
+    model.set_search_terms(["politik"])
+    assert model.index(1, 0).data(Qt.ItemDataRole.ToolTipRole) == "Suchbegriff gefunden: Politik heute"
+    assert model.index(0, 0).data(Qt.ItemDataRole.ToolTipRole) is None
+
+
+def test_set_search_terms_only_updates_title_column(qtbot, chapters):
+    model = ChapterTableModel()
+    model.set_rows(chapters, "abc123")
+    emitted = []
+    model.dataChanged.connect(lambda tl, br, roles: emitted.append((tl.row(), tl.column(), br.row(), br.column())))
+
+    model.set_search_terms(["politik"])
+
+    assert emitted == [(0, 0, 2, 0)]
+
+
+def test_results_table_uses_fixed_row_height(search_widget, chapters):
+    from PySide6.QtWidgets import QHeaderView
+
+    search_widget.results_model.set_rows(chapters, "abc123")
+    vertical_header = search_widget.results_table.verticalHeader()
+
+    assert vertical_header.sectionResizeMode(0) == QHeaderView.ResizeMode.Fixed
+    assert {search_widget.results_table.rowHeight(r) for r in range(3)} == {vertical_header.defaultSectionSize()}
+
+
+def test_results_proxy_sorts_timestamps_numerically(search_widget, chapters):
+    search_widget.results_model.set_rows(chapters, "abc123")
+    proxy = search_widget.results_table.model()
+
+    assert [proxy.index(r, 1).data() for r in range(3)] == ["00:00", "01:35", "01:02:05"]
+
+    search_widget.results_table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+    assert [proxy.index(r, 0).data() for r in range(3)] == ["Abschluss", "Einleitung", "Politik heute"]
+    assert proxy.index(0, 0).data(Qt.ItemDataRole.UserRole) == "https://youtube.com/watch?v=abc123&t=95s"
+
+
+def test_tree_click_reads_video_id_from_item_role(qtbot, search_widget, monkeypatch):
+    from yt_database.gui.widgets.search_widget_tree import VIDEO_ID_ROLE
+    from yt_database.models.search_models import SearchResult
+
+    result = SearchResult(
+        video_title="Video",
+        channel_name="Kanal",
+        channel_handle="@kanal",
+        chapter_title="Kapitel",
+        timestamp_url="https://www.youtube.com/watch?v=vid42&t=10s",
+        start_time_str="00:10",
+        video_id="vid42",
+    )
+    search_widget.tree_widget.display_results([result])
+    loaded = []
+    monkeypatch.setattr(search_widget, "_load_all_timestamps_for_video", loaded.append)
+
+    model = search_widget.tree_widget.results_model
+    video_index = model.index(0, 0)
+    chapter_index = model.index(0, 2, video_index)
+    assert video_index.data(VIDEO_ID_ROLE) == "vid42"
+
+    search_widget._on_tree_item_clicked(video_index.siblingAtColumn(1))
+    search_widget._on_tree_item_clicked(chapter_index)
+
+    # Beide Klicks werden durch die Entprellung zu einem Ladevorgang zusammengefasst
+    qtbot.waitUntil(lambda: loaded == ["vid42"])
+    qtbot.wait(100)
+    assert loaded == ["vid42"]
+
+
+def test_stale_chapter_results_are_ignored(search_widget, chapters):
+    search_widget._requested_video_id = "neu"
+
+    search_widget._on_chapters_loaded("alt", chapters)
+    assert search_widget.results_model.rowCount() == 0
+
+    search_widget._on_chapters_loaded("neu", chapters)
+    assert search_widget.results_model.rowCount() == 3
+    assert search_widget.results_table.model().index(0, 1).data() == "00:00"
+
+    # Neue Suchergebnisse verwerfen noch ausstehende Klicks und Ladevorgänge
+    search_widget._queue_timestamps_load("neu")
+    search_widget.display_results([])
+    assert not search_widget._click_debounce.isActive()
+    search_widget._on_chapters_loaded("neu", chapters)
+    assert search_widget.results_model.rowCount() == 0
+
+
+def test_double_click_opens_url_from_user_role(search_widget, chapters, monkeypatch):
+    from yt_database.gui.widgets import search_widget_table
+
+    opened = []
+    monkeypatch.setattr(search_widget_table.QDesktopServices, "openUrl", lambda url: opened.append(url.toString()))
+    search_widget.results_model.set_rows(chapters, "abc123")
+    proxy = search_widget.results_table.model()
+
+    # Jede Spalte der Zeile liefert dieselbe URL aus dem Model
+    search_widget._on_result_double_clicked(proxy.index(2, 1))
+
+    assert opened == ["https://youtube.com/watch?v=abc123&t=3725s"]
+
+
+def test_cached_search_updates_terms_without_backend_request(search_widget):
+    from yt_database.models.search_models import SearchResult
+
+    result = SearchResult(
+        video_title="Video",
+        channel_name="Kanal",
+        channel_handle="@kanal",
+        chapter_title="Wirtschaft und Politik",
+        timestamp_url="https://www.youtube.com/watch?v=vid42&t=10s",
+        start_time_str="00:10",
+        video_id="vid42",
+    )
+    requests = []
+    search_widget.search_requested.connect(requests.append)
+    tree = search_widget.tree_widget
+
+    for query in ("wirtschaft", "politik"):
+        tree.search_input.setText(query)
+        tree.search_button.click()
+        search_widget.display_results([result])
+    search_widget.results_model.set_rows([("Einleitung", 0)], "vid42")
+
+    # Treffer aus dem Cache laufen über denselben Weg wie Backend-Ergebnisse
+    tree.search_input.setText("wirtschaft")
+    tree.search_button.click()
+
+    assert requests == ["wirtschaft", "politik"]
+    assert search_widget._current_search_terms == ["wirtschaft"]
+    assert search_widget.results_model.rowCount() == 0
+    assert tree.results_model.rowCount() == 1
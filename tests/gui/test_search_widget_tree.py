@@ -6,7 +6,7 @@ import pytest
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 
-from yt_database.gui.widgets.search_widget_tree import SearchWidgetTree
+from yt_database.gui.widgets.search_widget_tree import NON_EDIT_FLAGS, SearchWidgetTree, _snippet_to_plain_text
 from yt_database.models.search_models import SearchResult
 
 
@@ -62,6 +62,12 @@ def sample_search_results():
     ]
 
 
+def _type(widget, text):
+    """Setzt den Suchtext und wertet ihn ohne Abwarten der Entprellung aus."""
+    widget.search_input.setText(text)
+    widget._apply_pending_query()
+
+
 class TestSearchWidgetTree:
     """Tests für das SearchWidgetTree Widget."""
 
@@ -103,37 +109,74 @@ class TestSearchWidgetTree:
         assert model.rowCount() == 2
 
         # Nach BM25-Sortierung: Erstes Video (höchste Relevanz) sollte 1 Kapitel haben
-        video_item = model.item(0, 0)
-        assert video_item.rowCount() == 1
+        assert model.rowCount(model.index(0, 0)) == 1
 
         # Zweites Video sollte 2 Kapitel haben
-        video_item = model.item(1, 0)
-        assert video_item.rowCount() == 2
+        assert model.rowCount(model.index(1, 0)) == 2
 
     def test_video_items_have_no_links(self, search_widget_tree, sample_search_results):
         """Test, dass Video-Items keine Links haben."""
         search_widget_tree.display_results(sample_search_results)
 
         model = search_widget_tree.results_model
-        video_item = model.item(0, 0)
+        video_index = model.index(0, 0)
 
         # Video-Item sollte keinen Link haben
-        assert video_item.data(Qt.ItemDataRole.UserRole) is None
+        assert video_index.data(Qt.ItemDataRole.UserRole) is None
 
     def test_chapter_items_have_links(self, search_widget_tree, sample_search_results):
         """Test, dass Kapitel-Items Links haben."""
         search_widget_tree.display_results(sample_search_results)
 
         model = search_widget_tree.results_model
-        video_item = model.item(0, 0)
-        chapter_item = video_item.child(0, 0)
+        chapter_index = model.index(0, 0, model.index(0, 0))
 
         # Kapitel-Item sollte einen Link haben (ein beliebiger aus den Beispieldaten)
-        link = chapter_item.data(Qt.ItemDataRole.UserRole)
+        link = chapter_index.data(Qt.ItemDataRole.UserRole)
         assert link is not None
         assert "https://youtu.be/example" in link
         assert "?t=" in link
 
+    def test_enter_key_starts_search_once(self, search_widget_tree):
+        """Test, dass Enter die Suche genau einmal auslöst (keine doppelten Verbindungen)."""
+        emitted = []
+        search_widget_tree.search_requested.connect(lambda *args: emitted.append(args))
+
+        search_widget_tree.search_input.setText("test keyword")
+        search_widget_tree.search_input.returnPressed.emit()
+
+        assert len(emitted) == 1
+
+    def test_header_labels_survive_new_search(self, search_widget_tree, sample_search_results):
+        """Test, dass die Header-Labels nach mehreren Suchen erhalten bleiben."""
+        search_widget_tree.display_results(sample_search_results)
+        search_widget_tree.display_results([])
+        search_widget_tree.display_results(sample_search_results)
+
+        model = search_widget_tree.results_model
+        labels = [model.headerData(col, Qt.Orientation.Horizontal) for col in range(model.columnCount())]
+        assert labels == ["Video / Kapitel", "Kanal", "Zeitstempel"]
+
+    def test_result_cells_are_not_editable(self, search_widget_tree, sample_search_results):
+        """Test, dass alle Ergebniszellen nur auswählbar und nicht editierbar sind."""
+        search_widget_tree.display_results(sample_search_results)
+
+        model = search_widget_tree.results_model
+        video_index = model.index(0, 0)
+        for index in (video_index, model.index(0, 1), model.index(0, 0, video_index), model.index(0, 2, video_index)):
+            assert model.flags(index) == NON_EDIT_FLAGS
+
+    def test_unchanged_search_terms_skip_refresh(self, search_widget_tree):
+        """Test, dass unveränderte Suchbegriffe kein erneutes terms_changed auslösen."""
+        emitted = []
+        search_widget_tree.terms_changed.connect(emitted.append)
+
+        search_widget_tree.set_search_terms(["python", "tutorial"])
+        search_widget_tree.set_search_terms(["tutorial", "python"])
+        search_widget_tree.set_search_terms(["python"])
+
+        assert emitted == [["python", "tutorial"], ["python"]]
+
     def test_search_button_click_emits_signal(self, search_widget_tree, qtbot):
         """Test, dass Klick auf Suchen-Button das Signal auslöst."""
         with qtbot.waitSignal(search_widget_tree.search_requested, timeout=1000) as blocker:
@@ -178,7 +221,174 @@ class TestSearchWidgetTree:
         search_widget_tree.display_results(many_results)
 
         # Tree sollte nicht automatisch expandiert sein
-        model = search_widget_tree.results_model
+        model = search_widget_tree.results_tree.model()
         for row in range(model.rowCount()):
             index = model.index(row, 0)
             assert not search_widget_tree.results_tree.isExpanded(index)
+
+    def test_header_sort_reorders_videos_with_their_chapters(self, search_widget_tree, sample_search_results):
+        """Test, dass ohne Header-Klick die Relevanz-Reihenfolge gilt und die Sortierung Kapitel mitnimmt."""
+        search_widget_tree.display_results(sample_search_results)
+        view_model = search_widget_tree.results_tree.model()
+        assert view_model.index(0, 0).data() == "Web Development with Django"
+
+        search_widget_tree.results_tree.sortByColumn(2, Qt.SortOrder.DescendingOrder)
+
+        python_video = view_model.index(0, 0)
+        assert python_video.data() == "Python Tutorial: Advanced Features"
+        assert view_model.rowCount(python_video) == 2
+        # Kapitel werden nach derselben Spalte sortiert (spätester Zeitstempel zuerst)
+        assert view_model.index(0, 0, python_video).data(Qt.ItemDataRole.UserRole) == "https://youtu.be/example1?t=450s"
+
+    def test_many_videos_shown_in_relevance_batches(self, search_widget_tree):
+        """Test, dass sehr viele Videos in Relevanz-Reihenfolge schrittweise angezeigt werden."""
+        batch_size = search_widget_tree.VIDEO_BATCH_SIZE
+        many_results = [
+            SearchResult(
+                video_title=f"Video {i}",
+                chapter_title="Kapitel",
+                timestamp_url=f"https://youtube.com/watch?v=test{i}&t=1s",
+                start_time_str="00:01",
+                channel_name="Test Channel",
+                channel_handle=None,
+                relevance_score=float(i),
+                highlighted_snippet=None,
+            )
+            for i in range(2 * batch_size + 10)
+        ]
+        search_widget_tree.display_results(many_results)
+
+        model = search_widget_tree.results_model
+        assert model.rowCount() == batch_size
+        assert len(search_widget_tree._deferred_videos) == batch_size + 10
+
+        # Ende der Liste erreicht: nächste Videos werden angehängt, bis keine mehr zurückgestellt sind
+        scroll_bar = search_widget_tree.results_tree.verticalScrollBar()
+        while search_widget_tree._deferred_videos:
+            scroll_bar.valueChanged.emit(scroll_bar.maximum())
+
+        titles = [model.index(row, 0).data() for row in range(model.rowCount())]
+        assert titles == [f"Video {i}" for i in reversed(range(2 * batch_size + 10))]
+
+    def test_completer_corpus_suggests_prefix_matches(self, search_widget_tree):
+        """Test, dass Vorschläge aus dem Präfix-Trie kommen und nur ohne Treffer der Provider gefragt wird."""
+        provider_calls = []
+        search_widget_tree.set_completer_provider(lambda text: provider_calls.append(text) or ["fallback"])
+        search_widget_tree.set_completer_corpus(["Polizei", "Wirtschaft", "politisch", "Politik"])
+
+        # Vorschläge in der Reihenfolge des Korpus (Beliebtheit), nicht nach Länge
+        _type(search_widget_tree, "poli")
+        assert search_widget_tree._completer_model.stringList() == ["Polizei", "politisch", "Politik"]
+        assert provider_calls == []
+
+        _type(search_widget_tree, "xyz")
+        assert search_widget_tree._completer_model.stringList() == ["fallback"]
+        assert provider_calls == ["xyz"]
+
+    def test_completer_provider_reuses_completer(self, search_widget_tree):
+        """Test, dass ein erneuter Provider-Wechsel den Completer wiederverwendet."""
+        search_widget_tree.set_completer_provider(lambda text: ["alt"])
+        completer = search_widget_tree._completer
+        search_widget_tree._completer_model.setStringList(["alt"])
+
+        search_widget_tree.set_completer_provider(lambda text: ["neu"])
+
+        assert search_widget_tree._completer is completer
+        assert search_widget_tree.search_input.completer() is completer
+        assert search_widget_tree._completer_model.stringList() == []
+
+    def test_completer_trie_descent_continues_from_last_node(self, search_widget_tree, monkeypatch):
+        """Test, dass beim Weitertippen nur die neuen Zeichen ab dem letzten Trie-Knoten abgestiegen werden."""
+        search_widget_tree.set_completer_corpus(["Politik", "Polizei"])
+        trie = search_widget_tree._suggest_trie
+        descents = []
+        original_descend = trie.descend
+
+        def recording_descend(prefix, node=None):
+            descents.append((prefix, node is None))
+            return original_descend(prefix, node)
+
+        monkeypatch.setattr(trie, "descend", recording_descend)
+
+        _type(search_widget_tree, "po")
+        _type(search_widget_tree, "pol")
+        _type(search_widget_tree, "polit")
+        _type(search_widget_tree, "x")
+
+        assert descents == [("po", True), ("l", False), ("it", False), ("x", True)]
+        assert search_widget_tree._completer_model.stringList() == []
+
+    def test_query_changes_are_debounced(self, search_widget_tree, qtbot):
+        """Test, dass schnelle Eingaben erst nach der Tipp-Pause einmal ausgewertet werden."""
+        applied = []
+        search_widget_tree.terms_changed.connect(applied.append)
+
+        for text in ("p", "po", "pol"):
+            search_widget_tree.search_input.setText(text)
+        assert applied == []
+
+        qtbot.waitUntil(lambda: applied == [["pol"]])
+
+    def test_refresh_highlighting_does_not_emit_data_changed(self, search_widget_tree, sample_search_results):
+        """Test, dass neue Suchbegriffe nur den Viewport neu zeichnen und kein dataChanged auslösen."""
+        search_widget_tree.display_results(sample_search_results)
+        emitted = []
+        search_widget_tree.results_model.dataChanged.connect(lambda *args: emitted.append(args))
+
+        search_widget_tree.set_search_terms(["python"])
+
+        assert emitted == []
+
+    def test_display_results_uses_best_relevance_and_plain_snippets(self, search_widget_tree, sample_search_results):
+        """Test, dass Videos die beste Kapitel-Relevanz zeigen und Snippets ohne HTML angezeigt werden."""
+        search_widget_tree.display_results(sample_search_results)
+
+        model = search_widget_tree.results_model
+        python_video = model.index(1, 0)
+        assert python_video.data(Qt.ItemDataRole.ToolTipRole) == "Beste Relevanz: 2.50"
+        assert model.index(0, 0, python_video).data() == "List Comprehensions und Generators"
+        assert _snippet_to_plain_text("<mark>A</mark> &amp; B") == "A & B"
+
+    def test_display_results_replaces_rows_in_one_reset(self, search_widget_tree, sample_search_results):
+        """Test, dass alle Video-Zeilen mit einem einzigen Model-Reset übernommen werden."""
+        model = search_widget_tree.results_model
+        events = []
+        model.modelReset.connect(lambda: events.append("reset"))
+        model.rowsInserted.connect(lambda *args: events.append("inserted"))
+
+        search_widget_tree.display_results(sample_search_results)
+
+        assert events == ["reset"]
+        assert model.index(0, 1).data() == "Django Tutorials (@djangotutorials)"
+        assert model.index(1, 2).data() == "2 Treffer"
+        assert search_widget_tree.results_tree.updatesEnabled()
+
+    def test_repeated_search_uses_result_cache(self, search_widget_tree, sample_search_results):
+        """Test, dass die Ergebnisse einer Suche unabhängig von Groß-/Kleinschreibung zwischengespeichert werden."""
+        strategy = search_widget_tree._get_selected_strategy()
+        search_widget_tree.search_input.setText("Python")
+        search_widget_tree.search_button.click()
+        search_widget_tree.display_results(sample_search_results)
+
+        assert search_widget_tree.cached_results("python", strategy) == sample_search_results
+
+        search_widget_tree.invalidate_cache()
+        assert search_widget_tree.cached_results("python", strategy) is None
+
+    def test_chapter_rows_leave_channel_cell_empty_but_open_link(
+        self, search_widget_tree, sample_search_results, monkeypatch
+    ):
+        """Test, dass Kapitelzeilen ohne Kanal-Item auskommen und der Doppelklick trotzdem den Link öffnet."""
+        from yt_database.gui.widgets import search_widget_tree as module
+
+        opened = []
+        monkeypatch.setattr(module.QDesktopServices, "openUrl", lambda url: opened.append(url.toString()))
+        search_widget_tree.display_results(sample_search_results)
+
+        model = search_widget_tree.results_model
+        video_index = model.index(0, 0)
+        assert model.columnCount(video_index) == 3
+        assert model.index(0, 1, video_index).data() is None
+
+        search_widget_tree._on_result_double_clicked(model.index(0, 1, video_index))
+        assert opened == ["https://youtu.be/example2?t=350s"]
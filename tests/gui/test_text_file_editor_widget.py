@@ -0,0 +1,118 @@
+"""
+Tests für TextFileEditorWidget
+"""
+
+import pytest
+
+
+def test_stream_file_loads_content_in_chunks(qtbot, tmp_path):
+    from yt_database.gui.widgets.text_file_editor_widget import TextFileEditorWidget
+
+    content = "Zeile mit Ümlaut\n" * 1000
+    file_path = tmp_path / "transcript.md"
+    file_path.write_text(content, encoding="utf-8")
+
+    editor = TextFileEditorWidget()
+    qtbot.addWidget(editor)
+    editor.READ_CHUNK_SIZE = 100
+    editor.stream_file(str(file_path))
+
+    assert editor.text_edit.toPlainText() == content
+    assert not editor.text_edit.document().isUndoAvailable()
+
+
+def test_stream_file_raises_for_missing_file(qtbot, tmp_path):
+    from yt_database.gui.widgets.text_file_editor_widget import TextFileEditorWidget
+
+    editor = TextFileEditorWidget()
+    qtbot.addWidget(editor)
+
+    with pytest.raises(OSError):
+        editor.stream_file(str(tmp_path / "fehlt.md"))
+
+
+def test_stream_file_rejects_invalid_utf8_without_setting_path(qtbot, tmp_path, monkeypatch):
+    from yt_database.gui.widgets import text_file_editor_widget as module
+
+    monkeypatch.setattr(module.QMessageBox, "warning", lambda *args: None)
+    original = "Zeile\n".encode("utf-8") * 100 + b"\xff kaputt"
+    file_path = tmp_path / "transcript.md"
+    file_path.write_bytes(original)
+
+    editor = module.TextFileEditorWidget()
+    qtbot.addWidget(editor)
+    editor.READ_CHUNK_SIZE = 16
+    with pytest.raises(UnicodeDecodeError):
+        editor.stream_file(str(file_path))
+
+    assert editor.text_edit.toPlainText() == ""
+    editor._on_save_clicked()
+    assert file_path.read_bytes() == original
+
+
+def test_load_file_async_fills_editor_in_background(qtbot, tmp_path):
+    from yt_database.gui.widgets.text_file_editor_widget import TextFileEditorWidget
+
+    content = "Kapitel 1\n" * 500
+    file_path = tmp_path / "transcript.md"
+    file_path.write_text(content, encoding="utf-8")
+
+    editor = TextFileEditorWidget()
+    qtbot.addWidget(editor)
+    editor.READ_CHUNK_SIZE = 100
+    editor.load_file_async(str(file_path))
+    assert editor.text_edit.isReadOnly()
+
+    assert not editor.save_button.isEnabled()
+
+    qtbot.waitUntil(lambda: not editor.text_edit.isReadOnly())
+    assert editor.text_edit.toPlainText() == content
+    assert editor.save_button.isEnabled()
+
+
+def test_load_file_async_ignores_chunks_of_replaced_load(qtbot, tmp_path):
+    from yt_database.gui.widgets.text_file_editor_widget import TextFileEditorWidget
+
+    first_path = tmp_path / "erste.md"
+    first_path.write_text("alt\n" * 5000, encoding="utf-8")
+    second_path = tmp_path / "zweite.md"
+    second_path.write_text("neu\n" * 50, encoding="utf-8")
+
+    editor = TextFileEditorWidget()
+    qtbot.addWidget(editor)
+    editor.READ_CHUNK_SIZE = 16
+    editor.load_file_async(str(first_path))
+    stale_generation = editor._load_generation
+    editor.load_file_async(str(second_path))
+
+    # Verspätete Signale des ersten Vorgangs ändern weder Inhalt noch Ladezustand
+    editor._on_file_chunk_read(stale_generation, "alt\n")
+    editor._on_file_load_finished(stale_generation, str(first_path))
+    assert editor.text_edit.isReadOnly()
+
+    qtbot.waitUntil(lambda: not editor.text_edit.isReadOnly())
+    qtbot.wait(50)
+    assert editor.text_edit.toPlainText() == "neu\n" * 50
+
+
+def test_load_file_async_error_never_overwrites_file(qtbot, tmp_path, monkeypatch):
+    from yt_database.gui.widgets import text_file_editor_widget as module
+
+    monkeypatch.setattr(module.QMessageBox, "warning", lambda *args: None)
+    original = "gültiger Anfang\n".encode("utf-8") * 100 + b"\xff kaputt"
+    file_path = tmp_path / "transcript.md"
+    file_path.write_bytes(original)
+
+    editor = module.TextFileEditorWidget()
+    qtbot.addWidget(editor)
+    editor.READ_CHUNK_SIZE = 16
+    editor.load_file_async(str(file_path))
+
+    qtbot.waitUntil(lambda: "Fehler" in editor.text_edit.placeholderText())
+    assert editor.text_edit.toPlainText() == ""
+    assert editor.text_edit.isReadOnly()
+    assert not editor.save_button.isEnabled()
+
+    # Selbst ein direkter Aufruf schreibt nichts, da kein Dateipfad gesetzt ist
+    editor._on_save_clicked()
+    assert file_path.read_bytes() == original
@@ -3,7 +3,7 @@ Tests für die SearchStrategy-Funktionalität.
 """
 
 import pytest
-from yt_database.models.search_strategy import SearchStrategy, SEARCH_STRATEGIES
+from yt_database.models.search_strategy import SearchStrategy, SEARCH_STRATEGIES, SEARCH_STRATEGIES_BY_KEY, build_fts_query
 
 
 def test_search_strategy_enum():
@@ -35,6 +35,23 @@ def test_all_strategies_have_info():
     assert strategy_values == enum_values, "SEARCH_STRATEGIES muss alle Enum-Werte enthalten"
 
 
+def test_search_strategies_by_key():
+    """Test dass das Lookup-Dict jede Strategie auf ihre Anzeigeinformationen abbildet."""
+    assert list(SEARCH_STRATEGIES_BY_KEY.values()) == SEARCH_STRATEGIES
+    assert SEARCH_STRATEGIES_BY_KEY[SearchStrategy.FUZZY].display_name == "Unscharf"
+
+
+def test_build_fts_query_preview():
+    """Test der gemeinsamen Query-Vorschau für Info-Fenster und Info-Panel."""
+    assert build_fts_query(" israel politik ", SearchStrategy.EXACT_PHRASE) == '"israel politik"'
+    assert build_fts_query("israel", SearchStrategy.ALL_WORDS) == "israel"
+    assert build_fts_query("israel politik", SearchStrategy.ANY_WORD) == "israel* OR politik*"
+    assert build_fts_query("an israel", SearchStrategy.FUZZY) == "an OR israel*"
+    assert build_fts_query("israel", SearchStrategy.AUTO) == "israel*"
+    assert build_fts_query("israel politik", SearchStrategy.AUTO) == '("israel politik") OR (israel* AND politik*)'
+    assert build_fts_query("israel politik", SearchStrategy.SEMANTIC) == "israel politik"
+
+
 class TestQueryBuilder:
     """Tests für die FTS5-Query-Builder-Logik."""
 
@@ -155,3 +155,20 @@ class TestDatabaseVideoLoaderWorker:
         # Verify error signal was emitted
         assert len(error_emitted) == 1
         assert "Database error" in error_emitted[0]
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            ("# Titel\n\n## Kapitel\n00:00 Intro\n", True),
+            ("---\nChapters: 3\n---\nText\n", True),
+            ("Nur Transkript-Text\n", False),
+            ("", False),
+        ],
+    )
+    def test_check_chapter_status_from_file(self, tmp_path, mock_project_manager_service, content, expected):
+        """Test: Kapitel-Markierungen werden in der Transkript-Datei erkannt."""
+        transcript_file = tmp_path / "video_transcript.md"
+        transcript_file.write_text(content, encoding="utf-8")
+        worker = DatabaseVideoLoaderWorker(project_manager_service=mock_project_manager_service)
+
+        assert worker._check_chapter_status_from_file(str(transcript_file)) is expected
@@ -42,3 +42,55 @@ def test_update_channel_index(service, monkeypatch):
     )
     service.update_channel_index("chanid", {"id": "chanid", "channel_name": "Test", "channel_url": "url"})
 
+
+def test_delete_videos_safe_deletes_in_one_batch(service, test_db, monkeypatch):
+    from yt_database.database import Channel, Chapter, Transcript
+
+    monkeypatch.setattr("yt_database.services.project_manager_service.db", test_db)
+    models = [Channel, Transcript, Chapter]
+    with test_db.bind_ctx(models):
+        test_db.create_tables(models)
+        try:
+            channel = Channel.create(channel_id="c1", name="Kanal", url="url", handle="@h")
+            for video_id in ("v1", "v2", "v3"):
+                video = Transcript.create(video_id=video_id, channel=channel, title=video_id, video_url=video_id)
+                Chapter.create(transcript=video, title="Intro", start_seconds=0, chapter_type="summary")
+
+            service.DELETE_BATCH_SIZE = 2
+            progress = []
+            result = service.delete_videos_safe(
+                ["v1", "v2", "v3", "fehlt"], lambda processed, total: progress.append((processed, total))
+            )
+
+            assert result["success"]
+            assert result["deleted_videos"] == 3
+            assert result["deleted_chapters"] == 3
+            assert result["errors"] == ["Video fehlt: nicht gefunden."]
+            assert Transcript.select().count() == 0
+            # Fortschritt nach jedem Block, aufsteigend bis zur Gesamtzahl
+            assert progress == [(2, 4), (4, 4)]
+        finally:
+            test_db.drop_tables(models)
+
+
+def test_get_batch_deletion_preview_counts_chapters_per_block(service, test_db, monkeypatch):
+    from yt_database.database import Channel, Chapter, Transcript
+
+    models = [Channel, Transcript, Chapter]
+    with test_db.bind_ctx(models):
+        test_db.create_tables(models)
+        try:
+            channel = Channel.create(channel_id="c1", name="Kanal", url="url", handle="@h")
+            for video_id, chapters in (("v1", 2), ("v2", 1), ("v3", 0)):
+                video = Transcript.create(video_id=video_id, channel=channel, title=video_id, video_url=video_id)
+                for index in range(chapters):
+                    Chapter.create(transcript=video, title=f"K{index}", start_seconds=index, chapter_type="summary")
+
+            service.DELETE_BATCH_SIZE = 2
+            preview = service.get_batch_deletion_preview(["v1", "v2", "v1", "v3"])
+
+            assert preview["success"]
+            assert preview["videos_affected"] == 3
+            assert preview["chapters_affected"] == 3
+        finally:
+            test_db.drop_tables(models)